@@ -13,6 +13,7 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 
 # Autodiscovery de tareas en todas las aplicaciones de Django
 app.autodiscover_tasks()
+app.autodiscover_tasks(['departamentos.importacion'])
 
 # Configuración adicional
 app.conf.update(
@@ -33,8 +34,11 @@ app.conf.update(
     result_serializer='json',
     
     # Configuración de routing
+    # Las rutas explícitas van antes del comodín: se aplica la primera que coincide
     task_routes={
+        'departamentos.tasks.actualizar_reportes_task': {'queue': 'reportes'},
         'departamentos.tasks.*': {'queue': 'emails'},
+        'departamentos.importacion.tasks.*': {'queue': 'importaciones'},
     },
     
     # Configuración de reintentos
@@ -47,6 +51,22 @@ app.conf.update(
             'task': 'departamentos.tasks.verificar_documentaciones_task',
             'schedule': 86400.0,  # Cada 24 horas
         },
+        'despachar-notificaciones': {
+            'task': 'departamentos.tasks.despachar_notificaciones_task',
+            'schedule': 300.0,  # Reintentos pendientes de la bandeja de salida
+        },
+        'limpiar-notificaciones-diario': {
+            'task': 'departamentos.tasks.limpiar_notificaciones_antiguas',
+            'schedule': 86400.0,  # Cada 24 horas
+        },
+        'actualizar-reportes': {
+            'task': 'departamentos.tasks.actualizar_reportes_task',
+            'schedule': 3600.0,  # Cada hora
+        },
+        'recalcular-contadores-notificaciones': {
+            'task': 'departamentos.tasks.recalcular_contadores_task',
+            'schedule': 86400.0,  # Corrige desvíos de escrituras masivas
+        },
     },
 )
 
@@ -188,6 +188,33 @@ REST_FRAMEWORK = {
     "DATE_FORMAT": "%d/%m/%Y",
 }
 
+# Conteo de resultados paginados (departamentos/apis/conteo.py)
+# Por encima de este umbral de filas estimadas se devuelve la estimación de PostgreSQL
+CONTEO_UMBRAL_EXACTO = int(os.environ.get("CONTEO_UMBRAL_EXACTO", 10000))
+# Segundos que se reutiliza un conteo exacto para los mismos filtros
+CONTEO_CACHE_TTL = int(os.environ.get("CONTEO_CACHE_TTL", 30))
+
+# Cache: memoria local por defecto; con CACHE_REDIS_URL (p. ej. redis://localhost:6379/1) se
+# comparte entre procesos, necesario para invalidar en todos los workers a la vez
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+            "KEY_PREFIX": "facet",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "facet",
+        }
+    }
+# Segundos que se guarda una respuesta de datos de referencia (departamentos/apis/cache.py)
+RESPUESTAS_CACHE_TTL = int(os.environ.get("RESPUESTAS_CACHE_TTL", 600))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=480),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
@@ -283,6 +310,13 @@ DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@facet.unt.edu
 EMAIL_USE_SSL = False  # Usar TLS en lugar de SSL
 SERVER_EMAIL = DEFAULT_FROM_EMAIL
 ADMINS = [('Admin', DEFAULT_FROM_EMAIL)]
+# Máximo de correos por segundo en los envíos por lote (0 = sin límite)
+EMAIL_ENVIOS_POR_SEGUNDO = float(os.environ.get("EMAIL_ENVIOS_POR_SEGUNDO", 5))
+
+# Retención de notificaciones: antigüedad máxima y archivo comprimido opcional antes de borrar
+NOTIFICACIONES_DIAS_RETENCION = int(os.environ.get("NOTIFICACIONES_DIAS_RETENCION", 180))
+NOTIFICACIONES_ARCHIVAR = os.environ.get("NOTIFICACIONES_ARCHIVAR", "false").lower() == "true"
+NOTIFICACIONES_DIR_ARCHIVO = os.environ.get("NOTIFICACIONES_DIR_ARCHIVO", os.path.join(BASE_DIR, "archivo", "notificaciones"))
 
 # 🚀 Configuración de Celery
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
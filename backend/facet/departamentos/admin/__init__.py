@@ -15,3 +15,5 @@ from .directorCarrera import DirectorCarreraAdmin
 from .tipoTitulo import TipoTituloAdmin
 from .notificacion import NotificacionAdmin
 
+from .importacionPersonal import ImportacionPersonalAdmin
+from .envioNotificacion import EnvioNotificacionAdmin
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from ..models import EnvioNotificacion
+
+@admin.register(EnvioNotificacion)
+class EnvioNotificacionAdmin(admin.ModelAdmin):
+    list_display = ('clave', 'email', 'situacion', 'intentos', 'proximo_intento', 'fecha_envio')
+    list_filter = ('situacion', 'tipo', 'fecha_creacion')
+    search_fields = ('clave', 'email')
+    ordering = ('-fecha_creacion',)
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from ..models import ImportacionPersonal
+
+@admin.register(ImportacionPersonal)
+class ImportacionPersonalAdmin(admin.ModelAdmin):
+    list_display = ('id', 'archivo', 'situacion', 'dry_run', 'total_filas', 'filas_invalidas', 'lotes_procesados', 'total_lotes', 'fecha_creacion', 'fecha_fin')
+    list_filter = ('situacion', 'dry_run', 'fecha_creacion')
+    ordering = ('-fecha_creacion',)
@@ -14,9 +14,6 @@ from .asignaturaDocente import AsignaturaDocenteViewSet
 from .directorCarrera import DirectorCarreraViewSet
 from .tipoTitulo import TipoTituloViewSet
 from .notificacion import NotificacionViewSet
-from rest_framework.pagination import PageNumberPagination
-
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+from .importacionPersonal import ImportacionPersonalViewSet
+from .reporte import ReporteViewSet
+from .vencimiento import VencimientoViewSet
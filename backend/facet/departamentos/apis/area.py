@@ -3,49 +3,29 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
 from rest_framework.filters import SearchFilter
-from rest_framework.pagination import PageNumberPagination
-from ..models import Area
+from ..models import Area, Departamento
 from ..serializers import AreaSerializer
+from .pagination import PageResultsSetPagination
+from .cache import CacheRespuestaViewSetMixin
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
-
-class AreaViewSet(viewsets.ModelViewSet):
+class AreaViewSet(ExportacionViewSetMixin, CacheRespuestaViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = Area.objects.select_related('departamento').filter(estado='1')  # Solo objetos activos por defecto
+    queryset = Area.objects.select_related('departamento')
     serializer_class = AreaSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = PageResultsSetPagination
+    modelos_relacionados = [Departamento]  # departamento_detalle
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = {
         'estado': ['exact'],       # Filtrar por estado exacto (0 o 1)
         'nombre': ['icontains'],   # Filtrar por nombre que contiene el valor especificado
     }
     search_fields = ['nombre']
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = Area.objects.select_related('departamento').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
-
+    nombre_exportacion = 'areas'
+    columnas_exportacion = [
+        ('Nombre', 'nombre'),
+        ('Departamento', 'departamento__nombre'),
+        ('Estado', 'estado', texto_estado),
+    ]
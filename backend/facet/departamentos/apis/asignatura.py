@@ -6,10 +6,13 @@ from rest_framework.filters import SearchFilter
 from ..models import Asignatura
 from ..serializers import AsignaturaSerializer
 from .pagination import StandardResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
 
-class AsignaturaViewSet(viewsets.ModelViewSet):
+class AsignaturaViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = Asignatura.objects.select_related('area', 'departamento').filter(estado='1')  # Solo objetos activos por defecto
+    queryset = Asignatura.objects.select_related('area', 'departamento')
     serializer_class = AsignaturaSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
@@ -22,28 +25,14 @@ class AsignaturaViewSet(viewsets.ModelViewSet):
         'programa': ['icontains'], # Filtrar por programa que contiene el valor especificado
     }
     search_fields = ['nombre', 'codigo', 'tipo', 'modulo', 'programa']
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = Asignatura.objects.select_related('area', 'departamento').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
\ No newline at end of file
+    nombre_exportacion = 'asignaturas'
+    columnas_exportacion = [
+        ('Código', 'codigo'),
+        ('Nombre', 'nombre'),
+        ('Módulo', 'modulo'),
+        ('Programa', 'programa'),
+        ('Tipo', 'tipo'),
+        ('Área', 'area__nombre'),
+        ('Departamento', 'departamento__nombre'),
+        ('Estado', 'estado', texto_estado),
+    ]
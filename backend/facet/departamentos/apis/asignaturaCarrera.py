@@ -5,11 +5,16 @@ from rest_framework.permissions import AllowAny
 from rest_framework.filters import SearchFilter
 from ..models import AsignaturaCarrera
 from ..serializers import AsignaturaCarreraSerializer
+from .pagination import DefaultResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
 
-class AsignaturaCarreraViewSet(viewsets.ModelViewSet):
+class AsignaturaCarreraViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = AsignaturaCarrera.objects.filter(estado='1')  # Solo objetos activos por defecto
+    queryset = AsignaturaCarrera.objects.all()
     serializer_class = AsignaturaCarreraSerializer
+    pagination_class = DefaultResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = {
         'carrera': ['exact'],  # Permite filtrar por carrera
@@ -17,28 +22,13 @@ class AsignaturaCarreraViewSet(viewsets.ModelViewSet):
         'estado': ['exact'],      # Permite filtrar por estado
     }
     search_fields = ['asignatura__nombre', 'carrera__nombre']
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = AsignaturaCarrera.objects.all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
\ No newline at end of file
+    nombre_exportacion = 'asignaturas_carrera'
+    columnas_exportacion = [
+        ('Carrera', 'carrera__nombre'),
+        ('Código', 'asignatura__codigo'),
+        ('Asignatura', 'asignatura__nombre'),
+        ('Módulo', 'asignatura__modulo'),
+        ('Departamento', 'asignatura__departamento__nombre'),
+        ('Área', 'asignatura__area__nombre'),
+        ('Estado', 'estado', texto_estado),
+    ]
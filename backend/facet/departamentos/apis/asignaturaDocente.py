@@ -2,20 +2,56 @@ from rest_framework import viewsets, filters, status
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
-from rest_framework.filters import SearchFilter
 from rest_framework.decorators import action
 from ..models import AsignaturaDocente
-from datetime import datetime, timedelta
-from django.utils.timezone import now
+from ..vencimientos import ventana_vencimientos
 from ..serializers import AsignaturaDocenteSerializer, AsignaturaDocenteCreateSerializer, AsignaturaDocenteDetailSerializer
+from .pagination import DefaultResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado, texto_si_no
+from .search import TrigramSearchFilter
+from .proyeccion import Proyeccion, Relacion
 
-class AsignaturaDocenteViewSet(viewsets.ModelViewSet):
+FORMA_CARGO_DOCENTE = {
+    'id': 'id',
+    'condicion': 'condicion',
+    'cargo': 'cargo',
+    'dedicacion': 'dedicacion',
+    'fecha_de_inicio': 'fecha_de_inicio',
+    'fecha_de_vencimiento': 'fecha_de_vencimiento',
+    'notificado': 'notificado',
+}
+
+PROYECCION_ASIGNATURA_DOCENTE = Proyeccion({
+    **FORMA_CARGO_DOCENTE,
+    'estado': 'estado',
+    'docente': Relacion('docente', {
+        'id': 'id',
+        'persona': Relacion('persona', {
+            'id': 'id', 'nombre': 'nombre', 'apellido': 'apellido', 'dni': 'dni', 'estado': 'estado', 'email': 'email',
+        }),
+    }),
+})
+
+PROYECCION_VENCIMIENTO_DOCENTE = Proyeccion({
+    **FORMA_CARGO_DOCENTE,
+    'docente': Relacion('docente', {
+        'id': 'id',
+        'persona': Relacion('persona', {'id': 'id', 'nombre': 'nombre', 'apellido': 'apellido', 'dni': 'dni'}),
+    }),
+})
+
+class AsignaturaDocenteViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = AsignaturaDocente.objects.filter(estado='1')  # Solo objetos activos por defecto
+    queryset = AsignaturaDocente.objects.select_related('docente__persona', 'asignatura', 'resolucion')
     serializer_class = AsignaturaDocenteSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    pagination_class = DefaultResultsSetPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = {
         'estado': ['exact'],
+        'asignatura': ['exact'],
+        'asignatura__departamento': ['exact'],
         'docente__persona__legajo': ['icontains'],
         'docente__persona__apellido': ['icontains'],
         'docente__persona__nombre': ['icontains'],
@@ -24,6 +60,22 @@ class AsignaturaDocenteViewSet(viewsets.ModelViewSet):
         'resolucion__nresolucion': ['icontains'],
     }
     search_fields = ['docente__persona__nombre', 'docente__persona__apellido', 'asignatura__nombre']
+    nombre_exportacion = 'docentes_asignatura'
+    columnas_exportacion = [
+        ('Asignatura', 'asignatura__nombre'),
+        ('Nombre', 'docente__persona__nombre'),
+        ('Apellido', 'docente__persona__apellido'),
+        ('DNI', 'docente__persona__dni'),
+        ('Email', 'docente__persona__email'),
+        ('Condición', 'condicion'),
+        ('Cargo', 'cargo'),
+        ('Dedicación', 'dedicacion'),
+        ('Nro Resolución', 'resolucion__nresolucion'),
+        ('Fecha de Inicio', 'fecha_de_inicio'),
+        ('Fecha de Vencimiento', 'fecha_de_vencimiento'),
+        ('Estado', 'estado', texto_estado),
+        ('Notificado', 'notificado', texto_si_no),
+    ]
 
     def get_serializer_class(self):
         # Verificar si la solicitud está disponible
@@ -31,31 +83,6 @@ class AsignaturaDocenteViewSet(viewsets.ModelViewSet):
             if self.request.method in ['POST', 'PUT', 'PATCH']:
                 return AsignaturaDocenteCreateSerializer
         return AsignaturaDocenteDetailSerializer
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = AsignaturaDocente.objects.select_related('docente__persona', 'asignatura', 'resolucion').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
     
     @action(detail=False, methods=['get'], url_path='list_detalle')
     def list_detalle(self, request):
@@ -63,38 +90,13 @@ class AsignaturaDocenteViewSet(viewsets.ModelViewSet):
         Devuelve los datos de AsignaturaDocente con los datos completos del docente y su persona, 
         incluyendo fecha de inicio y fecha de vencimiento.
         """
-        queryset = AsignaturaDocente.objects.select_related(
-            'docente__persona', 'asignatura', 'resolucion'
-        ).filter(asignatura__id=request.query_params.get('asignatura'))
+        queryset = AsignaturaDocente.objects.filter(asignatura__id=request.query_params.get('asignatura'))
 
         # Aplicar filtro de estado si no se especifica show_all
         if not request.query_params.get('show_all', False):
-            queryset = queryset.filter(estado='1')
+            queryset = queryset.activos()
 
-        data = [
-            {
-                'id': asignatura_docente.id,
-                'condicion': asignatura_docente.condicion,
-                'cargo': asignatura_docente.cargo,
-                'dedicacion': asignatura_docente.dedicacion,
-                'estado': asignatura_docente.estado,
-                'fecha_de_inicio': asignatura_docente.fecha_de_inicio,
-                'fecha_de_vencimiento': asignatura_docente.fecha_de_vencimiento,
-                'notificado': asignatura_docente.notificado,
-                'docente': {
-                    'id': asignatura_docente.docente.id,
-                    'persona': {
-                        'id': asignatura_docente.docente.persona.id,
-                        'nombre': asignatura_docente.docente.persona.nombre,
-                        'apellido': asignatura_docente.docente.persona.apellido,
-                        'dni': asignatura_docente.docente.persona.dni,
-                        'estado': asignatura_docente.docente.persona.estado,
-                        'email': asignatura_docente.docente.persona.email, 
-                    },
-                },
-            }
-            for asignatura_docente in queryset
-        ]
+        data = PROYECCION_ASIGNATURA_DOCENTE.construir(PROYECCION_ASIGNATURA_DOCENTE.valores(queryset))
 
         return Response(data)
         
@@ -104,37 +106,17 @@ class AsignaturaDocenteViewSet(viewsets.ModelViewSet):
         Devuelve las asignaciones docentes cuya fecha de vencimiento está próxima a ocurrir (en los próximos 30 días).
         """
         dias_limite = int(request.query_params.get('dias', 30))  # Permite ajustar el límite con un parámetro opcional
-        fecha_limite = now() + timedelta(days=dias_limite)
+        inicio, fin = ventana_vencimientos(dias=dias_limite)
 
-        queryset = AsignaturaDocente.objects.select_related('docente__persona').filter(
-            fecha_de_vencimiento__lte=fecha_limite,
-            fecha_de_vencimiento__gte=now()
-        )
+        queryset = AsignaturaDocente.objects.filter(
+            fecha_de_vencimiento__gte=inicio,
+            fecha_de_vencimiento__lt=fin
+        ).order_by('fecha_de_vencimiento', 'id')
 
         # Aplicar filtro de estado si no se especifica show_all
         if not request.query_params.get('show_all', False):
-            queryset = queryset.filter(estado='1')
+            queryset = queryset.activos()
 
-        data = [
-            {
-                'id': asignatura_docente.id,
-                'condicion': asignatura_docente.condicion,
-                'cargo': asignatura_docente.cargo,
-                'dedicacion': asignatura_docente.dedicacion,
-                'fecha_de_inicio': asignatura_docente.fecha_de_inicio,  # Agregar este campo
-                'fecha_de_vencimiento': asignatura_docente.fecha_de_vencimiento,
-                'notificado': asignatura_docente.notificado,
-                'docente': {
-                    'id': asignatura_docente.docente.id,
-                    'persona': {
-                        'id': asignatura_docente.docente.persona.id,
-                        'nombre': asignatura_docente.docente.persona.nombre,
-                        'apellido': asignatura_docente.docente.persona.apellido,
-                        'dni': asignatura_docente.docente.persona.dni,
-                    },
-                },
-            }
-            for asignatura_docente in queryset
-        ]
+        data = PROYECCION_VENCIMIENTO_DOCENTE.construir(PROYECCION_VENCIMIENTO_DOCENTE.valores(queryset))
 
         return Response(data)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from ..invalidacion import version_modelo
+
+
+class CacheRespuestaViewSetMixin:
+    """
+    Cachea las respuestas de list y retrieve y agrega ETag/Last-Modified.
+
+    La clave incluye la URL completa y la versión del modelo (y de `modelos_relacionados`,
+    cuyos datos aparecen en la respuesta), así que guardar o borrar cualquier registro la
+    descarta sin recorrer claves. Los validadores salen de Max(fecha_modificacion) y la
+    cantidad de filas del listado filtrado: un cliente que revalida con If-None-Match o
+    If-Modified-Since recibe 304 sin serializar nada.
+
+    Con la cache en memoria local cada proceso tiene sus propias versiones; con varios
+    workers conviene CACHE_REDIS_URL para que la invalidación les llegue a todos.
+    """
+    modelos_relacionados = []
+
+    def list(self, request, *args, **kwargs):
+        return self.respuesta_cacheada(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.respuesta_cacheada(super().retrieve, request, *args, **kwargs)
+
+    def get_clave_respuesta(self, request):
+        modelos = [self.queryset.model, *self.modelos_relacionados]
+        versiones = '.'.join(str(version_modelo(modelo)) for modelo in modelos)
+        url = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+        return f"respuesta:{self.queryset.model._meta.label_lower}:{versiones}:{url}"
+
+    def get_validadores(self, clave):
+        """(etag, última modificación) del conjunto que devuelve la vista."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        resumen = queryset.order_by().aggregate(ultima=Max('fecha_modificacion'), total=Count('pk'))
+        ultima = resumen['ultima']
+        contenido = f"{clave}:{ultima.isoformat() if ultima else ''}:{resumen['total']}"
+        return f'"{hashlib.md5(contenido.encode("utf-8")).hexdigest()}"', ultima
+
+    def respuesta_cacheada(self, vista, request, *args, **kwargs):
+        clave = self.get_clave_respuesta(request)
+        entrada = cache.get(clave)
+        if entrada is None:
+            # Los validadores se calculan antes que los datos: si algo cambia en el medio,
+            # la versión nueva descarta esta entrada
+            etag, ultima = self.get_validadores(clave)
+            response = vista(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entrada = {'data': response.data, 'etag': etag, 'ultima': ultima}
+            cache.set(clave, entrada, settings.RESPUESTAS_CACHE_TTL)
+
+        ultima = int(entrada['ultima'].timestamp()) if entrada['ultima'] else None
+        no_modificado = get_conditional_response(request, etag=entrada['etag'], last_modified=ultima)
+        response = no_modificado if no_modificado is not None else Response(entrada['data'])
+        response['ETag'] = entrada['etag']
+        if ultima is not None:
+            response['Last-Modified'] = http_date(ultima)
+        # El navegador puede guardar la respuesta pero debe revalidarla en cada uso
+        patch_cache_control(response, no_cache=True)
+        return response
@@ -0,0 +1,42 @@
+from django.core.exceptions import FieldDoesNotExist
+
+from ..serializers.campos import pedido_de_campos
+from .planificador import planificar_consulta
+
+
+class CamposDinamicosViewSetMixin:
+    """
+    Arma la consulta de list/retrieve a partir del serializer (ver planificador): agrega los
+    select_related/prefetch_related que necesita para no consultar por fila y, si el cliente
+    pidió ?fields= o ?expand= (ver serializers.campos), la reduce a las columnas que se
+    serializan con only() y a las relaciones que efectivamente se anidan.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve'):
+            return queryset
+
+        plan = planificar_consulta(self.get_serializer(), queryset.model)
+        if pedido_de_campos(self.request) is not None and plan.columnas is not None:
+            # Solo las columnas y relaciones que se serializan; sin pedido se suma a lo que ya
+            # une el queryset de la vista
+            queryset = queryset.select_related(None).only(*self.columnas_con_orden(queryset, plan.columnas))
+        # select_related() sin argumentos seguiría todas las claves foráneas
+        if plan.select_related:
+            queryset = queryset.select_related(*sorted(plan.select_related))
+        if plan.prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(plan.prefetch_related))
+        return queryset
+
+    def columnas_con_orden(self, queryset, columnas):
+        """Agrega los campos de orden locales, que la paginación por cursor lee de cada instancia."""
+        columnas = list(columnas)
+        for campo in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(campo, str) and '__' not in campo and campo.lstrip('-') != '?':
+                try:
+                    if queryset.model._meta.get_field(campo.lstrip('-')).concrete:
+                        columnas.append(campo.lstrip('-'))
+                except FieldDoesNotExist:
+                    pass
+        return columnas
@@ -0,0 +1,131 @@
+import hashlib
+import json
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from ..invalidacion import version_modelo
+
+# Parámetros que cambian la página pero no el conjunto de resultados
+PARAMETROS_PAGINACION = {'page', 'page_size', 'limit', 'offset', 'cursor', 'paginacion', 'format'}
+
+
+def clave_conteo(request):
+    """Clave de cache del conteo: ruta + filtros normalizados (ordenados, sin paginación)."""
+    parametros = sorted(
+        (nombre, sorted(request.query_params.getlist(nombre)))
+        for nombre in request.query_params
+        if nombre not in PARAMETROS_PAGINACION
+    )
+    contenido = json.dumps([request.path, parametros])
+    return 'conteo:' + hashlib.md5(contenido.encode('utf-8')).hexdigest()
+
+
+def estimar_conteo(queryset):
+    """
+    Devuelve la estimación del planificador de PostgreSQL para el queryset.
+
+    Sin filtros se usa pg_class.reltuples; con filtros, las filas estimadas por EXPLAIN.
+    En otros motores (o si no hay estadísticas) devuelve None.
+    """
+    if queryset.query.is_empty():
+        return 0
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        # En un UNION el WHERE está en cada rama: reltuples no sirve
+        if not queryset.query.where and not queryset.query.distinct and not queryset.query.combinator:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            fila = cursor.fetchone()
+            # reltuples vale -1 si la tabla nunca fue analizada
+            if fila and fila[0] >= 0:
+                return fila[0]
+
+        sql, params = queryset.order_by().query.get_compiler(using=queryset.db).as_sql()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def modelos_consultados(queryset):
+    """Modelo del queryset y los de sus JOINs (filtros y ordenamientos sobre relaciones)."""
+    tablas = {alias.table_name for alias in queryset.query.alias_map.values()}
+    modelos = [queryset.model]
+    for modelo in apps.get_models():
+        if modelo._meta.db_table in tablas and modelo is not queryset.model:
+            modelos.append(modelo)
+    return modelos
+
+
+def filas_tabla(modelo, using):
+    """
+    Filas estimadas de la tabla del modelo (pg_class.reltuples), en cache por modelo.
+
+    Sirve de cota: si la tabla entera no supera el umbral, ningún filtro lo supera y se
+    puede contar exacto sin pedirle un EXPLAIN al planificador.
+    """
+    clave = f"conteo:filas:{using}:{modelo._meta.db_table}"
+    filas = cache.get(clave)
+    if filas is None:
+        connection = connections[using]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [modelo._meta.db_table],
+            )
+            fila = cursor.fetchone()
+        # reltuples vale -1 si la tabla nunca fue analizada: no se guarda
+        if not fila or fila[0] < 0:
+            return None
+        filas = fila[0]
+        cache.set(clave, filas, getattr(settings, 'CONTEO_FILAS_TTL', 300))
+    return filas
+
+
+def contar(queryset, request=None):
+    """
+    Estrategia de conteo de los paginadores. Devuelve (total, es_exacto).
+
+    1. Si hay un conteo exacto en cache para los mismos filtros, se usa.
+    2. Si la tabla entera tiene menos filas que CONTEO_UMBRAL_EXACTO, se cuenta exacto.
+    3. Si el planificador estima más filas que el umbral, se devuelve la estimación.
+    4. En otro caso se ejecuta COUNT(*) y se guarda en cache por CONTEO_CACHE_TTL segundos.
+
+    La clave lleva la versión del modelo y de los modelos de sus JOINs: invalidar_modelo()
+    descarta también los conteos. Los filtros por subconsulta (Exists, __in con queryset)
+    no suman versiones: esos conteos pueden quedar viejos hasta CONTEO_CACHE_TTL.
+    """
+    umbral = getattr(settings, 'CONTEO_UMBRAL_EXACTO', 10000)
+    ttl = getattr(settings, 'CONTEO_CACHE_TTL', 30)
+
+    clave = None
+    if request is not None:
+        versiones = '.'.join(str(version_modelo(modelo)) for modelo in modelos_consultados(queryset))
+        clave = f"{clave_conteo(request)}:{versiones}"
+        total = cache.get(clave)
+        if total is not None:
+            return total, True
+
+    # Con JOINs o UNION la tabla base no acota el resultado
+    acotado = not queryset.query.combinator and len(queryset.query.alias_map) <= 1
+    filas = filas_tabla(queryset.model, queryset.db) if acotado else None
+    if filas is None or filas > umbral:
+        estimado = estimar_conteo(queryset)
+        if estimado is not None and estimado > umbral:
+            return estimado, False
+
+    total = queryset.count()
+    if clave:
+        cache.set(clave, total, ttl)
+    return total, True
@@ -3,19 +3,17 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
 from rest_framework.filters import SearchFilter
-from rest_framework.pagination import LimitOffsetPagination
 from ..models import Departamento
 from ..serializers import DepartamentoSerializer
+from .pagination import StandardResultsSetPagination
+from .cache import CacheRespuestaViewSetMixin
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
 
-class StandardResultsSetPagination(LimitOffsetPagination):
-    default_limit = 10
-    limit_query_param = 'limit'
-    offset_query_param = 'offset'
-    max_limit = 100
-
-class DepartamentoViewSet(viewsets.ModelViewSet):
+class DepartamentoViewSet(ExportacionViewSetMixin, CacheRespuestaViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = Departamento.objects.filter(estado='1')  # Solo objetos activos por defecto
+    queryset = Departamento.objects.all()
     serializer_class = DepartamentoSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
@@ -25,28 +23,12 @@ class DepartamentoViewSet(viewsets.ModelViewSet):
         'nombre': ['icontains'],   # Filtrar por nombre que contiene el valor especificado
     }
     search_fields = ['nombre', 'telefono']
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = Departamento.objects.all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
\ No newline at end of file
+    nombre_exportacion = 'departamentos'
+    columnas_exportacion = [
+        ('Nombre', 'nombre'),
+        ('Teléfono', 'telefono'),
+        ('Interno', 'interno'),
+        ('Email', 'mail_departamento'),
+        ('Email del Jefe', 'mail_jefe_departamento'),
+        ('Estado', 'estado', texto_estado),
+    ]
@@ -0,0 +1,115 @@
+import csv
+import tempfile
+from datetime import datetime
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+# Filas que trae cada vuelta del cursor del lado del servidor
+TAMANO_BLOQUE_EXPORTACION = 2000
+
+FORMATOS_EXPORTACION = ('xlsx', 'csv')
+CONTENT_TYPE_XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def texto_estado(valor):
+    return "Activo" if str(valor) in ('1', 'True') else "Inactivo"
+
+
+def texto_si_no(valor):
+    return "Sí" if valor else "No"
+
+
+def _valor_celda(valor):
+    # Excel no admite fechas con zona horaria: se exportan en hora local
+    if isinstance(valor, datetime) and timezone.is_aware(valor):
+        return timezone.make_naive(valor)
+    return valor
+
+
+def _valor_csv(valor):
+    valor = _valor_celda(valor)
+    if isinstance(valor, datetime):
+        return valor.strftime('%Y-%m-%d %H:%M')
+    return valor
+
+
+class _Eco:
+    """Pseudo-buffer para csv.writer: devuelve la línea en lugar de guardarla."""
+
+    def write(self, valor):
+        return valor
+
+
+class ExportacionViewSetMixin:
+    """
+    Acción GET export/?formato=xlsx|csv que descarga todos los registros del listado.
+
+    Aplica los mismos filtros, búsqueda y criterio de activos/inactivos que el listado, pero
+    sin paginar: se proyectan solo las columnas de `columnas_exportacion` con values_list y se
+    leen por bloques con `.iterator()`. El CSV se genera a medida que se envía y el XLSX se
+    escribe con un libro write-only a un archivo temporal, de modo que la memoria usada no
+    depende de la cantidad de filas.
+
+    `columnas_exportacion` es una lista de (encabezado, campo) o (encabezado, campo, formato).
+    """
+    columnas_exportacion = []
+    nombre_exportacion = 'exportacion'
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        formato = request.query_params.get('formato', 'xlsx').lower()
+        if formato not in FORMATOS_EXPORTACION:
+            return Response(
+                {"error": f"Formato no válido; opciones: {', '.join(FORMATOS_EXPORTACION)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        nombre = f"{self.nombre_exportacion}_{timezone.localdate():%Y%m%d}.{formato}"
+        if formato == 'csv':
+            response = StreamingHttpResponse(self.generar_csv(), content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = f'attachment; filename="{nombre}"'
+            return response
+        return FileResponse(self.generar_xlsx(), as_attachment=True, filename=nombre, content_type=CONTENT_TYPE_XLSX)
+
+    def get_filas_exportacion(self):
+        """Recorre el listado filtrado como tuplas ya formateadas, en el orden de las columnas."""
+        queryset = self.filter_queryset(self.get_queryset())
+        campos = [columna[1] for columna in self.columnas_exportacion]
+        formatos = [columna[2] if len(columna) > 2 else None for columna in self.columnas_exportacion]
+        for fila in queryset.values_list(*campos).iterator(chunk_size=TAMANO_BLOQUE_EXPORTACION):
+            yield [
+                formato(valor) if formato else valor
+                for formato, valor in zip(formatos, fila)
+            ]
+
+    def generar_csv(self):
+        escritor = csv.writer(_Eco())
+        # BOM para que Excel detecte UTF-8 al abrir el archivo
+        yield '\ufeff' + escritor.writerow([columna[0] for columna in self.columnas_exportacion])
+        for fila in self.get_filas_exportacion():
+            yield escritor.writerow([_valor_csv(valor) for valor in fila])
+
+    def generar_xlsx(self):
+        libro = Workbook(write_only=True)
+        hoja = libro.create_sheet(title=self.nombre_exportacion.replace('_', ' ').title()[:31])
+        negrita = Font(bold=True)
+        encabezados = []
+        for columna in self.columnas_exportacion:
+            celda = WriteOnlyCell(hoja, value=columna[0])
+            celda.font = negrita
+            encabezados.append(celda)
+        hoja.append(encabezados)
+        for fila in self.get_filas_exportacion():
+            hoja.append([_valor_celda(valor) for valor in fila])
+
+        archivo = tempfile.TemporaryFile()
+        libro.save(archivo)
+        archivo.seek(0)
+        return archivo
@@ -0,0 +1,67 @@
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.response import Response
+from ..models import ImportacionPersonal
+from ..serializers import ImportacionPersonalSerializer, ImportacionPersonalErrorSerializer
+from ..importacion.tasks import preparar_importacion_task
+from .pagination import PageResultsSetPagination
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ImportacionPersonalViewSet(mixins.CreateModelMixin,
+                                 mixins.ListModelMixin,
+                                 mixins.RetrieveModelMixin,
+                                 viewsets.GenericViewSet):
+    """
+    Importaciones asíncronas de la planilla de personal.
+    POST (multipart con 'archivo') crea la importación y la encola en la cola 'importaciones';
+    el avance se consulta en /estado y los errores por fila en /errores.
+    """
+    queryset = ImportacionPersonal.objects.all().order_by('-fecha_creacion')
+    serializer_class = ImportacionPersonalSerializer
+    pagination_class = PageResultsSetPagination
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        usuario = request.user if request.user and request.user.is_authenticated else None
+        importacion = serializer.save(creado_por=usuario)
+
+        task_result = preparar_importacion_task.delay(importacion.id)
+        importacion.task_id = task_result.id
+        importacion.save(update_fields=['task_id'])
+        logger.info(f"Importación de personal {importacion.id} programada con tarea {task_result.id}")
+
+        return Response(self.get_serializer(importacion).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['get'])
+    def estado(self, request, pk=None):
+        """Avance de la importación (lotes procesados sobre el total)."""
+        importacion = self.get_object()
+        response_data = {
+            "id": importacion.id,
+            "task_id": importacion.task_id,
+            "situacion": importacion.situacion,
+            "ready": importacion.situacion in ('finalizada', 'con_errores', 'fallida'),
+            "progreso": importacion.progreso,
+            "lotes_procesados": importacion.lotes_procesados,
+            "total_lotes": importacion.total_lotes,
+            "filas_invalidas": importacion.filas_invalidas,
+            "errores": importacion.errores.count(),
+        }
+        if importacion.resumen is not None:
+            response_data["result"] = importacion.resumen
+        if importacion.mensaje_error:
+            response_data["error"] = importacion.mensaje_error
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def errores(self, request, pk=None):
+        """Errores por fila (y por lote) de la importación, paginados."""
+        importacion = self.get_object()
+        page = self.paginate_queryset(importacion.errores.all())
+        serializer = ImportacionPersonalErrorSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
@@ -1,4 +1,3 @@
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import viewsets, status
@@ -6,14 +5,38 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
 from ..models import Jefe
 from ..serializers import JefeSerializer
+from .pagination import DefaultResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
+from .search import TrigramSearchFilter
+from .proyeccion import Proyeccion, Relacion
 
+# Datos de contacto de la persona, tal como los anidan los listados de jefes
+FORMA_PERSONA = {
+    'id': 'id',
+    'nombre': 'nombre',
+    'apellido': 'apellido',
+    'dni': 'dni',
+    'legajo': 'legajo',
+    'telefono': 'telefono',
+    'email': 'email',
+}
 
+PROYECCION_JEFE = Proyeccion({
+    'id': 'id',
+    'observaciones': 'observaciones',
+    'estado': 'estado',
+    'persona': Relacion('persona', FORMA_PERSONA),
+})
 
-class JefeViewSet(viewsets.ModelViewSet):
+
+class JefeViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = Jefe.objects.filter(estado='1')  # Solo objetos activos por defecto
+    queryset = Jefe.objects.select_related('persona')
     serializer_class = JefeSerializer
-    filter_backends = [DjangoFilterBackend]
+    pagination_class = DefaultResultsSetPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = {
         'estado': ['exact'],
         'persona__legajo': ['icontains'],
@@ -21,36 +44,24 @@ class JefeViewSet(viewsets.ModelViewSet):
         'persona__nombre': ['icontains'],
         'persona__dni': ['icontains'],
     }
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = Jefe.objects.select_related('persona').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
+    search_fields = ['persona__nombre', 'persona__apellido', 'persona__dni', 'persona__legajo']
+    nombre_exportacion = 'jefes'
+    columnas_exportacion = [
+        ('Nombre', 'persona__nombre'),
+        ('Apellido', 'persona__apellido'),
+        ('DNI', 'persona__dni'),
+        ('Legajo', 'persona__legajo'),
+        ('Teléfono', 'persona__telefono'),
+        ('Email', 'persona__email'),
+        ('Interno', 'persona__interno'),
+        ('Observaciones', 'observaciones'),
+        ('Estado', 'estado', texto_estado),
+    ]
 
     @action(detail=False, methods=['get'], url_path='list_jefes_persona')
     def list_jefes_persona(self, request):
         # Realizar la consulta de Jefes con datos de Persona
-        jefes = Jefe.objects.select_related('persona').all()
+        jefes = Jefe.objects.all()
         
         # Aplicar filtros si están presentes
         if 'persona__nombre__icontains' in request.query_params:
@@ -63,30 +74,12 @@ class JefeViewSet(viewsets.ModelViewSet):
             jefes = jefes.filter(estado=request.query_params['estado'])
         else:
             # Por defecto, mostrar solo activos
-            jefes = jefes.filter(estado='1')
+            jefes = jefes.activos()
         
         # Paginación
-        paginator = LimitOffsetPagination()
-        paginated_jefes = paginator.paginate_queryset(jefes, request)
-
-        # Construir los datos paginados
-        jefes_data = [
-            {
-                'id': jefe.id,
-                'observaciones': jefe.observaciones,
-                'estado': jefe.estado,
-                'persona': {
-                    'id': jefe.persona.id,
-                    'nombre': jefe.persona.nombre,
-                    'apellido': jefe.persona.apellido,
-                    'dni': jefe.persona.dni,
-                    'legajo': jefe.persona.legajo,
-                    'telefono': jefe.persona.telefono,
-                    'email': jefe.persona.email,
-                }
-            }
-            for jefe in paginated_jefes
-        ]
+        paginator = DefaultResultsSetPagination()
+        paginated_jefes = paginator.paginate_queryset(PROYECCION_JEFE.valores(jefes), request)
+        jefes_data = PROYECCION_JEFE.construir(paginated_jefes)
 
         # Devolver respuesta paginada
         return paginator.get_paginated_response(jefes_data)
@@ -95,23 +88,9 @@ class JefeViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'], url_path='obtener_jefe')
     def obtener_jefe(self, request, pk=None):
         # Obtener el jefe con datos relacionados de Persona
-        jefe = Jefe.objects.select_related('persona').filter(id=pk).first()
+        jefe = PROYECCION_JEFE.valores(Jefe.objects.filter(id=pk)).first()
         if jefe:
-            data = {
-                'id': jefe.id,
-                'observaciones': jefe.observaciones,
-                'estado': jefe.estado,
-                'persona': {
-                    'id': jefe.persona.id,
-                    'nombre': jefe.persona.nombre,
-                    'apellido': jefe.persona.apellido,
-                    'dni': jefe.persona.dni,
-                    'legajo': jefe.persona.legajo,
-                    'telefono': jefe.persona.telefono,
-                    'email': jefe.persona.email,
-                }
-            }
-            return Response(data)
+            return Response(PROYECCION_JEFE.construir_uno(jefe))
         else:
             return Response({'detail': 'Jefe no encontrado'}, status=404)
         
@@ -125,4 +104,3 @@ class JefeViewSet(viewsets.ModelViewSet):
 
         existe = Jefe.objects.filter(persona_id=persona_id).exists()
         return Response({"existe": existe}, status=status.HTTP_200_OK)
-
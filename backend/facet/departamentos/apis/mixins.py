@@ -0,0 +1,104 @@
+from django.utils.timezone import now
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from ..invalidacion import invalidar_modelo
+
+
+class SoftDeleteViewSetMixin:
+    """
+    Borrado lógico compartido por los ViewSets.
+
+    Por defecto solo se listan los registros activos (`.activos()`, que usa los índices
+    parciales WHERE estado='1'). Con ?show_all o filtrando explícitamente por ?estado se
+    devuelven todos. DELETE marca el registro como inactivo en lugar de eliminarlo.
+    """
+
+    def incluir_inactivos(self):
+        params = self.request.query_params
+        return bool(params.get('show_all', False)) or 'estado' in params
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.incluir_inactivos():
+            return queryset.todos()
+        return queryset.activos()
+
+    def destroy(self, request, *args, **kwargs):
+        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
+        instance = self.get_object()
+        instance.estado = instance.valor_estado(activo=False)
+        campos = ['estado', 'fecha_modificacion']
+        if request.user and request.user.is_authenticated:
+            instance.actualizado_por = request.user
+            campos.append('actualizado_por')
+        instance.save(update_fields=campos)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'], url_path='bulk_deactivate')
+    def bulk_deactivate(self, request):
+        """
+        Desactiva en un solo UPDATE los registros indicados.
+        Body: {"ids": [1, 2, ...]} o {"filtros": {"asignatura__departamento": 3}}
+        """
+        return self.cambiar_estado_masivo(request, activo=False)
+
+    @action(detail=False, methods=['post'], url_path='bulk_restore')
+    def bulk_restore(self, request):
+        """Reactiva en un solo UPDATE los registros indicados (mismo body que bulk_deactivate)."""
+        return self.cambiar_estado_masivo(request, activo=True)
+
+    def cambiar_estado_masivo(self, request, activo):
+        queryset, error = self.get_seleccion_masiva(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Solo se tocan las filas que efectivamente cambian de estado
+        queryset = queryset.inactivos() if activo else queryset.activos()
+        cambios = {
+            'estado': self.queryset.model.valor_estado(activo=activo),
+            'fecha_modificacion': now(),
+        }
+        if request.user and request.user.is_authenticated:
+            cambios['actualizado_por'] = request.user
+        actualizados = queryset.order_by().update(**cambios)
+        # update() no dispara post_save: se invalida a mano la cache de respuestas del modelo
+        if actualizados:
+            invalidar_modelo(self.queryset.model)
+        return Response({"actualizados": actualizados}, status=status.HTTP_200_OK)
+
+    def get_seleccion_masiva(self, request):
+        """Devuelve (queryset, error) a partir de 'ids' o 'filtros'; nunca selecciona la tabla completa."""
+        queryset = self.queryset.model._default_manager.all()
+        ids = request.data.get('ids')
+        filtros = request.data.get('filtros')
+
+        if ids:
+            if not isinstance(ids, list):
+                return None, "'ids' debe ser una lista"
+            try:
+                ids = [int(valor) for valor in ids]
+            except (TypeError, ValueError):
+                return None, "'ids' debe contener solo enteros"
+            return queryset.filter(pk__in=ids), None
+
+        if filtros:
+            if not isinstance(filtros, dict):
+                return None, "'filtros' debe ser un objeto"
+            filterset_class = DjangoFilterBackend().get_filterset_class(self, queryset)
+            if filterset_class is None:
+                return None, "Este recurso no admite filtros"
+            desconocidos = set(filtros) - set(filterset_class.base_filters) - {'estado'}
+            if desconocidos:
+                return None, f"Filtros no válidos: {', '.join(sorted(desconocidos))}"
+            filtros = {clave: valor for clave, valor in filtros.items() if clave != 'estado'}
+            if not filtros:
+                return None, "Se requiere al menos un filtro"
+            filterset = filterset_class(data=filtros, queryset=queryset, request=request)
+            if not filterset.is_valid():
+                return None, filterset.errors
+            return filterset.qs, None
+
+        return None, "Se requiere 'ids' o 'filtros'"
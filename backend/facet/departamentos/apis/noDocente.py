@@ -1,17 +1,22 @@
 from rest_framework import viewsets, filters, status
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
-from rest_framework.filters import SearchFilter
 from ..models import NoDocente
 from ..serializers import NoDocenteSerializer
+from .pagination import DefaultResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
+from .search import TrigramSearchFilter
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-class NoDocenteViewSet(viewsets.ModelViewSet):
+class NoDocenteViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = NoDocente.objects.filter(estado='1')  # Solo objetos activos por defecto
+    queryset = NoDocente.objects.select_related('persona')
     serializer_class = NoDocenteSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    pagination_class = DefaultResultsSetPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = {
         'estado': ['exact'],       # Filtrar por estado exacto (0 o 1)
         'persona': ['exact'],      # Filtrar por ID de persona exacto
@@ -21,38 +26,23 @@ class NoDocenteViewSet(viewsets.ModelViewSet):
         'persona__dni': ['icontains'],
     }
     search_fields = ['persona__nombre', 'persona__apellido', 'persona__dni', 'persona__legajo']
+    nombre_exportacion = 'no_docentes'
+    columnas_exportacion = [
+        ('Nombre', 'persona__nombre'),
+        ('Apellido', 'persona__apellido'),
+        ('DNI', 'persona__dni'),
+        ('Legajo', 'persona__legajo'),
+        ('Teléfono', 'persona__telefono'),
+        ('Email', 'persona__email'),
+        ('Estado', 'estado', texto_estado),
+    ]
 
     @action(detail=False, methods=['get'], url_path='buscar_por_persona')
     def buscar_por_persona(self, request):
         persona_id = request.query_params.get('persona_id')
         if persona_id:
-            nodocente = self.queryset.filter(persona__id=persona_id).first()
+            nodocente = self.queryset.activos().filter(persona__id=persona_id).first()
             if nodocente:
                 serializer = self.get_serializer(nodocente)
                 return Response(serializer.data, status=200)
         return Response({'detail': 'No encontrado'}, status=404)
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = NoDocente.objects.select_related('persona').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
\ No newline at end of file
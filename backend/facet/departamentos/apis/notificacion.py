@@ -5,22 +5,45 @@ from rest_framework.permissions import AllowAny
 from django.core.mail import send_mail
 from django.conf import settings
 from django.utils.timezone import now
-from ..models import Notificacion, Persona, JefeDepartamento, AsignaturaDocente
+from django.db import connection, transaction
+from django.db.models import Sum
+from ..models import ContadorNotificaciones, EnvioNotificacion, Notificacion, Persona
+from .. import contadores
 from ..serializers import NotificacionSerializer
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.filters import SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import rest_framework as filters
-from ..tasks import enviar_email_notificacion_task, enviar_email_asignatura_task
+from ..tasks import enviar_email_notificacion_task, enviar_email_asignatura_task, asignaciones_de_persona, aviso_manual
+from ..notificaciones import envio_registrado
+from .pagination import PageResultsSetPagination
+from .campos import CamposDinamicosViewSetMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Configuración de paginación
-class NotificacionPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+def ids_solicitados(request, campo='asignacion_ids'):
+    """Lee una lista opcional de ids del body; devuelve (ids o None, error)."""
+    ids = request.data.get(campo)
+    if ids is None:
+        return None, None
+    if not isinstance(ids, list):
+        return None, f"'{campo}' debe ser una lista"
+    try:
+        return [int(valor) for valor in ids], None
+    except (TypeError, ValueError):
+        return None, f"'{campo}' debe contener solo enteros"
+
+def respuesta_duplicado(tipo, persona, mensaje, asignacion_ids):
+    """409 si el mismo mensaje ya está en la bandeja de salida (ver notificaciones.clave_envio); si no, None."""
+    envio = envio_registrado(tipo, aviso_manual(tipo, persona, mensaje, asignacion_ids))
+    if envio is None:
+        return None
+    return Response({
+        "error": "El mismo mensaje ya fue registrado hoy para esta persona",
+        "duplicado": True,
+        "notificacion_id": envio.notificacion_id,
+        "situacion": envio.situacion,
+    }, status=status.HTTP_409_CONFLICT)
 
 # Definir un `FilterSet` personalizado
 class NotificacionFilter(filters.FilterSet):
@@ -32,11 +55,11 @@ class NotificacionFilter(filters.FilterSet):
         model = Notificacion
         fields = ['persona_apellido', 'persona_nombre', 'fecha_creacion']
 
-class NotificacionViewSet(viewsets.ModelViewSet):
+class NotificacionViewSet(CamposDinamicosViewSetMixin, viewsets.ModelViewSet):
     queryset = Notificacion.objects.select_related('persona').all().order_by('-fecha_creacion')  
     serializer_class = NotificacionSerializer
     permission_classes = [AllowAny]
-    pagination_class = NotificacionPagination
+    pagination_class = PageResultsSetPagination
     filter_backends = [DjangoFilterBackend]
     filterset_class = NotificacionFilter  
 
@@ -45,14 +68,78 @@ class NotificacionViewSet(viewsets.ModelViewSet):
         return super().list(request, *args, **kwargs)
     
 
+    # Los contadores por persona se ajustan con las señales de Notificacion (ver contadores.py)
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic(), connection.cursor() as cursor:
+            EnvioNotificacion.objects.filter(notificacion_id=instance.pk).delete()
+            contadores.eliminar(cursor, [instance.pk])
+
     @action(detail=True, methods=['patch'])
     def marcar_leida(self, request, pk=None):
         """Marcar una notificación como leída."""
         notificacion = self.get_object()
-        notificacion.leido = True
-        notificacion.save()
+        contadores.marcar_leidas(Notificacion.objects.filter(pk=notificacion.pk))
         return Response({"message": "Notificación marcada como leída"}, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['post'])
+    def marcar_leidas(self, request):
+        """
+        Marca varias notificaciones como leídas en un solo UPDATE.
+        Body: {"ids": [1, 2, ...]} o {"persona": 5} (todas las de la persona)
+        """
+        ids, error = ids_solicitados(request, 'ids')
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        persona_id = request.data.get('persona')
+        if persona_id is not None:
+            try:
+                persona_id = int(persona_id)
+            except (TypeError, ValueError):
+                return Response({"error": "'persona' debe ser un id entero"}, status=status.HTTP_400_BAD_REQUEST)
+        if ids:
+            queryset = Notificacion.objects.filter(pk__in=ids)
+        elif persona_id:
+            queryset = Notificacion.objects.filter(persona_id=persona_id)
+        else:
+            return Response({"error": "Se requiere 'ids' o 'persona'"}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            actualizadas = contadores.marcar_leidas(queryset)
+        return Response({"actualizadas": actualizadas}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def resumen(self, request):
+        """
+        Totales de notificaciones y no leídas a partir de los contadores por persona.
+        Con ?persona=1,2 incluye el detalle de esas personas.
+        """
+        totales = ContadorNotificaciones.objects.aggregate(total=Sum('total'), no_leidas=Sum('no_leidas'))
+        response_data = {"total": totales['total'] or 0, "no_leidas": totales['no_leidas'] or 0}
+
+        personas = request.query_params.get('persona')
+        if personas:
+            try:
+                persona_ids = [int(valor) for valor in personas.split(',')]
+            except ValueError:
+                return Response({"error": "'persona' debe ser una lista de ids"}, status=status.HTTP_400_BAD_REQUEST)
+            encontrados = {
+                contador['persona']: contador
+                for contador in ContadorNotificaciones.objects.filter(persona_id__in=persona_ids).values('persona', 'total', 'no_leidas')
+            }
+            response_data["personas"] = [
+                encontrados.get(persona_id, {"persona": persona_id, "total": 0, "no_leidas": 0})
+                for persona_id in persona_ids
+            ]
+        return Response(response_data, status=status.HTTP_200_OK)
+
     @action(detail=False, methods=['post'], url_path='crear_notificacion')
     def crear_notificacion(self, request):
         """Crear una nueva notificación manualmente y enviar un correo usando Celery."""
@@ -66,16 +153,26 @@ class NotificacionViewSet(viewsets.ModelViewSet):
             # Validar que la persona existe
             persona = Persona.objects.get(id=persona_id)
             
-            # Validar que el jefe de departamento existe
-            jefe_departamento = JefeDepartamento.objects.get(jefe__persona__id=persona_id)
+            # Validar que la persona tiene jefaturas activas (puede tener más de una)
+            asignacion_ids, error = ids_solicitados(request)
+            if error:
+                return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+            asignacion_ids = [asignacion_id for asignacion_id, _ in asignaciones_de_persona('jefe_departamento', persona_id, asignacion_ids)]
+            if not asignacion_ids:
+                return Response({"error": "No se encontró el jefe de departamento"}, status=status.HTTP_404_NOT_FOUND)
 
             if not persona.email:
                 return Response({"error": "La persona no tiene un correo registrado"}, status=status.HTTP_400_BAD_REQUEST)
 
+            duplicado = respuesta_duplicado('jefe_departamento', persona, mensaje, asignacion_ids)
+            if duplicado:
+                return duplicado
+
             # 🚀 Enviar email de forma asíncrona usando Celery
             task_result = enviar_email_notificacion_task.delay(
                 persona_id=persona_id,
-                mensaje=mensaje
+                mensaje=mensaje,
+                asignacion_ids=asignacion_ids,
             )
 
             logger.info(f"Tarea de envío de email programada con ID: {task_result.id}")
@@ -89,8 +186,6 @@ class NotificacionViewSet(viewsets.ModelViewSet):
 
         except Persona.DoesNotExist:
             return Response({"error": "Persona no encontrada"}, status=status.HTTP_404_NOT_FOUND)
-        except JefeDepartamento.DoesNotExist:
-            return Response({"error": "No se encontró el jefe de departamento"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error inesperado al crear notificación: {str(e)}")
             return Response({"error": "Error interno del servidor"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -108,16 +203,26 @@ class NotificacionViewSet(viewsets.ModelViewSet):
             # Validar que la persona existe
             persona = Persona.objects.get(id=persona_id)
             
-            # Validar que la asignatura del docente existe
-            asignatura_docente = AsignaturaDocente.objects.get(docente__persona__id=persona_id)
+            # Validar que el docente tiene asignaturas activas (puede tener varias)
+            asignacion_ids, error = ids_solicitados(request)
+            if error:
+                return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+            asignacion_ids = [asignacion_id for asignacion_id, _ in asignaciones_de_persona('asignatura_docente', persona_id, asignacion_ids)]
+            if not asignacion_ids:
+                return Response({"error": "No se encontró la asignatura del docente"}, status=status.HTTP_404_NOT_FOUND)
 
             if not persona.email:
                 return Response({"error": "La persona no tiene un correo registrado"}, status=status.HTTP_400_BAD_REQUEST)
 
+            duplicado = respuesta_duplicado('asignatura_docente', persona, mensaje, asignacion_ids)
+            if duplicado:
+                return duplicado
+
             # 🚀 Enviar email de forma asíncrona usando Celery
             task_result = enviar_email_asignatura_task.delay(
                 persona_id=persona_id,
-                mensaje=mensaje
+                mensaje=mensaje,
+                asignacion_ids=asignacion_ids,
             )
 
             logger.info(f"Tarea de envío de email para asignatura programada con ID: {task_result.id}")
@@ -131,8 +236,6 @@ class NotificacionViewSet(viewsets.ModelViewSet):
 
         except Persona.DoesNotExist:
             return Response({"error": "Persona no encontrada"}, status=status.HTTP_404_NOT_FOUND)
-        except AsignaturaDocente.DoesNotExist:
-            return Response({"error": "No se encontró la asignatura del docente"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error inesperado al crear notificación de asignatura: {str(e)}")
             return Response({"error": "Error interno del servidor"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
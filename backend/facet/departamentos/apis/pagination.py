@@ -1,7 +1,299 @@
-from rest_framework.pagination import LimitOffsetPagination
+import base64
+import json
 
-class StandardResultsSetPagination(LimitOffsetPagination):
+from functools import partial
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import cached_property
+from django.db.models import Q
+from rest_framework.exceptions import ParseError
+from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .conteo import contar
+
+
+def _valor_campo(obj, campo, pk='id'):
+    """Obtiene el valor de un campo de ordenamiento (admite rutas 'relacion__campo')."""
+    if isinstance(obj, dict):
+        # Las filas de values() traen la clave primaria por su nombre, no como 'pk'
+        return obj[pk if campo == 'pk' and 'pk' not in obj else campo]
+    valor = obj
+    for parte in campo.split('__'):
+        if valor is None:
+            return None
+        valor = getattr(valor, parte)
+    return valor
+
+
+def obtener_ordenamiento_keyset(queryset):
+    """
+    Devuelve el ordenamiento usado por el modo cursor como lista de (campo, descendente).
+
+    Se toma el order_by explícito del queryset o, si no tiene, el Meta.ordering del modelo.
+    Siempre se agrega la clave primaria al final para que el cursor sea único y estable.
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering or []
+    campos = []
+    for campo in ordering:
+        if not isinstance(campo, str) or campo == '?':
+            continue
+        descendente = campo.startswith('-')
+        nombre = campo.lstrip('-')
+        if nombre == queryset.model._meta.pk.name:
+            nombre = 'pk'
+        campos.append((nombre, descendente))
+    if not any(nombre == 'pk' for nombre, _ in campos):
+        campos.append(('pk', False))
+    return campos
+
+
+def filtro_keyset(campos, posicion):
+    """
+    Construye la condición "fila posterior a la posición" para un ordenamiento compuesto:
+    (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)
+    """
+    condicion = Q()
+    for indice, (campo, descendente) in enumerate(campos):
+        lookup = 'lt' if descendente else 'gt'
+        parcial = Q(**{f'{campo}__{lookup}': posicion[indice]})
+        for anterior, (campo_anterior, _) in enumerate(campos[:indice]):
+            parcial &= Q(**{campo_anterior: posicion[anterior]})
+        condicion |= parcial
+    return condicion
+
+
+class KeysetPaginationMixin:
+    """
+    Agrega un modo de paginación por cursor (keyset) a los paginadores estándar.
+
+    Se activa con ?paginacion=cursor (o al recibir un ?cursor=...). En este modo no se
+    ejecuta COUNT(*) ni OFFSET: cada página filtra a partir de los valores de ordenamiento
+    de la última fila, por lo que el costo no crece con la profundidad de la página.
+    Sin el parámetro, el paginador se comporta exactamente como antes.
+    """
+    mode_query_param = 'paginacion'
+    cursor_query_param = 'cursor'
+    keyset_page_size_query_params = ('page_size', 'limit')
+    keyset_default_page_size = 10
+    keyset_max_page_size = 100
+    invalid_cursor_message = 'Cursor inválido'
+
+    keyset = False
+
+    def is_keyset_request(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Un UNION no admite filtros posteriores: se pagina siempre por número de página u offset
+        self.keyset = self.is_keyset_request(request) and not queryset.query.combinator
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_keyset(queryset, request)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_keyset_link(self.keyset_next),
+            'previous': self.get_keyset_link(self.keyset_previous),
+            'results': data,
+        })
+
+    def get_keyset_page_size(self, request):
+        for param in self.keyset_page_size_query_params:
+            try:
+                page_size = int(request.query_params[param])
+            except (KeyError, ValueError):
+                continue
+            if page_size > 0:
+                return min(page_size, self.keyset_max_page_size)
+        return self.keyset_default_page_size
+
+    def paginate_keyset(self, queryset, request):
+        self.request = request
+        page_size = self.get_keyset_page_size(request)
+        campos = obtener_ordenamiento_keyset(queryset)
+
+        posicion, reverso = self.decode_cursor(request, len(campos))
+        if reverso:
+            # Para retroceder se invierte el orden y luego se da vuelta la página
+            campos_consulta = [(campo, not descendente) for campo, descendente in campos]
+        else:
+            campos_consulta = campos
+
+        queryset = queryset.order_by(*[
+            f"-{campo}" if descendente else campo for campo, descendente in campos_consulta
+        ])
+        if posicion is not None:
+            try:
+                queryset = queryset.filter(filtro_keyset(campos_consulta, posicion))
+            except (TypeError, ValueError, ValidationError):
+                raise ParseError(self.invalid_cursor_message)
+
+        resultados = list(queryset[:page_size + 1])
+        hay_mas = len(resultados) > page_size
+        resultados = resultados[:page_size]
+        if reverso:
+            resultados.reverse()
+
+        if reverso:
+            hay_siguiente, hay_anterior = posicion is not None, hay_mas
+        else:
+            hay_siguiente, hay_anterior = hay_mas, posicion is not None
+
+        self.keyset_next = None
+        self.keyset_previous = None
+        pk = queryset.model._meta.pk.name
+        if resultados:
+            if hay_siguiente:
+                self.keyset_next = ([_valor_campo(resultados[-1], c, pk) for c, _ in campos], False)
+            if hay_anterior:
+                self.keyset_previous = ([_valor_campo(resultados[0], c, pk) for c, _ in campos], True)
+        return resultados
+
+    def encode_cursor(self, posicion, reverso):
+        contenido = json.dumps({'p': posicion, 'r': reverso}, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(contenido.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request, cantidad_campos):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            contenido = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+            posicion = contenido['p']
+            reverso = bool(contenido.get('r', False))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise ParseError(self.invalid_cursor_message)
+        if not isinstance(posicion, list) or len(posicion) != cantidad_campos:
+            raise ParseError(self.invalid_cursor_message)
+        return posicion, reverso
+
+    def get_keyset_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        # Los parámetros de los otros modos no aplican cuando se navega por cursor
+        for param in ('page', 'offset'):
+            url = remove_query_param(url, param)
+        url = replace_query_param(url, self.mode_query_param, 'cursor')
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(*cursor))
+
+
+class ConteoPaginationMixin:
+    """
+    Obtiene el total mediante la estrategia de conteo (cache, estimación o COUNT exacto)
+    y agrega 'count_exacto' a la respuesta para que el cliente muestre "aprox. N".
+    """
+    count_exacto = True
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if 'count' in response.data:
+            response.data = {
+                'count': response.data['count'],
+                'count_exacto': self.count_exacto,
+                **{clave: valor for clave, valor in response.data.items() if clave != 'count'},
+            }
+        return response
+
+
+class ConteoLimitOffsetMixin(ConteoPaginationMixin):
+
+    def get_count(self, queryset):
+        total, self.count_exacto = contar(queryset, self.request)
+        return total
+
+    def paginate_queryset(self, queryset, request, view=None):
+        resultados = super().paginate_queryset(queryset, request, view)
+        if resultados is None or self.count_exacto:
+            return resultados
+
+        # Con un total estimado la página se pide igual, aunque el offset lo supere
+        if not resultados:
+            resultados = list(queryset[self.offset:self.offset + self.limit])
+        if resultados and len(resultados) < self.limit:
+            # Página incompleta: es la última, así que el total pasa a ser exacto
+            self.count = self.offset + len(resultados)
+            self.count_exacto = True
+        else:
+            self.count = max(self.count, self.offset + self.limit + 1)
+        return resultados
+
+
+class ConteoPaginator(Paginator):
+    """Paginator de Django que usa la estrategia de conteo y tolera totales estimados."""
+
+    def __init__(self, *args, request=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request = request
+        self.count_exacto = True
+
+    @cached_property
+    def count(self):
+        total, self.count_exacto = contar(self.object_list, self.request)
+        return total
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # Con un total estimado no se puede saber cuál es la última página
+            if self.count_exacto or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        total = self.count
+        if self.count_exacto:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        resultados = list(self.object_list[bottom:bottom + self.per_page])
+        if not resultados and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        if len(resultados) < self.per_page:
+            self.count = bottom + len(resultados)
+            self.count_exacto = True
+        else:
+            self.count = max(total, bottom + self.per_page + 1)
+        self.__dict__.pop('num_pages', None)
+        return self._get_page(resultados, number, self)
+
+
+class ConteoPageNumberMixin(ConteoPaginationMixin):
+
+    @property
+    def django_paginator_class(self):
+        return partial(ConteoPaginator, request=self.request)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        resultados = super().paginate_queryset(queryset, request, view)
+        if resultados is not None:
+            self.count_exacto = self.page.paginator.count_exacto
+        return resultados
+
+
+class StandardResultsSetPagination(KeysetPaginationMixin, ConteoLimitOffsetMixin, LimitOffsetPagination):
     default_limit = 10
     limit_query_param = 'limit'
     offset_query_param = 'offset'
-    max_limit = 100 
\ No newline at end of file
+    max_limit = 100
+
+
+class PageResultsSetPagination(KeysetPaginationMixin, ConteoPageNumberMixin, PageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class DefaultResultsSetPagination(KeysetPaginationMixin, ConteoLimitOffsetMixin, LimitOffsetPagination):
+    """Equivalente a la paginación por defecto de DRF (limit/offset sin máximo) con modo cursor."""
+    pass
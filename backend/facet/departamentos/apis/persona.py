@@ -1,20 +1,87 @@
 from rest_framework import viewsets, filters, status
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import AllowAny
-from rest_framework.filters import SearchFilter
 from ..models import Persona
 from ..serializers import PersonaSerializer
+from ..serializers.campos import pedido_de_campos
+from .pagination import DefaultResultsSetPagination
+from .mixins import SoftDeleteViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
+from .exportacion import ExportacionViewSetMixin, texto_estado
+from .search import TrigramSearchFilter
+from .proyeccion import Proyeccion
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from datetime import date, timedelta
+from django.db.models import Case, DateField, F, Func, IntegerField, Q, Value, When
 from django.utils import timezone
 
-class PersonaViewSet(viewsets.ModelViewSet):
+EDADES_JUBILACION = (65, 70)
+HORIZONTE_JUBILACION = 2
+# Con más de 5 años las ventanas de 65 y 70 se superpondrían
+MAX_HORIZONTE_JUBILACION = 5
+
+PROYECCION_PERSONA = Proyeccion({
+    'id': 'id',
+    'nombre': 'nombre',
+    'apellido': 'apellido',
+    'telefono': 'telefono',
+    'dni': 'dni',
+    'estado': 'estado',
+    'email': 'email',
+    'interno': 'interno',
+    'legajo': 'legajo',
+    'titulo': 'titulo__nombre',
+    'fecha_nacimiento': 'fecha_nacimiento',
+})
+
+
+def sumar_anios(fecha, anios):
+    """Suma (o resta) años a una fecha; el 29/02 pasa al 28/02 en años no bisiestos."""
+    try:
+        return fecha.replace(year=fecha.year + anios)
+    except ValueError:
+        return fecha.replace(year=fecha.year + anios, day=28)
+
+
+class Edad(Func):
+    """Años cumplidos entre dos fechas, con age() de PostgreSQL (en SQLite, comparando año y mes-día)."""
+    template = "date_part('year', age(%(expressions)s))::integer"
+    output_field = IntegerField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        (hasta, params_hasta), (desde, params_desde) = [
+            compiler.compile(expresion) for expresion in self.get_source_expressions()
+        ]
+        sql = (
+            f"(CAST(strftime('%%Y', {hasta}) AS integer) - CAST(strftime('%%Y', {desde}) AS integer)"
+            f" - (strftime('%%m-%%d', {hasta}) < strftime('%%m-%%d', {desde})))"
+        )
+        return sql, (*params_hasta, *params_desde, *params_hasta, *params_desde)
+
+
+class SumarAnios(Func):
+    """fecha + `anios` años en SQL, con el mismo criterio que sumar_anios para el 29/02."""
+    template = "(%(expressions)s + make_interval(years => %(anios)d))::date"
+    output_field = DateField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # date() de SQLite lleva el 29/02 al 01/03 en años no bisiestos: se corrige al 28/02
+        fecha, params = compiler.compile(self.get_source_expressions()[0])
+        modificador = f"'{self.extra['anios']:+d} years'"
+        sql = (
+            f"CASE WHEN strftime('%%m-%%d', {fecha}) = '02-29'"
+            f" AND strftime('%%m-%%d', date({fecha}, {modificador})) = '03-01'"
+            f" THEN date({fecha}, {modificador}, '-1 day') ELSE date({fecha}, {modificador}) END"
+        )
+        return sql, (*params, *params, *params, *params)
+
+
+class PersonaViewSet(ExportacionViewSetMixin, CamposDinamicosViewSetMixin, SoftDeleteViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = Persona.objects.select_related('titulo').filter(estado='1')  # Solo objetos activos por defecto
+    queryset = Persona.objects.select_related('titulo')
     serializer_class = PersonaSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    pagination_class = DefaultResultsSetPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = {
         'estado': ['exact'],       # Filtrar por estado exacto (0 o 1)
         'legajo': ['icontains'],       
@@ -24,144 +91,85 @@ class PersonaViewSet(viewsets.ModelViewSet):
         'fecha_nacimiento': ['exact', 'gte', 'lte'],  # Filtrar por fecha de nacimiento
     }
     search_fields = ['nombre', 'apellido', 'dni', 'legajo']
-
-    def destroy(self, request, *args, **kwargs):
-        """Soft delete: cambia el estado a '0' en lugar de eliminar físicamente"""
-        instance = self.get_object()
-        instance.estado = '0'  # Marcar como inactivo
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def get_queryset(self):
-        """
-        Permite obtener todos los objetos (incluyendo inactivos) si se especifica el parámetro 'show_all'
-        o si se filtra explícitamente por estado
-        """
-        queryset = Persona.objects.select_related('titulo').all()
-        
-        # Si se especifica show_all, mostrar todos
-        if self.request.query_params.get('show_all', False):
-            return queryset
-            
-        # Si se filtra explícitamente por estado, no aplicar filtro automático
-        if 'estado' in self.request.query_params:
-            return queryset
-            
-        # Por defecto, mostrar solo activos
-        return queryset.filter(estado='1')
+    nombre_exportacion = 'personas'
+    columnas_exportacion = [
+        ('Nombre', 'nombre'),
+        ('Apellido', 'apellido'),
+        ('DNI', 'dni'),
+        ('Legajo', 'legajo'),
+        ('Teléfono', 'telefono'),
+        ('Email', 'email'),
+        ('Interno', 'interno'),
+        ('Título', 'titulo__nombre'),
+        ('Fecha de Nacimiento', 'fecha_nacimiento'),
+        ('Estado', 'estado', texto_estado),
+    ]
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        # Debugging: Verificar que se ejecuta el método
+        proyeccion = PROYECCION_PERSONA
+        pedido = pedido_de_campos(request)
+        if pedido is not None:
+            proyeccion = proyeccion.recortar(pedido[0])
+        queryset = proyeccion.valores(self.filter_queryset(self.get_queryset()))
 
         # Aplica paginación si está configurada en DRF
         page = self.paginate_queryset(queryset)
         if page is not None:
-            personas_data = [
-                {
-                    'id': persona.id,
-                    'nombre': persona.nombre,
-                    'apellido': persona.apellido,
-                    'telefono': persona.telefono,
-                    'dni': persona.dni,
-                    'estado': persona.estado,
-                    'email': persona.email,
-                    'interno': persona.interno,
-                    'legajo': persona.legajo,
-                    'titulo': persona.titulo.nombre if persona.titulo else None,
-                    'fecha_nacimiento': persona.fecha_nacimiento
-                }
-                for persona in page
-            ]
-            return self.get_paginated_response(personas_data)
+            return self.get_paginated_response(proyeccion.construir(page))
 
         # Si no hay paginación, devolver la lista completa
-        personas_data = [
-            {
-                'id': persona.id,
-                'nombre': persona.nombre,
-                'apellido': persona.apellido,
-                'telefono': persona.telefono,
-                'dni': persona.dni,
-                'estado': persona.estado,
-                'email': persona.email,
-                'interno': persona.interno,
-                'legajo': persona.legajo,
-                'titulo': persona.titulo.nombre if persona.titulo else None,
-                'fecha_nacimiento': persona.fecha_nacimiento
-            }
-            for persona in queryset
-        ]
-
-        return Response(personas_data)
+        return Response(proyeccion.construir(queryset))
 
     @action(detail=False, methods=['get'], url_path='proximos-jubilados')
     def proximos_jubilados(self, request):
-        """Obtiene personas próximas a jubilarse (65 y 70 años)"""
-        edad_65 = request.query_params.get('edad_65', 'true').lower() == 'true'
-        edad_70 = request.query_params.get('edad_70', 'true').lower() == 'true'
-        
-        hoy = date.today()
-        personas_jubilacion = []
-        
-        # Calcular fechas de referencia
-        if edad_65:
-            # Personas que cumplen 65 años en los próximos 2 años
-            fecha_65_inicio = hoy - timedelta(days=65*365)
-            fecha_65_fin = hoy - timedelta(days=63*365)
-            
-            personas_65 = self.get_queryset().filter(
-                fecha_nacimiento__gte=fecha_65_fin,
-                fecha_nacimiento__lte=fecha_65_inicio
-            )
-            
-            for persona in personas_65:
-                if persona.fecha_nacimiento:
-                    edad_actual = (hoy - persona.fecha_nacimiento).days // 365
-                    personas_jubilacion.append({
-                        'id': persona.id,
-                        'nombre': persona.nombre,
-                        'apellido': persona.apellido,
-                        'dni': persona.dni,
-                        'legajo': persona.legajo,
-                        'fecha_nacimiento': persona.fecha_nacimiento,
-                        'edad_actual': edad_actual,
-                        'tipo_jubilacion': '65 años',
-                        'email': persona.email,
-                        'titulo': persona.titulo.nombre if persona.titulo else None
-                    })
-        
-        if edad_70:
-            # Personas que cumplen 70 años en los próximos 2 años
-            fecha_70_inicio = hoy - timedelta(days=70*365)
-            fecha_70_fin = hoy - timedelta(days=68*365)
-            
-            personas_70 = self.get_queryset().filter(
-                fecha_nacimiento__gte=fecha_70_fin,
-                fecha_nacimiento__lte=fecha_70_inicio
+        """
+        Personas que cumplen 65 o 70 años dentro del horizonte (?horizonte=<años>, por defecto 2).
+        La edad exacta, el tramo y la fecha en que se alcanza se calculan en la base en una sola
+        consulta, paginada y ordenada por fecha de jubilación. ?edad_65=false o ?edad_70=false
+        excluyen un tramo.
+        """
+        edades = [
+            edad for edad in EDADES_JUBILACION
+            if request.query_params.get(f'edad_{edad}', 'true').lower() == 'true'
+        ]
+        try:
+            horizonte = int(request.query_params.get('horizonte', HORIZONTE_JUBILACION))
+        except ValueError:
+            horizonte = 0
+        if not 1 <= horizonte <= MAX_HORIZONTE_JUBILACION:
+            return Response(
+                {"error": f"'horizonte' debe ser un entero entre 1 y {MAX_HORIZONTE_JUBILACION}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            
-            for persona in personas_70:
-                if persona.fecha_nacimiento:
-                    edad_actual = (hoy - persona.fecha_nacimiento).days // 365
-                    personas_jubilacion.append({
-                        'id': persona.id,
-                        'nombre': persona.nombre,
-                        'apellido': persona.apellido,
-                        'dni': persona.dni,
-                        'legajo': persona.legajo,
-                        'fecha_nacimiento': persona.fecha_nacimiento,
-                        'edad_actual': edad_actual,
-                        'tipo_jubilacion': '70 años',
-                        'email': persona.email,
-                        'titulo': persona.titulo.nombre if persona.titulo else None
-                    })
-        
-        # Ordenar por edad (mayor a menor)
-        personas_jubilacion.sort(key=lambda x: x['edad_actual'], reverse=True)
-        
-        return Response({
-            'count': len(personas_jubilacion),
-            'results': personas_jubilacion
-        })
+
+        hoy = timezone.localdate()
+        fin = sumar_anios(hoy, horizonte)
+        ventanas = Q()
+        tramos = []
+        fechas = []
+        for edad in edades:
+            # Cumple `edad` entre hoy y fin <=> nació entre hoy - edad y fin - edad
+            rango = (sumar_anios(hoy, -edad), sumar_anios(fin, -edad))
+            ventanas |= Q(fecha_nacimiento__range=rango)
+            tramos.append(When(fecha_nacimiento__range=rango, then=Value(edad)))
+            fechas.append(When(fecha_nacimiento__range=rango, then=SumarAnios(F('fecha_nacimiento'), anios=edad)))
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.filter(ventanas) if edades else queryset.none()
+        queryset = queryset.annotate(
+            edad_actual=Edad(Value(hoy, output_field=DateField()), F('fecha_nacimiento')),
+            edad_jubilacion=Case(*tramos, default=None, output_field=IntegerField()),
+            fecha_jubilacion=Case(*fechas, default=None, output_field=DateField()),
+        ).order_by('fecha_jubilacion', 'apellido', 'nombre', 'id').values(
+            'id', 'nombre', 'apellido', 'dni', 'legajo', 'email', 'fecha_nacimiento',
+            'edad_actual', 'edad_jubilacion', 'fecha_jubilacion', 'titulo__nombre',
+        )
+
+        page = self.paginate_queryset(queryset)
+        personas = page if page is not None else list(queryset)
+        for persona in personas:
+            persona['titulo'] = persona.pop('titulo__nombre')
+            persona['tipo_jubilacion'] = f"{persona['edad_jubilacion']} años"
+        if page is not None:
+            return self.get_paginated_response(personas)
+        return Response({'count': len(personas), 'results': personas})
@@ -0,0 +1,109 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class PlanConsulta:
+    """
+    Lo que lee un serializer sobre su modelo: relaciones para select_related, relaciones a
+    varios para prefetch_related y columnas para only() (None si no se pueden determinar).
+    """
+
+    def __init__(self):
+        self.select_related = set()
+        self.prefetch_related = set()
+        self.columnas = []
+
+    def agregar_columna(self, ruta):
+        if self.columnas is not None and ruta not in self.columnas:
+            self.columnas.append(ruta)
+
+    def agregar_ruta(self, modelo, ruta, prefijo='', objeto=False):
+        """
+        Registra una ruta ORM ('persona__nombre') leída desde `modelo`. Los tramos hacia una
+        sola fila van a select_related; desde la primera relación a varios, a prefetch. Con
+        `objeto` el último tramo también es una relación y se carga el objeto completo.
+        """
+        partes = ruta.split('__')
+        relaciones = partes if objeto else partes[:-1]
+        actual = modelo
+        for i, parte in enumerate(relaciones):
+            try:
+                campo = actual._meta.get_field(parte)
+            except FieldDoesNotExist:
+                self.columnas = None
+                return
+            if not campo.is_relation:
+                self.columnas = None
+                return
+            if campo.many_to_many or campo.one_to_many:
+                self.prefetch_related.add(prefijo + '__'.join(relaciones))
+                if i:
+                    # only() sobre la relación la trae completa para que el prefetch parta de ella
+                    self.agregar_columna(prefijo + '__'.join(partes[:i]))
+                return
+            self.select_related.add(prefijo + '__'.join(partes[:i + 1]))
+            actual = campo.related_model
+
+        if not objeto and partes[-1] != 'pk':
+            try:
+                if not actual._meta.get_field(partes[-1]).concrete:
+                    self.columnas = None
+                    return
+            except FieldDoesNotExist:
+                # Propiedad o atributo calculado: no se sabe qué columnas lee
+                self.columnas = None
+                return
+        self.agregar_columna(prefijo + ruta)
+
+
+def planificar_consulta(serializer, modelo, plan=None, prefijo=''):
+    """
+    Recorre el árbol de `serializer` (ya recortado por ?fields=/?expand=, si corresponde) y
+    deriva el PlanConsulta que evita consultas por fila:
+
+    - serializers anidados sobre una clave foránea o uno a uno: select_related, y se recorre
+      el anidado; anidados many=True y relaciones a varios: prefetch_related;
+    - `source` con puntos ('persona.nombre') y relaciones por slug o texto: select_related;
+    - SerializerMethodField: las rutas declaradas en `campos_fuente` del serializer;
+    - PrimaryKeyRelatedField: solo la columna <relacion>_id, DRF no carga el objeto.
+    """
+    plan = plan if plan is not None else PlanConsulta()
+    campos_fuente = getattr(serializer, 'campos_fuente', {})
+    for nombre, campo in serializer.fields.items():
+        if nombre in campos_fuente:
+            for ruta in campos_fuente[nombre]:
+                plan.agregar_ruta(modelo, ruta, prefijo)
+            continue
+        if campo.source == '*':
+            plan.columnas = None
+            continue
+
+        ruta = '__'.join(campo.source_attrs)
+        if isinstance(campo, serializers.ListSerializer):
+            plan.agregar_ruta(modelo, ruta, prefijo, objeto=True)
+            try:
+                relacionado = modelo._meta.get_field(ruta).related_model
+            except FieldDoesNotExist:
+                continue
+            # Las relaciones del hijo se precargan a partir de la lista
+            anidado = planificar_consulta(campo.child, relacionado)
+            plan.prefetch_related.update(
+                f'{prefijo}{ruta}__{relacion}' for relacion in anidado.select_related | anidado.prefetch_related
+            )
+        elif isinstance(campo, serializers.BaseSerializer):
+            relacion = prefijo + ruta
+            plan.agregar_ruta(modelo, ruta, prefijo, objeto=True)
+            if len(campo.source_attrs) == 1 and relacion in plan.select_related:
+                # En lugar del objeto completo, only() lista las columnas que lee el anidado
+                if plan.columnas is not None:
+                    plan.columnas.remove(relacion)
+                planificar_consulta(campo, modelo._meta.get_field(ruta).related_model, plan, relacion + '__')
+                if plan.columnas is not None and not any(c.startswith(relacion + '__') for c in plan.columnas):
+                    plan.agregar_columna(relacion)
+        elif isinstance(campo, serializers.PrimaryKeyRelatedField):
+            plan.agregar_ruta(modelo, ruta, prefijo, objeto=len(campo.source_attrs) > 1)
+        elif isinstance(campo, (serializers.RelatedField, serializers.ManyRelatedField)):
+            plan.agregar_ruta(modelo, ruta, prefijo, objeto=True)
+        else:
+            plan.agregar_ruta(modelo, ruta, prefijo)
+    return plan
@@ -0,0 +1,130 @@
+from operator import attrgetter
+
+
+class Campo:
+    """Hoja de una proyección: ruta ORM ('jefe__persona__email') y formato opcional del valor."""
+
+    def __init__(self, ruta, formato=None):
+        self.ruta = ruta
+        self.formato = formato
+
+
+class Relacion:
+    """
+    Objeto anidado: las rutas de `forma` son relativas a `ruta`. Con `nula=True` el objeto
+    completo es None cuando la clave foránea es nula (la ruta sola devuelve su id).
+    """
+
+    def __init__(self, ruta, forma, nula=False):
+        self.ruta = ruta
+        self.forma = forma
+        self.nula = nula
+
+
+def _recortar_forma(forma, campos):
+    recortada = {}
+    for clave, valor in forma.items():
+        if clave not in campos:
+            continue
+        if isinstance(valor, Relacion) and campos[clave]:
+            valor = Relacion(valor.ruta, _recortar_forma(valor.forma, campos[clave]), valor.nula)
+        recortada[clave] = valor
+    return recortada
+
+
+class Proyeccion:
+    """
+    Forma de una respuesta declarada como dict: clave -> ruta ORM, Campo o Relacion.
+
+    Se compila una vez a la lista de rutas de un único `values()` (con los JOIN que Django
+    deduce de las rutas) y a un armador que completa el JSON anidado desde cada fila, sin
+    instanciar modelos ni pasar por serializers. `desde_instancia` arma la misma forma desde
+    un objeto del modelo, para comparar o para objetos ya cargados.
+
+        PROYECCION = Proyeccion({
+            'id': 'id',
+            'jefe': Relacion('jefe', {'id': 'id', 'persona': Relacion('persona', {'dni': 'dni'})}),
+        })
+        filas = PROYECCION.valores(queryset)
+        data = PROYECCION.construir(paginator.paginate_queryset(filas, request))
+    """
+
+    def __init__(self, forma):
+        self.forma = forma
+        self.rutas = []
+        self.relaciones = []
+        self._armador = self._compilar(forma, '')
+
+    def _ruta(self, ruta):
+        if ruta not in self.rutas:
+            self.rutas.append(ruta)
+        return ruta
+
+    def _compilar(self, forma, prefijo):
+        partes = []
+        for clave, valor in forma.items():
+            if isinstance(valor, Relacion):
+                ruta = prefijo + valor.ruta
+                self.relaciones.append(ruta)
+                nula = self._ruta(ruta) if valor.nula else None
+                partes.append((clave, None, None, self._compilar(valor.forma, ruta + '__'), nula))
+            else:
+                campo = valor if isinstance(valor, Campo) else Campo(valor)
+                partes.append((clave, self._ruta(prefijo + campo.ruta), campo.formato, None, None))
+
+        def armar(fila):
+            objeto = {}
+            for clave, ruta, formato, armador, nula in partes:
+                if armador is not None:
+                    objeto[clave] = None if nula is not None and fila[nula] is None else armador(fila)
+                elif formato is not None:
+                    objeto[clave] = formato(fila[ruta])
+                else:
+                    objeto[clave] = fila[ruta]
+            return objeto
+        return armar
+
+    def valores(self, queryset):
+        """
+        El queryset proyectado a las rutas (más la clave primaria y los campos de orden, que
+        necesita el modo cursor de la paginación aunque ?fields= no los pida); sigue siendo
+        perezoso y se puede filtrar o paginar.
+        """
+        rutas = list(self.rutas)
+        for campo in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(campo, str) and campo.lstrip('-') not in rutas:
+                rutas.append(campo.lstrip('-'))
+        pk = queryset.model._meta.pk.name
+        if pk not in rutas and 'pk' not in rutas:
+            rutas.append(pk)
+        return queryset.values(*rutas)
+
+    def recortar(self, campos):
+        """
+        Proyección con solo las claves de `campos`, un árbol de rutas como el de ?fields=
+        ({'id': {}, 'jefe': {'persona': {}}}); una relación sin subclaves queda completa.
+        """
+        if not campos:
+            return self
+        return Proyeccion(_recortar_forma(self.forma, campos))
+
+    def construir(self, filas):
+        return [self._armador(fila) for fila in filas]
+
+    def construir_uno(self, fila):
+        return self._armador(fila)
+
+    def desde_instancia(self, objeto):
+        """Misma forma desde una instancia (recorriendo atributos); usar con select_related(*relaciones)."""
+        valores = {}
+        for ruta in self.rutas:
+            try:
+                valores[ruta] = attrgetter(ruta.replace('__', '.'))(objeto)
+            except AttributeError:
+                # Una relación nula corta el recorrido: igual que el LEFT JOIN de values()
+                valores[ruta] = None
+        # La ruta de una relación sola es su clave foránea, no el objeto relacionado
+        for ruta in self.relaciones:
+            if ruta in valores and valores[ruta] is not None:
+                valores[ruta] = valores[ruta].pk
+        return self._armador(valores)
@@ -0,0 +1,197 @@
+from datetime import date
+
+from django.db.models import Count, F, Q, Sum
+from django.utils.timezone import now
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from ..models import (
+    ActualizacionReporte, ReporteJefatura, ReportePlantaDocente, ReporteVacante, ReporteVencimiento,
+)
+from ..reportes import REPORTES
+from ..tasks import actualizar_reportes_task
+
+
+def parametro_entero(request, campo):
+    """Lee un entero opcional de la query string; devuelve (valor o None, error)."""
+    valor = request.query_params.get(campo)
+    if valor in (None, ''):
+        return None, None
+    try:
+        return int(valor), None
+    except ValueError:
+        return None, f"'{campo}' debe ser un entero"
+
+
+def parametro_mes(request, campo):
+    """Lee un mes opcional con formato AAAA-MM; devuelve (primer día del mes o None, error)."""
+    valor = request.query_params.get(campo)
+    if valor in (None, ''):
+        return None, None
+    try:
+        anio, mes = valor.split('-')
+        return date(int(anio), int(mes), 1), None
+    except ValueError:
+        return None, f"'{campo}' debe tener el formato AAAA-MM"
+
+
+class ReporteViewSet(viewsets.ViewSet):
+    """
+    Reportes agregados, leídos de las tablas de reportes (ver reportes.py) en lugar de
+    recorrer los endpoints paginados. Las tablas se recalculan cada hora o con POST
+    /actualizar; cada respuesta indica cuándo se calcularon (`actualizado`, `antiguedad` en segundos).
+    """
+
+    def respuesta(self, reporte, results, **extra):
+        actualizacion = ActualizacionReporte.objects.filter(reporte=reporte).first()
+        return Response({
+            "reporte": reporte,
+            "actualizado": actualizacion.fecha_actualizacion if actualizacion else None,
+            "antiguedad": round((now() - actualizacion.fecha_actualizacion).total_seconds()) if actualizacion else None,
+            **extra,
+            "results": list(results),
+        })
+
+    def list(self, request):
+        """Estado de cada reporte: última actualización, duración y filas."""
+        actualizaciones = {a.reporte: a for a in ActualizacionReporte.objects.all()}
+        momento = now()
+        data = []
+        for reporte in REPORTES:
+            actualizacion = actualizaciones.get(reporte)
+            data.append({
+                "reporte": reporte,
+                "actualizado": actualizacion.fecha_actualizacion if actualizacion else None,
+                "antiguedad": round((momento - actualizacion.fecha_actualizacion).total_seconds()) if actualizacion else None,
+                "duracion_ms": actualizacion.duracion_ms if actualizacion else None,
+                "filas": actualizacion.filas if actualizacion else 0,
+            })
+        return Response(data)
+
+    @action(detail=False, methods=['post'])
+    def actualizar(self, request):
+        """Encola el recálculo de los reportes. Body opcional: {"reportes": ["vacantes", ...]}"""
+        reportes = request.data.get('reportes')
+        if reportes is not None:
+            if not isinstance(reportes, list) or set(reportes) - set(REPORTES):
+                return Response(
+                    {"error": f"'reportes' debe ser una lista con: {', '.join(REPORTES)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        task_result = actualizar_reportes_task.delay(reportes)
+        return Response({"task_id": task_result.id}, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=['get'], url_path='planta-docente')
+    def planta_docente(self, request):
+        """
+        Asignaciones vigentes, docentes y asignaturas por departamento.
+        ?agrupacion=total|cargo|dedicacion|condicion|detalle (por defecto total),
+        ?departamento=<id>, ?cargo=, ?dedicacion=, ?condicion=.
+        Las filas sin departamento son los totales de la facultad.
+        """
+        agrupacion = request.query_params.get('agrupacion', 'total')
+        agrupaciones = [opcion for opcion, _ in ReportePlantaDocente.AGRUPACION_CHOICES]
+        if agrupacion not in agrupaciones:
+            return Response(
+                {"error": f"'agrupacion' debe ser una de: {', '.join(agrupaciones)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        departamento, error = parametro_entero(request, 'departamento')
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = ReportePlantaDocente.objects.filter(agrupacion=agrupacion)
+        if departamento is not None:
+            queryset = queryset.filter(departamento_id=departamento)
+        for campo in ('cargo', 'dedicacion', 'condicion'):
+            if request.query_params.get(campo):
+                queryset = queryset.filter(**{campo: request.query_params[campo]})
+
+        results = queryset.order_by(
+            F('departamento__nombre').asc(nulls_first=True), 'cargo', 'dedicacion', 'condicion'
+        ).values(
+            'departamento', 'cargo', 'dedicacion', 'condicion', 'asignaciones', 'docentes', 'asignaturas',
+            departamento_nombre=F('departamento__nombre'),
+        )
+        return self.respuesta('planta_docente', results, agrupacion=agrupacion)
+
+    @action(detail=False, methods=['get'])
+    def vacantes(self, request):
+        """
+        Asignaturas activas sin cobertura vigente.
+        ?sin=docente (sin ningún docente, por defecto) o ?sin=profesor (sin profesor a cargo),
+        ?departamento=<id>. Incluye un resumen por departamento.
+        """
+        sin = request.query_params.get('sin', 'docente')
+        if sin not in ('docente', 'profesor'):
+            return Response({"error": "'sin' debe ser 'docente' o 'profesor'"}, status=status.HTTP_400_BAD_REQUEST)
+        departamento, error = parametro_entero(request, 'departamento')
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = ReporteVacante.objects.all()
+        if departamento is not None:
+            queryset = queryset.filter(departamento_id=departamento)
+
+        resumen = queryset.values('departamento', departamento_nombre=F('departamento__nombre')).annotate(
+            asignaturas=Count('asignatura'),
+            sin_docente=Count('asignatura', filter=Q(docentes=0)),
+            sin_profesor=Count('asignatura', filter=Q(profesores=0)),
+        ).order_by('departamento__nombre')
+
+        vacantes = queryset.filter(docentes=0) if sin == 'docente' else queryset.filter(profesores=0)
+        results = vacantes.order_by('departamento__nombre', 'asignatura__nombre').values(
+            'asignatura', 'departamento', 'area', 'docentes', 'profesores', 'ultimo_vencimiento',
+            asignatura_codigo=F('asignatura__codigo'),
+            asignatura_nombre=F('asignatura__nombre'),
+            departamento_nombre=F('departamento__nombre'),
+            area_nombre=F('area__nombre'),
+        )
+        return self.respuesta('vacantes', results, sin=sin, resumen=list(resumen))
+
+    @action(detail=False, methods=['get'])
+    def vencimientos(self, request):
+        """
+        Asignaciones que vencen por mes desde el mes en curso.
+        ?desde=AAAA-MM, ?hasta=AAAA-MM, ?departamento=<id>,
+        ?tipo=asignatura_docente|jefe_departamento. Incluye los totales por mes.
+        """
+        desde, error_desde = parametro_mes(request, 'desde')
+        hasta, error_hasta = parametro_mes(request, 'hasta')
+        departamento, error_departamento = parametro_entero(request, 'departamento')
+        error = error_desde or error_hasta or error_departamento
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = ReporteVencimiento.objects.all()
+        if desde:
+            queryset = queryset.filter(mes__gte=desde)
+        if hasta:
+            queryset = queryset.filter(mes__lte=hasta)
+        if departamento is not None:
+            queryset = queryset.filter(departamento_id=departamento)
+        if request.query_params.get('tipo'):
+            queryset = queryset.filter(tipo=request.query_params['tipo'])
+
+        totales = queryset.values('mes', 'tipo').annotate(
+            cantidad=Sum('cantidad'), notificadas=Sum('notificadas'),
+        ).order_by('mes', 'tipo')
+        results = queryset.order_by('mes', 'departamento__nombre', 'tipo').values(
+            'mes', 'departamento', 'tipo', 'cantidad', 'notificadas',
+            departamento_nombre=F('departamento__nombre'),
+        )
+        return self.respuesta('vencimientos', results, totales=list(totales))
+
+    @action(detail=False, methods=['get'])
+    def jefaturas(self, request):
+        """Jefatura vigente de cada departamento activo. ?vacantes=true devuelve solo los departamentos sin jefe."""
+        queryset = ReporteJefatura.objects.all()
+        if request.query_params.get('vacantes', '').lower() == 'true':
+            queryset = queryset.filter(jefe_departamento__isnull=True)
+        results = queryset.order_by('departamento__nombre').values(
+            'departamento', 'jefe_departamento', 'apellido', 'nombre', 'nresolucion',
+            'fecha_de_inicio', 'fecha_de_fin', 'jefaturas',
+            departamento_nombre=F('departamento__nombre'),
+        )
+        return self.respuesta('jefaturas', results)
@@ -0,0 +1,54 @@
+from django.db import connections
+from rest_framework.filters import SearchFilter
+
+
+def trigram_disponible(connection):
+    """Indica si la base tiene instalada la extensión pg_trgm (se consulta una vez por conexión)."""
+    if connection.vendor != 'postgresql':
+        return False
+    if not hasattr(connection, '_pg_trgm_disponible'):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            connection._pg_trgm_disponible = cursor.fetchone() is not None
+    return connection._pg_trgm_disponible
+
+
+class TrigramSearchFilter(SearchFilter):
+    """
+    SearchFilter que en PostgreSQL ordena los resultados por similitud trigram.
+
+    El filtrado sigue siendo `icontains` (UPPER(col) LIKE ...), que queda resuelto por los
+    índices GIN pg_trgm de la migración 0005 en lugar de un recorrido secuencial. Sobre el
+    resultado se anota `similitud` (la mayor entre los search_fields) y se ordena por ella.
+    En otros motores (o sin pg_trgm) se comporta igual que el SearchFilter de DRF.
+    """
+    similarity_annotation = 'similitud'
+
+    def filter_queryset(self, request, queryset, view):
+        queryset = super().filter_queryset(request, queryset, view)
+
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+        if not trigram_disponible(connections[queryset.db]):
+            return queryset
+
+        from django.contrib.postgres.search import TrigramSimilarity
+        from django.db.models import FloatField
+        from django.db.models.functions import Cast, Greatest
+
+        termino = ' '.join(search_terms)
+        similitudes = [
+            TrigramSimilarity(campo.lstrip(''.join(self.lookup_prefixes)), termino)
+            for campo in search_fields
+        ]
+        similitud = similitudes[0] if len(similitudes) == 1 else Greatest(*similitudes)
+        # similarity() devuelve real: el cursor lo trae de vuelta como float8 y la fila límite
+        # dejaría de ser igual a sí misma. Con double precision la comparación es exacta.
+        similitud = Cast(similitud, FloatField())
+
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.annotate(**{self.similarity_annotation: similitud}).order_by(
+            f'-{self.similarity_annotation}', *ordering
+        )
@@ -4,11 +4,15 @@ from rest_framework.permissions import AllowAny
 from rest_framework.filters import SearchFilter
 from ..models import TipoTitulo
 from ..serializers import TipoTituloSerializer
+from .pagination import DefaultResultsSetPagination
+from .cache import CacheRespuestaViewSetMixin
+from .campos import CamposDinamicosViewSetMixin
 
-class TipoTituloViewSet(viewsets.ModelViewSet):
+class TipoTituloViewSet(CacheRespuestaViewSetMixin, CamposDinamicosViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = TipoTitulo.objects.all()
     serializer_class = TipoTituloSerializer
+    pagination_class = DefaultResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = {
         'nombre': ['icontains'],  # Filtrar por nombre que contenga el valor especificado
@@ -0,0 +1,69 @@
+from datetime import date
+
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+
+from ..vencimientos import DIAS_AVISO_VENCIMIENTO, TIPOS_VENCIMIENTO, consulta_vencimientos, ventana_vencimientos
+from .pagination import PageResultsSetPagination
+from .reporte import parametro_entero
+
+# Ventana máxima en días, para que la consulta siga siendo un rango acotado de cada índice
+MAX_DIAS_VENCIMIENTO = 366
+
+
+def parametro_fecha(request, campo):
+    """Lee una fecha opcional con formato AAAA-MM-DD; devuelve (fecha o None, error)."""
+    valor = request.query_params.get(campo)
+    if valor in (None, ''):
+        return None, None
+    try:
+        return date.fromisoformat(valor), None
+    except ValueError:
+        return None, f"'{campo}' debe tener el formato AAAA-MM-DD"
+
+
+class VencimientoViewSet(viewsets.ViewSet):
+    """
+    Calendario de vencimientos de jefaturas de departamento, cargos docentes y direcciones
+    de carrera, leído con una única consulta (ver vencimientos.consulta_vencimientos).
+    """
+    pagination_class = PageResultsSetPagination
+
+    def list(self, request):
+        """
+        Asignaciones activas que vencen en la ventana pedida, ordenadas por fecha.
+        ?desde=AAAA-MM-DD (por defecto ahora), ?hasta=AAAA-MM-DD o ?dias=N (por defecto 30),
+        ?tipo=jefe_departamento,asignatura_docente,director_carrera, ?departamento=<id>,
+        ?notificado=true|false. Paginado con ?page y ?page_size.
+        """
+        desde, error_desde = parametro_fecha(request, 'desde')
+        hasta, error_hasta = parametro_fecha(request, 'hasta')
+        dias, error_dias = parametro_entero(request, 'dias')
+        departamento, error_departamento = parametro_entero(request, 'departamento')
+        error = error_desde or error_hasta or error_dias or error_departamento
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        inicio, fin = ventana_vencimientos(desde, hasta, DIAS_AVISO_VENCIMIENTO if dias is None else dias)
+        if fin <= inicio or (fin - inicio).days > MAX_DIAS_VENCIMIENTO:
+            return Response(
+                {"error": f"La ventana debe terminar después de su inicio y abarcar hasta {MAX_DIAS_VENCIMIENTO} días"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        tipos = None
+        if request.query_params.get('tipo'):
+            tipos = request.query_params['tipo'].split(',')
+            if set(tipos) - set(TIPOS_VENCIMIENTO):
+                return Response(
+                    {"error": f"'tipo' debe ser uno o más de: {', '.join(TIPOS_VENCIMIENTO)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        notificado = request.query_params.get('notificado', '').lower()
+        notificado = {'true': True, 'false': False}.get(notificado)
+
+        queryset = consulta_vencimientos(inicio, fin, tipos, departamento, notificado)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        return paginator.get_paginated_response(page)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class DepartamentosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'departamentos'
+
+    def ready(self):
+        from .contadores import conectar_contadores
+        from .invalidacion import conectar_invalidacion
+        conectar_invalidacion()
+        conectar_contadores()
@@ -0,0 +1,153 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .models import ContadorNotificaciones, Notificacion, Persona
+
+TABLA_CONTADORES = ContadorNotificaciones._meta.db_table
+TABLA_NOTIFICACIONES = Notificacion._meta.db_table
+
+# Suma (o resta) deltas por persona; crea el contador si todavía no existe
+SQL_SUMAR = f"""
+    INSERT INTO {TABLA_CONTADORES} AS c (persona_id, total, no_leidas)
+    SELECT * FROM unnest(%s::integer[], %s::integer[], %s::integer[])
+    ON CONFLICT (persona_id) DO UPDATE SET
+        total = c.total + EXCLUDED.total,
+        no_leidas = c.no_leidas + EXCLUDED.no_leidas
+"""
+
+# Marca como leídas y descuenta de los contadores en una sola sentencia
+SQL_MARCAR_LEIDAS = f"""
+    WITH marcadas AS (
+        UPDATE {TABLA_NOTIFICACIONES}
+        SET leido = true, fecha_modificacion = now()
+        WHERE id IN ({{seleccion}}) AND NOT leido
+        RETURNING persona_id
+    ), descontadas AS (
+        INSERT INTO {TABLA_CONTADORES} AS c (persona_id, total, no_leidas)
+        SELECT persona_id, 0, -count(*) FROM marcadas GROUP BY persona_id
+        ON CONFLICT (persona_id) DO UPDATE SET no_leidas = c.no_leidas + EXCLUDED.no_leidas
+    )
+    SELECT count(*) FROM marcadas
+"""
+
+SQL_ELIMINAR = f"""
+    WITH eliminadas AS (
+        DELETE FROM {TABLA_NOTIFICACIONES}
+        WHERE id IN %s
+        RETURNING persona_id, leido
+    ), descontadas AS (
+        INSERT INTO {TABLA_CONTADORES} AS c (persona_id, total, no_leidas)
+        SELECT persona_id, -count(*), -count(*) FILTER (WHERE NOT leido) FROM eliminadas GROUP BY persona_id
+        ON CONFLICT (persona_id) DO UPDATE SET
+            total = c.total + EXCLUDED.total,
+            no_leidas = c.no_leidas + EXCLUDED.no_leidas
+    )
+    SELECT count(*) FROM eliminadas
+"""
+
+SQL_RECALCULAR = f"""
+    INSERT INTO {TABLA_CONTADORES} AS c (persona_id, total, no_leidas)
+    SELECT p.id, count(n.id), count(n.id) FILTER (WHERE NOT n.leido)
+    FROM departamentos_persona p
+    JOIN {TABLA_NOTIFICACIONES} n ON n.persona_id = p.id
+    GROUP BY p.id
+    ON CONFLICT (persona_id) DO UPDATE SET total = EXCLUDED.total, no_leidas = EXCLUDED.no_leidas
+"""
+
+
+def sumar(cambios):
+    """Aplica {persona_id: (delta_total, delta_no_leidas)} en un único upsert."""
+    cambios = {persona_id: delta for persona_id, delta in cambios.items() if any(delta)}
+    if not cambios:
+        return
+    personas = list(cambios)
+    with connection.cursor() as cursor:
+        cursor.execute(SQL_SUMAR, [
+            personas,
+            [cambios[persona_id][0] for persona_id in personas],
+            [cambios[persona_id][1] for persona_id in personas],
+        ])
+
+
+def registrar_creadas(notificaciones):
+    totales = Counter(notificacion.persona_id for notificacion in notificaciones)
+    no_leidas = Counter(notificacion.persona_id for notificacion in notificaciones if not notificacion.leido)
+    sumar({persona_id: (total, no_leidas[persona_id]) for persona_id, total in totales.items()})
+
+
+def registrar_cambio(anterior, notificacion):
+    """Ajusta los contadores tras editar una notificación; `anterior` es (persona_id, leido)."""
+    persona_anterior, leido_anterior = anterior
+    totales = Counter({persona_anterior: 0, notificacion.persona_id: 0})
+    no_leidas = Counter()
+    totales[persona_anterior] -= 1
+    totales[notificacion.persona_id] += 1
+    if not leido_anterior:
+        no_leidas[persona_anterior] -= 1
+    if not notificacion.leido:
+        no_leidas[notificacion.persona_id] += 1
+    sumar({persona_id: (total, no_leidas[persona_id]) for persona_id, total in totales.items()})
+
+
+def marcar_leidas(queryset):
+    """Marca como leídas las notificaciones del queryset en un UPDATE; devuelve cuántas cambiaron."""
+    seleccion, params = queryset.order_by().values('id').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(SQL_MARCAR_LEIDAS.format(seleccion=seleccion), params)
+        return cursor.fetchone()[0]
+
+
+def eliminar(cursor, ids):
+    """Borra las notificaciones `ids` (tupla) descontándolas de los contadores."""
+    cursor.execute(SQL_ELIMINAR, [tuple(ids)])
+    return cursor.fetchone()[0]
+
+
+@transaction.atomic
+def recalcular():
+    """Reconstruye todos los contadores a partir de la tabla de notificaciones."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"UPDATE {TABLA_CONTADORES} SET total = 0, no_leidas = 0")
+        cursor.execute(SQL_RECALCULAR)
+
+
+def _leer_anterior(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Guarda (persona_id, leido) antes de editar, para descontarlo en post_save."""
+    instance._contador_anterior = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not {'persona', 'persona_id', 'leido'} & set(update_fields):
+        return
+    instance._contador_anterior = (
+        Notificacion.objects.filter(pk=instance.pk).values_list('persona_id', 'leido').first()
+    )
+
+
+def _al_guardar(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        registrar_creadas([instance])
+    elif getattr(instance, '_contador_anterior', None):
+        registrar_cambio(instance._contador_anterior, instance)
+
+
+def _al_eliminar(sender, instance, origin=None, **kwargs):
+    # Si se borra la persona, su contador se borra en cascada con las notificaciones
+    if isinstance(origin, Persona) or getattr(origin, 'model', None) is Persona:
+        return
+    sumar({instance.persona_id: (-1, 0 if instance.leido else -1)})
+
+
+def conectar_contadores():
+    """
+    Mantiene los contadores ante cualquier save()/delete() de Notificacion (API, admin u ORM).
+    Las sentencias masivas de este módulo los ajustan por su cuenta; los UPDATE/DELETE por
+    queryset que no pasan por acá los corrige `recalcular_contadores_task`.
+    """
+    uid = 'contadores_notificaciones'
+    pre_save.connect(_leer_anterior, sender=Notificacion, dispatch_uid=uid)
+    post_save.connect(_al_guardar, sender=Notificacion, dispatch_uid=uid)
+    post_delete.connect(_al_eliminar, sender=Notificacion, dispatch_uid=uid)
@@ -0,0 +1,295 @@
+"""
+Facultad sintética para pruebas de rendimiento: personas con sus roles (docente, jefe,
+director, no docente), estructura académica (departamentos, áreas, carreras, asignaturas),
+asignaciones con fechas realistas, resoluciones y notificaciones.
+
+Todo sale de un random.Random(semilla): con la misma semilla, cantidad de personas y base
+de partida se generan los mismos datos. Las cantidades de los demás modelos se derivan de
+`personas`. Las tablas grandes (personas, roles, asignaciones, notificaciones) se generan e
+insertan de a un lote, guardando solo ids: un millón de personas no se arma en memoria.
+Se puede correr sobre una base con datos; DNI, códigos de asignatura y títulos no chocan
+con los existentes.
+"""
+import random
+from datetime import timedelta
+
+from django.db import reset_queries, transaction
+from django.utils import timezone
+
+from . import contadores
+from .models import (
+    Area, Asignatura, AsignaturaCarrera, AsignaturaDocente, Carrera, Departamento, Director,
+    DirectorCarrera, Docente, Jefe, JefeDepartamento, NoDocente, Notificacion, Persona,
+    Resolucion, TipoTitulo,
+)
+
+NOMBRES = [
+    'Ana', 'Juan', 'María', 'José', 'Lucía', 'Carlos', 'Sofía', 'Diego', 'Valentina', 'Martín',
+    'Camila', 'Pablo', 'Florencia', 'Jorge', 'Julieta', 'Ricardo', 'Paula', 'Gustavo', 'Laura',
+    'Sergio', 'Carolina', 'Fernando', 'Agustina', 'Miguel', 'Silvia', 'Raúl', 'Gabriela', 'Luis',
+]
+APELLIDOS = [
+    'González', 'Rodríguez', 'Gómez', 'Fernández', 'López', 'Díaz', 'Martínez', 'Pérez', 'García',
+    'Sánchez', 'Romero', 'Sosa', 'Álvarez', 'Torres', 'Ruiz', 'Ramírez', 'Flores', 'Acosta',
+    'Benítez', 'Medina', 'Herrera', 'Suárez', 'Aguirre', 'Giménez', 'Gutiérrez', 'Pereyra',
+    'Molina', 'Castro', 'Ortiz', 'Silva', 'Núñez', 'Luna', 'Juárez', 'Cabrera', 'Ríos', 'Ledesma',
+]
+DEPARTAMENTOS = [
+    'Informática', 'Física', 'Matemática', 'Química', 'Ingeniería Civil', 'Ingeniería Eléctrica',
+    'Ingeniería Mecánica', 'Ingeniería Industrial', 'Ciencias de la Computación', 'Geodesia',
+    'Bioingeniería', 'Ciencias Básicas',
+]
+TIPOS_CARRERA = ['Pregrado', 'Grado', 'Grado', 'Grado', 'Posgrado']
+TIPOS_RESOLUCION = ['Consejo_Superior', 'Consejo_Directivo', 'Rector']
+TIPOS_ASIGNATURA = ['Obligatoria', 'Obligatoria', 'Obligatoria', 'Electiva']
+
+# Fracción de personas con cada rol (las restantes solo existen como persona)
+PROPORCION_DOCENTES = 0.55
+PROPORCION_NO_DOCENTES = 0.2
+# Asignaciones y notificaciones por docente, en promedio
+ASIGNACIONES_POR_DOCENTE = 1.6
+NOTIFICACIONES_POR_DOCENTE = 2
+# Porcentaje de registros dados de baja (estado '0')
+PROPORCION_INACTIVOS = 0.08
+# Rango de DNI del que se sortean los documentos
+DNI_MINIMO = 10_000_000
+DNI_MAXIMO = 60_000_000
+# Alcanza para jefes de todos los departamentos y directores de todas las carreras
+PERSONAS_MINIMAS = 100
+
+
+def _estado(rnd):
+    return '0' if rnd.random() < PROPORCION_INACTIVOS else '1'
+
+
+def _crear(modelo, objetos, lote):
+    return modelo.objects.bulk_create(objetos, batch_size=lote)
+
+
+def _crear_en_lotes(modelo, objetos, lote, clave=None):
+    """
+    Consume el iterable `objetos` y lo inserta de a `lote` filas, sin tenerlo entero en
+    memoria. Devuelve [clave(objeto)] de los creados, o la cantidad si no se pide clave.
+    """
+    claves = []
+    cantidad = 0
+    pendientes = []
+
+    def insertar():
+        nonlocal cantidad
+        creados = modelo.objects.bulk_create(pendientes)
+        cantidad += len(creados)
+        if clave is not None:
+            claves.extend(clave(o) for o in creados)
+        # Con DEBUG cada INSERT de `lote` filas queda entero en connection.queries
+        reset_queries()
+
+    for objeto in objetos:
+        pendientes.append(objeto)
+        if len(pendientes) >= lote:
+            insertar()
+            pendientes = []
+    if pendientes:
+        insertar()
+    return claves if clave is not None else cantidad
+
+
+def _dnis_libres(rnd, cantidad):
+    """`cantidad` DNI distintos del rango, ninguno ya cargado en Persona."""
+    ocupados = set(Persona.objects.values_list('dni', flat=True))
+    disponibles = DNI_MAXIMO - DNI_MINIMO - len(ocupados)
+    if cantidad > disponibles:
+        raise ValueError(f"No hay {cantidad} DNI libres en el rango ({disponibles} disponibles)")
+    # Se sortean de más para descartar los ocupados sin volver a sortear
+    sorteados = rnd.sample(range(DNI_MINIMO, DNI_MAXIMO), min(cantidad + len(ocupados), DNI_MAXIMO - DNI_MINIMO))
+    return [dni for dni in sorteados if str(dni) not in ocupados][:cantidad]
+
+
+def _titulos():
+    """Títulos de la facultad, reutilizando los que ya existen con el mismo nombre."""
+    nombres = [
+        f'{grado} en {disciplina}'
+        for grado in ('Licenciatura', 'Ingeniería', 'Doctorado', 'Maestría', 'Profesorado')
+        for disciplina in DEPARTAMENTOS
+    ]
+    TipoTitulo.objects.bulk_create([TipoTitulo(nombre=nombre) for nombre in nombres], ignore_conflicts=True)
+    ids = dict(TipoTitulo.objects.filter(nombre__in=nombres).values_list('nombre', 'id'))
+    return [ids[nombre] for nombre in nombres]
+
+
+def _codigos_libres(cantidad):
+    """Códigos de asignatura A00001, A00002... salteando los que ya existen."""
+    ocupados = set(Asignatura.objects.values_list('codigo', flat=True))
+    codigos = []
+    numero = 0
+    while len(codigos) < cantidad:
+        numero += 1
+        codigo = f'A{numero:05d}'
+        if codigo not in ocupados:
+            codigos.append(codigo)
+    return codigos
+
+
+def generar_datos_sinteticos(personas=3000, semilla=0, lote=1000, informar=None):
+    """
+    Crea la facultad en una transacción con bulk_create por lotes de `lote` filas y
+    recalcula los contadores de notificaciones. Devuelve {modelo: filas creadas}.
+    `informar(modelo, filas)` se llama al terminar cada modelo, para mostrar el avance.
+    """
+    if personas < PERSONAS_MINIMAS:
+        raise ValueError(f"Se necesitan al menos {PERSONAS_MINIMAS} personas")
+    rnd = random.Random(semilla)
+    ahora = timezone.now()
+    hoy = timezone.localdate()
+    creados = {}
+
+    def registrar(modelo, filas):
+        creados[modelo.__name__] = filas if isinstance(filas, int) else len(filas)
+        if informar is not None:
+            informar(modelo.__name__, creados[modelo.__name__])
+        return filas
+
+    with transaction.atomic():
+        titulos = registrar(TipoTitulo, _titulos())
+
+        dnis = _dnis_libres(rnd, personas)
+        legajo_inicial = 100_000 + Persona.objects.count()
+
+        def filas_personas():
+            for i, dni in enumerate(dnis):
+                yield Persona(
+                    nombre=rnd.choice(NOMBRES),
+                    apellido=rnd.choice(APELLIDOS),
+                    dni=str(dni),
+                    legajo=str(legajo_inicial + i),
+                    email=f'{dni}@facet.test' if rnd.random() < 0.9 else None,
+                    telefono=f'381{rnd.randint(4_000_000, 6_999_999)}',
+                    titulo_id=rnd.choice(titulos) if rnd.random() < 0.7 else None,
+                    fecha_nacimiento=hoy - timedelta(days=rnd.randint(24 * 365, 72 * 365)),
+                    estado=_estado(rnd),
+                )
+
+        # (id, estado) de cada persona; los roles heredan el estado
+        filas = registrar(Persona, _crear_en_lotes(Persona, filas_personas(), lote, clave=lambda p: (p.pk, p.estado)))
+        del dnis
+
+        departamentos = registrar(Departamento, _crear(Departamento, [
+            Departamento(
+                nombre=nombre, telefono=f'381{rnd.randint(4_000_000, 4_999_999)}', estado='1',
+                mail_departamento=f'depto{i}@facet.test',
+            )
+            for i, nombre in enumerate(DEPARTAMENTOS)
+        ], lote))
+        areas = registrar(Area, _crear(Area, [
+            Area(departamento=departamento, nombre=f'{departamento.nombre} - Área {j + 1}', estado='1')
+            for departamento in departamentos for j in range(4)
+        ], lote))
+        carreras = registrar(Carrera, _crear(Carrera, [
+            Carrera(
+                nombre=f'Carrera de {nombre}', tipo=rnd.choice(TIPOS_CARRERA),
+                planestudio=str(rnd.choice((2005, 2012, 2018, 2023))), estado='1',
+            )
+            for nombre in DEPARTAMENTOS + [f'{nombre} (ciclo)' for nombre in DEPARTAMENTOS[:3]]
+        ], lote))
+        resoluciones = registrar(Resolucion, _crear_en_lotes(Resolucion, (
+            Resolucion(
+                nexpediente=f'{i + 1}/{2015 + i % 10}', nresolucion=f'{rnd.randint(1, 2500)}/{2015 + i % 10}',
+                tipo=rnd.choice(TIPOS_RESOLUCION), adjunto=f'resoluciones/{i + 1}.pdf',
+                fecha=ahora - timedelta(days=rnd.randint(0, 3650)), estado='1',
+            )
+            for i in range(max(personas // 20, 10))
+        ), lote, clave=lambda r: r.pk))
+
+        codigos = _codigos_libres(max(personas // 10, len(areas)))
+
+        def filas_asignaturas():
+            for i, codigo in enumerate(codigos):
+                area = areas[i % len(areas)]
+                yield Asignatura(
+                    area=area, departamento_id=area.departamento_id, codigo=codigo,
+                    nombre=f'Asignatura {codigo}', modulo=rnd.choice(('1', '2', 'Anual')),
+                    tipo=rnd.choice(TIPOS_ASIGNATURA), estado=_estado(rnd),
+                )
+
+        asignaturas = registrar(Asignatura, _crear_en_lotes(Asignatura, filas_asignaturas(), lote, clave=lambda a: a.pk))
+        ids_carreras = [carrera.pk for carrera in carreras]
+        registrar(AsignaturaCarrera, _crear_en_lotes(AsignaturaCarrera, (
+            AsignaturaCarrera(asignatura_id=asignatura, carrera_id=carrera, estado='1')
+            for asignatura in asignaturas
+            for carrera in rnd.sample(ids_carreras, rnd.choice((1, 1, 2)))
+        ), lote))
+
+        # Roles uno a uno: cada persona tiene a lo sumo un rol de cada tipo
+        rnd.shuffle(filas)
+        cantidad_docentes = int(personas * PROPORCION_DOCENTES)
+        cantidad_no_docentes = int(personas * PROPORCION_NO_DOCENTES)
+        # (id del docente, id de la persona)
+        docentes = registrar(Docente, _crear_en_lotes(Docente, (
+            Docente(persona_id=persona, estado=estado) for persona, estado in filas[:cantidad_docentes]
+        ), lote, clave=lambda d: (d.pk, d.persona_id)))
+        registrar(NoDocente, _crear_en_lotes(NoDocente, (
+            NoDocente(persona_id=persona, estado=estado)
+            for persona, estado in filas[cantidad_docentes:cantidad_docentes + cantidad_no_docentes]
+        ), lote))
+        del filas
+        # Jefes y directores salen del plantel docente, como en la facultad real
+        jefes = registrar(Jefe, _crear(Jefe, [
+            Jefe(persona_id=persona, estado='1') for _, persona in docentes[:len(departamentos) * 2]
+        ], lote))
+        directores = registrar(Director, _crear(Director, [
+            Director(persona_id=persona, estado='1')
+            for _, persona in docentes[len(jefes):len(jefes) + len(carreras) * 2]
+        ], lote))
+
+        condiciones = [valor for valor, _ in AsignaturaDocente.CONDICION_CHOICES]
+        cargos = [valor for valor, _ in AsignaturaDocente.CARGO_CHOICES]
+        dedicaciones = [valor for valor, _ in AsignaturaDocente.DEDICACION_CHOICES]
+
+        def filas_asignaciones():
+            for docente, _ in docentes:
+                for _ in range(max(1, round(rnd.expovariate(1 / ASIGNACIONES_POR_DOCENTE)))):
+                    inicio = ahora - timedelta(days=rnd.randint(0, 6 * 365))
+                    yield AsignaturaDocente(
+                        asignatura_id=rnd.choice(asignaturas), docente_id=docente,
+                        resolucion_id=rnd.choice(resoluciones), condicion=rnd.choice(condiciones),
+                        cargo=rnd.choice(cargos), dedicacion=rnd.choice(dedicaciones),
+                        fecha_de_inicio=inicio,
+                        fecha_de_vencimiento=inicio + timedelta(days=rnd.randint(365, 4 * 365)),
+                        estado=_estado(rnd), notificado=rnd.random() < 0.3,
+                    )
+
+        registrar(AsignaturaDocente, _crear_en_lotes(AsignaturaDocente, filas_asignaciones(), lote))
+
+        # Cada departamento y carrera con períodos anteriores cerrados y uno vigente
+        jefaturas = []
+        for i, departamento in enumerate(departamentos):
+            for periodo in range(3):
+                inicio = ahora - timedelta(days=(2 - periodo) * 4 * 365 + rnd.randint(0, 90))
+                jefaturas.append(JefeDepartamento(
+                    departamento=departamento, jefe=jefes[(i * 2 + periodo) % len(jefes)],
+                    resolucion_id=rnd.choice(resoluciones), fecha_de_inicio=inicio,
+                    fecha_de_fin=inicio + timedelta(days=4 * 365), estado='1' if periodo == 2 else '0',
+                    notificado=periodo < 2,
+                ))
+        registrar(JefeDepartamento, _crear(JefeDepartamento, jefaturas, lote))
+        direcciones = []
+        for i, carrera in enumerate(carreras):
+            for periodo in range(2):
+                inicio = ahora - timedelta(days=(1 - periodo) * 3 * 365 + rnd.randint(0, 90))
+                direcciones.append(DirectorCarrera(
+                    carrera=carrera, director=directores[(i * 2 + periodo) % len(directores)],
+                    resolucion_id=rnd.choice(resoluciones), fecha_de_inicio=inicio,
+                    fecha_de_fin=inicio + timedelta(days=3 * 365), observaciones='',
+                    estado='1' if periodo == 1 else '0', notificado=periodo == 0,
+                ))
+        registrar(DirectorCarrera, _crear(DirectorCarrera, direcciones, lote))
+
+        registrar(Notificacion, _crear_en_lotes(Notificacion, (
+            Notificacion(persona_id=persona, mensaje=f'Aviso de vencimiento {n + 1}', leido=rnd.random() < 0.6)
+            for _, persona in docentes
+            for n in range(rnd.randint(0, NOTIFICACIONES_POR_DOCENTE * 2))
+        ), lote))
+        # bulk_create no pasa por los contadores incrementales
+        contadores.recalcular()
+
+    return creados
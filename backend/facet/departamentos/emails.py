@@ -0,0 +1,107 @@
+import logging
+import smtplib
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+logger = logging.getLogger(__name__)
+
+MAX_RECONEXIONES = 3
+
+
+class LimitadorEnvios:
+    """Espacia los envíos para no superar `por_segundo` correos por segundo."""
+
+    def __init__(self, por_segundo=None):
+        if por_segundo is None:
+            por_segundo = getattr(settings, 'EMAIL_ENVIOS_POR_SEGUNDO', 0)
+        self.intervalo = 1 / por_segundo if por_segundo else 0
+        self._ultimo = None
+
+    def esperar(self):
+        if not self.intervalo:
+            return
+        if self._ultimo is not None:
+            restante = self._ultimo + self.intervalo - time.monotonic()
+            if restante > 0:
+                time.sleep(restante)
+        self._ultimo = time.monotonic()
+
+
+def crear_mensaje(destinatario, asunto, cuerpo):
+    return EmailMessage(
+        subject=asunto,
+        body=cuerpo,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[destinatario],
+    )
+
+
+def enviar_mensajes(mensajes, por_segundo=None, conexion=None, al_enviar=None):
+    """
+    Envía una lista de EmailMessage reutilizando una única conexión SMTP (un solo
+    handshake TLS y login para todo el lote) y respetando el límite de envíos por segundo.
+
+    Devuelve un resultado por mensaje, en el mismo orden:
+    {"destinatarios": [...], "enviado": bool, "error": str | None}.
+    Si el servidor corta la conexión se reabre (hasta MAX_RECONEXIONES veces); si no se
+    puede abrir, el error se informa en los mensajes afectados. `al_enviar(indice, resultado)`
+    se llama apenas se conoce el resultado de cada mensaje, sin esperar al resto del lote.
+    """
+    conexion = conexion or get_connection(fail_silently=False)
+    limitador = LimitadorEnvios(por_segundo)
+    resultados = []
+    reconexiones = 0
+
+    def anotar(resultado):
+        resultados.append(resultado)
+        if al_enviar is not None:
+            al_enviar(len(resultados) - 1, resultado)
+
+    try:
+        conexion.open()
+    except Exception as exc:
+        logger.error(f"No se pudo conectar al servidor de correo: {str(exc)}")
+        for mensaje in mensajes:
+            anotar(_resultado(mensaje, error=exc))
+        return resultados
+
+    try:
+        for mensaje in mensajes:
+            limitador.esperar()
+            try:
+                enviados = conexion.send_messages([mensaje])
+            except smtplib.SMTPServerDisconnected as exc:
+                if reconexiones >= MAX_RECONEXIONES:
+                    anotar(_resultado(mensaje, error=exc))
+                    continue
+                # Algunos servidores cierran la sesión tras N mensajes: se reabre y se reintenta
+                reconexiones += 1
+                conexion.close()
+                try:
+                    conexion.open()
+                    enviados = conexion.send_messages([mensaje])
+                except Exception as exc:
+                    anotar(_resultado(mensaje, error=exc))
+                    continue
+            except Exception as exc:
+                anotar(_resultado(mensaje, error=exc))
+                continue
+            anotar(_resultado(mensaje, enviado=bool(enviados)))
+    finally:
+        conexion.close()
+
+    fallidos = sum(1 for resultado in resultados if not resultado['enviado'])
+    logger.info(f"Lote de correos: {len(resultados) - fallidos} enviados, {fallidos} con error")
+    return resultados
+
+
+def _resultado(mensaje, enviado=False, error=None):
+    if error is not None:
+        logger.error(f"Error enviando email a {', '.join(mensaje.to)}: {str(error)}")
+    return {
+        'destinatarios': list(mensaje.recipients()),
+        'enviado': enviado,
+        'error': str(error) if error is not None else None,
+    }
@@ -0,0 +1,2 @@
+from .carga import importar_personal
+from .lectura import LectorPlanilla
@@ -0,0 +1,253 @@
+import csv
+import io
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+
+COLUMNAS_STAGING = ('dni', 'legajo', 'apellido', 'nombre', 'fecha_nacimiento', 'caracter', 'observaciones')
+
+SQL_CREAR_STAGING = """
+    CREATE TEMP TABLE importacion_personal (
+        dni text NOT NULL,
+        legajo text,
+        apellido text NOT NULL,
+        nombre text NOT NULL,
+        fecha_nacimiento date,
+        caracter text,
+        observaciones text
+    ) ON COMMIT DROP
+"""
+
+# Una persona puede aparecer en varias filas (una por cargo): se consolida por DNI
+SQL_CONSOLIDAR = """
+    CREATE TEMP TABLE importacion_personas ON COMMIT DROP AS
+    SELECT dni,
+           max(legajo) AS legajo,
+           max(apellido) AS apellido,
+           max(nombre) AS nombre,
+           max(fecha_nacimiento) AS fecha_nacimiento,
+           bool_or(caracter LIKE 'ND%') AS es_nodocente,
+           max(observaciones) FILTER (WHERE caracter LIKE 'ND%') AS observaciones_nodocente,
+           NULL::text AS huella
+    FROM importacion_personal
+    GROUP BY dni
+"""
+
+# Las planillas sin fecha de nacimiento (planta docente) conservan la que ya está cargada
+SQL_COMPLETAR_FECHAS = """
+    UPDATE importacion_personas s
+    SET fecha_nacimiento = p.fecha_nacimiento
+    FROM departamentos_persona p
+    WHERE p.dni = s.dni AND s.fecha_nacimiento IS NULL AND p.fecha_nacimiento IS NOT NULL
+"""
+
+# Lo mismo con el legajo: una planilla sin la columna no borra el que ya está cargado
+SQL_COMPLETAR_LEGAJOS = """
+    UPDATE importacion_personas s
+    SET legajo = p.legajo
+    FROM departamentos_persona p
+    WHERE p.dni = s.dni AND s.legajo IS NULL AND p.legajo IS NOT NULL
+"""
+
+# Huella de una fila de `tabla` (misma expresión con la que la migración 0007 completó las
+# existentes). Del lado de la base se calcula con las columnas actuales y no con la guardada en
+# huella_importacion, que queda vieja (o NULL) cuando la persona se crea o edita por la API.
+HUELLA = """md5(concat_ws('|', coalesce({tabla}.legajo, ''), {tabla}.apellido, {tabla}.nombre,
+                           coalesce({tabla}.fecha_nacimiento::text, '')))"""
+
+SQL_CALCULAR_HUELLAS = f"""
+    UPDATE importacion_personas s
+    SET huella = {HUELLA.format(tabla='s')}
+"""
+
+# Personas: nuevas, con huella distinta (o inactivas) y sin cambios, más el detalle por campo
+SQL_DIFERENCIAS_PERSONAS = f"""
+    SELECT count(*) FILTER (WHERE p.id IS NULL),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND ({HUELLA.format(tabla='p')} IS DISTINCT FROM s.huella
+                                                       OR p.estado IS DISTINCT FROM '1')),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND p.apellido IS DISTINCT FROM s.apellido),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND p.nombre IS DISTINCT FROM s.nombre),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND p.legajo IS DISTINCT FROM s.legajo),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND p.fecha_nacimiento IS DISTINCT FROM s.fecha_nacimiento),
+           count(*) FILTER (WHERE p.id IS NOT NULL AND p.estado IS DISTINCT FROM '1')
+    FROM importacion_personas s
+    LEFT JOIN departamentos_persona p ON p.dni = s.dni
+"""
+
+SQL_DIFERENCIAS_NODOCENTES = """
+    SELECT count(*) FILTER (WHERE nd.id IS NULL),
+           count(*) FILTER (WHERE nd.id IS NOT NULL
+                            AND (nd.observaciones, nd.estado) IS DISTINCT FROM (s.observaciones_nodocente, '1'))
+    FROM importacion_personas s
+    LEFT JOIN departamentos_persona p ON p.dni = s.dni
+    LEFT JOIN departamentos_nodocente nd ON nd.persona_id = p.id
+    WHERE s.es_nodocente
+"""
+
+# NoDocentes activos cuya persona no figura con carácter ND en la planilla
+SQL_NODOCENTES_AUSENTES = """
+    FROM departamentos_nodocente nd
+    WHERE nd.estado = '1'
+      AND NOT EXISTS (
+          SELECT 1
+          FROM importacion_personas s
+          JOIN departamentos_persona p ON p.dni = s.dni
+          WHERE s.es_nodocente AND p.id = nd.persona_id
+      )
+"""
+
+# Solo se escriben las personas cuya huella cambió (o que estaban inactivas)
+SQL_UPSERT_PERSONAS = f"""
+    INSERT INTO departamentos_persona AS p
+        (dni, legajo, apellido, nombre, fecha_nacimiento, huella_importacion, estado,
+         fecha_creacion, fecha_modificacion)
+    SELECT dni, legajo, apellido, nombre, fecha_nacimiento, huella, '1', now(), now()
+    FROM importacion_personas
+    ON CONFLICT (dni) DO UPDATE SET
+        legajo = COALESCE(EXCLUDED.legajo, p.legajo),
+        apellido = EXCLUDED.apellido,
+        nombre = EXCLUDED.nombre,
+        fecha_nacimiento = EXCLUDED.fecha_nacimiento,
+        huella_importacion = EXCLUDED.huella_importacion,
+        estado = '1',
+        fecha_modificacion = now()
+    WHERE {HUELLA.format(tabla='p')} IS DISTINCT FROM EXCLUDED.huella_importacion
+       OR p.estado IS DISTINCT FROM '1'
+"""
+
+SQL_UPSERT_NODOCENTES = """
+    INSERT INTO departamentos_nodocente AS nd
+        (persona_id, observaciones, estado, fecha_creacion, fecha_modificacion)
+    SELECT p.id, s.observaciones_nodocente, '1', now(), now()
+    FROM importacion_personas s
+    JOIN departamentos_persona p ON p.dni = s.dni
+    WHERE s.es_nodocente
+    ON CONFLICT (persona_id) DO UPDATE SET
+        observaciones = EXCLUDED.observaciones,
+        estado = '1',
+        fecha_modificacion = now()
+    WHERE (nd.observaciones, nd.estado) IS DISTINCT FROM (EXCLUDED.observaciones, '1')
+"""
+
+
+def _copiar_staging(cursor, filas):
+    """Carga un lote en la tabla temporal con COPY (un único viaje a la base por lote)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for fila in filas:
+        writer.writerow(['' if fila[columna] is None else fila[columna] for columna in COLUMNAS_STAGING])
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    sql = f"COPY importacion_personal ({', '.join(COLUMNAS_STAGING)}) FROM STDIN WITH (FORMAT csv)"
+    if is_psycopg3:
+        with cursor.copy(sql) as copia:
+            copia.write(buffer.getvalue())
+    else:
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+
+
+def consolidar(cursor):
+    """Agrupa la tabla temporal por DNI y calcula la huella de cada persona."""
+    cursor.execute(SQL_CONSOLIDAR)
+    cursor.execute(SQL_COMPLETAR_FECHAS)
+    cursor.execute(SQL_COMPLETAR_LEGAJOS)
+    cursor.execute(SQL_CALCULAR_HUELLAS)
+
+
+def calcular_diferencias(cursor, contar_ausentes=True):
+    """
+    Resumen de altas, modificaciones y sin cambios de lo consolidado contra la base.
+    Los NoDocentes ausentes solo tienen sentido sobre la planilla completa, no sobre un lote.
+    """
+    cursor.execute("SELECT count(*), count(*) FILTER (WHERE es_nodocente) FROM importacion_personas")
+    personas, nodocentes = cursor.fetchone()
+
+    cursor.execute(SQL_DIFERENCIAS_PERSONAS)
+    nuevas, modificadas, apellido, nombre, legajo, fecha_nacimiento, reactivadas = cursor.fetchone()
+
+    cursor.execute(SQL_DIFERENCIAS_NODOCENTES)
+    nodocentes_nuevos, nodocentes_modificados = cursor.fetchone()
+
+    ausentes = contar_nodocentes_ausentes(cursor) if contar_ausentes else 0
+
+    return {
+        'personas': {
+            'total': personas,
+            'nuevas': nuevas,
+            'modificadas': modificadas,
+            'sin_cambios': personas - nuevas - modificadas,
+        },
+        'campos': {
+            'apellido': apellido,
+            'nombre': nombre,
+            'legajo': legajo,
+            'fecha_nacimiento': fecha_nacimiento,
+            'reactivadas': reactivadas,
+        },
+        'nodocentes': {
+            'total': nodocentes,
+            'nuevos': nodocentes_nuevos,
+            'modificados': nodocentes_modificados,
+            'sin_cambios': nodocentes - nodocentes_nuevos - nodocentes_modificados,
+            'ausentes': ausentes,
+            'desactivados': 0,
+        },
+    }
+
+
+def aplicar_cambios(cursor):
+    cursor.execute(SQL_UPSERT_PERSONAS)
+    cursor.execute(SQL_UPSERT_NODOCENTES)
+
+
+def contar_nodocentes_ausentes(cursor):
+    cursor.execute(f"SELECT count(*) {SQL_NODOCENTES_AUSENTES}")
+    return cursor.fetchone()[0]
+
+
+def desactivar_nodocentes_ausentes(cursor):
+    cursor.execute(
+        "UPDATE departamentos_nodocente SET estado = '0', fecha_modificacion = now() "
+        f"WHERE id IN (SELECT nd.id {SQL_NODOCENTES_AUSENTES})"
+    )
+    return cursor.rowcount
+
+
+def verificar_motor():
+    if connection.vendor != 'postgresql':
+        raise ImproperlyConfigured('La importación de personal requiere PostgreSQL')
+
+
+def importar_personal(lotes, dry_run=False, desactivar_ausentes=False):
+    """
+    Importa lotes de filas normalizadas (ver lectura.LectorPlanilla) con sentencias por conjunto:
+    COPY de cada lote a una tabla temporal, consolidación por DNI y upsert de Persona y NoDocente.
+    Solo un lote por vez está en memoria; el resto del trabajo lo hace PostgreSQL.
+
+    Cada persona consolidada lleva una huella (md5 de legajo, apellido, nombre y fecha de
+    nacimiento) que se compara con la misma huella calculada sobre las columnas actuales de
+    Persona: solo se escriben las altas y las personas cuya huella cambió. Con `dry_run` se calcula el mismo resumen sin escribir nada.
+    Con `desactivar_ausentes` se desactivan los NoDocentes que ya no figuran como ND.
+    """
+    verificar_motor()
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(SQL_CREAR_STAGING)
+        filas = 0
+        for lote in lotes:
+            _copiar_staging(cursor, lote)
+            filas += len(lote)
+        consolidar(cursor)
+
+        resumen = calcular_diferencias(cursor)
+        resumen['filas'] = filas
+        resumen['dry_run'] = dry_run
+        if dry_run:
+            return resumen
+
+        aplicar_cambios(cursor)
+        if desactivar_ausentes:
+            resumen['nodocentes']['desactivados'] = desactivar_nodocentes_ausentes(cursor)
+
+    return resumen
@@ -0,0 +1,176 @@
+import csv
+import io
+import os
+import re
+from datetime import date, datetime
+
+from openpyxl import load_workbook
+
+# Columnas de la planilla de liquidación (Julio2025.xlsx) y de la planta docente (Planta Docente.xlsx)
+COLUMNAS_LEGAJO = ('nrolegajoaux', 'nrolegajo')
+TAMANO_LOTE = 1000
+# Se guardan los primeros errores para el reporte; el resto solo se cuenta
+MAX_ERRORES = 100
+FORMATOS_FECHA = ('%Y-%m-%d', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S', '%d-%m-%Y')
+
+
+class FilaInvalida(ValueError):
+    pass
+
+
+def extraer_dni(cuil):
+    """El DNI son los 8 dígitos centrales del CUIL."""
+    return cuil[2:10]
+
+
+def _texto(valor):
+    if valor is None:
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    texto = str(valor).strip()
+    return texto or None
+
+
+def _cuil(valor):
+    texto = _texto(valor)
+    if texto is None:
+        return None
+    digitos = re.sub(r'\D', '', texto)
+    if len(digitos) != 11:
+        raise FilaInvalida(f"CUIL inválido: {texto}")
+    return digitos
+
+
+def _fecha(valor):
+    if valor is None or valor == '':
+        return None
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    texto = str(valor).strip()
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    raise FilaInvalida(f"Fecha de nacimiento inválida: {texto}")
+
+
+def normalizar_fila(fila):
+    """
+    Convierte una fila de la planilla en el registro que se carga en la tabla temporal:
+    CUIL→DNI, apellido/nombre en mayúsculas y fecha de nacimiento como date.
+    Lanza FilaInvalida si faltan datos mínimos o hay valores con formato incorrecto.
+    """
+    cuil = _cuil(fila.get('cuil'))
+    apellido = _texto(fila.get('apellido'))
+    nombre = _texto(fila.get('nombre'))
+    if not cuil or not apellido or not nombre:
+        raise FilaInvalida("Faltan datos obligatorios (cuil, apellido o nombre)")
+
+    legajo = None
+    for columna in COLUMNAS_LEGAJO:
+        legajo = _texto(fila.get(columna))
+        if legajo:
+            break
+
+    caracter = _texto(fila.get('caracter'))
+    return {
+        'dni': extraer_dni(cuil),
+        'legajo': legajo,
+        'apellido': apellido.upper(),
+        'nombre': nombre.upper(),
+        'fecha_nacimiento': _fecha(fila.get('fechanac')),
+        'caracter': caracter.upper() if caracter else None,
+        'observaciones': _texto(fila.get('descrip')),
+    }
+
+
+def _normalizar_encabezado(encabezado):
+    return [str(columna).strip().lower() if columna is not None else '' for columna in encabezado]
+
+
+def _filas_xlsx(archivo, hoja=None):
+    # read_only: openpyxl recorre el XML de la hoja sin cargar el libro completo en memoria
+    libro = load_workbook(archivo, read_only=True, data_only=True)
+    try:
+        if hoja is None:
+            hoja_activa = libro.worksheets[0]
+        elif isinstance(hoja, int):
+            hoja_activa = libro.worksheets[hoja]
+        else:
+            hoja_activa = libro[hoja]
+        filas = hoja_activa.iter_rows(values_only=True)
+        encabezado = _normalizar_encabezado(next(filas, ()))
+        for numero, valores in enumerate(filas, start=2):
+            if valores is None or all(valor is None for valor in valores):
+                continue
+            yield numero, dict(zip(encabezado, valores))
+    finally:
+        libro.close()
+
+
+def _filas_csv(archivo):
+    if isinstance(archivo, (str, os.PathLike)):
+        texto = open(archivo, newline='', encoding='utf-8-sig')
+    else:
+        texto = io.TextIOWrapper(archivo, encoding='utf-8-sig', newline='')
+    with texto:
+        muestra = texto.read(4096)
+        texto.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=',;\t')
+        except csv.Error:
+            dialecto = csv.excel
+        lector = csv.reader(texto, dialecto)
+        encabezado = _normalizar_encabezado(next(lector, []))
+        for valores in lector:
+            if not any(valores):
+                continue
+            yield lector.line_num, {
+                columna: (valor if valor != '' else None) for columna, valor in zip(encabezado, valores)
+            }
+
+
+def iterar_filas(archivo, hoja=None):
+    """Recorre la planilla (.xlsx o .csv, ruta o archivo abierto) como pares (número de fila, dict)."""
+    nombre = str(getattr(archivo, 'name', archivo))
+    if nombre.lower().endswith('.csv'):
+        return _filas_csv(archivo)
+    return _filas_xlsx(archivo, hoja)
+
+
+class LectorPlanilla:
+    """
+    Lee la planilla en lotes de `tamano_lote` filas ya normalizadas, sin materializarla completa.
+    Las filas inválidas no se incluyen en los lotes: se cuentan y se registran en `errores`
+    (hasta `max_errores`; con None se registran todas).
+    """
+
+    def __init__(self, archivo, hoja=None, tamano_lote=TAMANO_LOTE, max_errores=MAX_ERRORES):
+        self.archivo = archivo
+        self.hoja = hoja
+        self.tamano_lote = tamano_lote
+        self.max_errores = max_errores
+        self.filas = 0
+        self.omitidas = 0
+        self.errores = []
+
+    def __iter__(self):
+        lote = []
+        for numero, fila in iterar_filas(self.archivo, self.hoja):
+            self.filas += 1
+            try:
+                lote.append(normalizar_fila(fila))
+            except FilaInvalida as e:
+                self.omitidas += 1
+                if self.max_errores is None or len(self.errores) < self.max_errores:
+                    self.errores.append((numero, str(e)))
+                continue
+            if len(lote) >= self.tamano_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
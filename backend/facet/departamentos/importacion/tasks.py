@@ -0,0 +1,175 @@
+import logging
+import math
+
+from celery import chord, shared_task
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from ..models import ImportacionPersonal, ImportacionPersonalError, ImportacionPersonalFila
+from .carga import (
+    COLUMNAS_STAGING, SQL_CREAR_STAGING, aplicar_cambios, calcular_diferencias, consolidar,
+    contar_nodocentes_ausentes, desactivar_nodocentes_ausentes, verificar_motor,
+)
+from .lectura import LectorPlanilla
+
+logger = logging.getLogger(__name__)
+
+# Personas (DNIs distintos) que procesa cada worker en su propia transacción
+PERSONAS_POR_LOTE = 5000
+
+# Todas las filas de un mismo DNI quedan en el mismo lote: los lotes no se pisan entre sí
+SQL_ASIGNAR_LOTES = """
+    UPDATE departamentos_importacionpersonalfila f
+    SET lote = l.lote
+    FROM (
+        SELECT dni, ntile(%s) OVER (ORDER BY dni) AS lote
+        FROM (SELECT DISTINCT dni FROM departamentos_importacionpersonalfila WHERE importacion_id = %s) d
+    ) l
+    WHERE f.importacion_id = %s AND f.dni = l.dni
+"""
+
+SQL_CARGAR_STAGING = f"""
+    INSERT INTO importacion_personal ({', '.join(COLUMNAS_STAGING)})
+    SELECT {', '.join(COLUMNAS_STAGING)}
+    FROM departamentos_importacionpersonalfila
+    WHERE importacion_id = %s
+"""
+
+
+def _guardar_errores(importacion_id, lector):
+    if lector.errores:
+        ImportacionPersonalError.objects.bulk_create([
+            ImportacionPersonalError(importacion_id=importacion_id, fila=numero, mensaje=mensaje)
+            for numero, mensaje in lector.errores
+        ])
+        lector.errores.clear()
+
+
+def _asignar_lotes(importacion_id):
+    personas = ImportacionPersonalFila.objects.filter(importacion_id=importacion_id).values('dni').distinct().count()
+    total_lotes = math.ceil(personas / PERSONAS_POR_LOTE)
+    if total_lotes:
+        with connection.cursor() as cursor:
+            cursor.execute(SQL_ASIGNAR_LOTES, [total_lotes, importacion_id, importacion_id])
+    return total_lotes
+
+
+def _sumar_resumenes(resumenes):
+    total = {
+        'personas': {'total': 0, 'nuevas': 0, 'modificadas': 0, 'sin_cambios': 0},
+        'campos': {'apellido': 0, 'nombre': 0, 'legajo': 0, 'fecha_nacimiento': 0, 'reactivadas': 0},
+        'nodocentes': {'total': 0, 'nuevos': 0, 'modificados': 0, 'sin_cambios': 0, 'ausentes': 0, 'desactivados': 0},
+    }
+    for resumen in resumenes:
+        for grupo, valores in total.items():
+            for clave in valores:
+                valores[clave] += resumen[grupo][clave]
+    return total
+
+
+def _marcar_fallida(importacion_id, error):
+    ImportacionPersonal.objects.filter(id=importacion_id).update(
+        situacion='fallida', mensaje_error=str(error), fecha_fin=now()
+    )
+
+
+@shared_task
+def preparar_importacion_task(importacion_id):
+    """
+    Lee la planilla en streaming, guarda las filas válidas y los errores por fila,
+    reparte las filas en lotes por DNI y lanza un worker por lote.
+    """
+    importacion = ImportacionPersonal.objects.get(id=importacion_id)
+    importacion.situacion = 'procesando'
+    importacion.fecha_inicio = now()
+    importacion.save(update_fields=['situacion', 'fecha_inicio', 'fecha_modificacion'])
+
+    hoja = importacion.hoja
+    if hoja and hoja.isdigit():
+        hoja = int(hoja)
+
+    try:
+        verificar_motor()
+        with importacion.archivo.open('rb') as archivo:
+            lector = LectorPlanilla(archivo, hoja=hoja or None, max_errores=None)
+            for filas in lector:
+                ImportacionPersonalFila.objects.bulk_create([
+                    ImportacionPersonalFila(importacion_id=importacion_id, **fila) for fila in filas
+                ])
+                _guardar_errores(importacion_id, lector)
+            _guardar_errores(importacion_id, lector)
+        total_lotes = _asignar_lotes(importacion_id)
+    except Exception as e:
+        logger.error(f"Error preparando la importación {importacion_id}: {str(e)}")
+        ImportacionPersonalFila.objects.filter(importacion_id=importacion_id).delete()
+        _marcar_fallida(importacion_id, e)
+        return {"error": str(e)}
+
+    ImportacionPersonal.objects.filter(id=importacion_id).update(
+        total_filas=lector.filas, filas_invalidas=lector.omitidas, total_lotes=total_lotes
+    )
+    logger.info(f"Importación {importacion_id}: {lector.filas} filas en {total_lotes} lotes")
+
+    lotes = [procesar_lote_importacion_task.s(importacion_id, lote) for lote in range(1, total_lotes + 1)]
+    if lotes:
+        chord(lotes)(finalizar_importacion_task.s(importacion_id))
+    else:
+        finalizar_importacion_task.delay([], importacion_id)
+    return {"importacion_id": importacion_id, "lotes": total_lotes}
+
+
+@shared_task
+def procesar_lote_importacion_task(importacion_id, lote):
+    """Consolida y aplica un lote en su propia transacción; un error solo revierte ese lote."""
+    dry_run = ImportacionPersonal.objects.values_list('dry_run', flat=True).get(id=importacion_id)
+    resumen = None
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(SQL_CREAR_STAGING)
+            cursor.execute(f"{SQL_CARGAR_STAGING} AND lote = %s", [importacion_id, lote])
+            consolidar(cursor)
+            resumen = calcular_diferencias(cursor, contar_ausentes=False)
+            if not dry_run:
+                aplicar_cambios(cursor)
+    except Exception as e:
+        logger.error(f"Error en el lote {lote} de la importación {importacion_id}: {str(e)}")
+        ImportacionPersonalError.objects.create(
+            importacion_id=importacion_id, lote=lote, mensaje=f"Lote {lote} no importado: {e}"
+        )
+
+    ImportacionPersonal.objects.filter(id=importacion_id).update(lotes_procesados=F('lotes_procesados') + 1)
+    return resumen
+
+
+@shared_task
+def finalizar_importacion_task(resumenes, importacion_id):
+    """Suma los resúmenes de los lotes y resuelve los NoDocentes ausentes sobre la planilla completa."""
+    importacion = ImportacionPersonal.objects.get(id=importacion_id)
+    lotes_fallidos = sum(1 for resumen in resumenes if resumen is None)
+    resumen = _sumar_resumenes(resumen for resumen in resumenes if resumen is not None)
+
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(SQL_CREAR_STAGING)
+            cursor.execute(SQL_CARGAR_STAGING, [importacion_id])
+            consolidar(cursor)
+            resumen['nodocentes']['ausentes'] = contar_nodocentes_ausentes(cursor)
+            # Si falló algún lote no se desactiva nada: la planilla no quedó aplicada completa
+            if importacion.desactivar_ausentes and not importacion.dry_run and not lotes_fallidos:
+                resumen['nodocentes']['desactivados'] = desactivar_nodocentes_ausentes(cursor)
+            ImportacionPersonalFila.objects.filter(importacion_id=importacion_id).delete()
+    except Exception as e:
+        logger.error(f"Error finalizando la importación {importacion_id}: {str(e)}")
+        _marcar_fallida(importacion_id, e)
+        return {"error": str(e)}
+
+    resumen['filas'] = importacion.total_filas - importacion.filas_invalidas
+    resumen['dry_run'] = importacion.dry_run
+    resumen['lotes_fallidos'] = lotes_fallidos
+    ImportacionPersonal.objects.filter(id=importacion_id).update(
+        situacion='con_errores' if lotes_fallidos else 'finalizada',
+        resumen=resumen,
+        fecha_fin=now(),
+    )
+    return resumen
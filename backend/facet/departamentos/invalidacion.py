@@ -0,0 +1,44 @@
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+# Datos de referencia cuyas respuestas se cachean; cualquier cambio invalida su versión
+MODELOS_CACHEADOS = [
+    'departamentos.Departamento',
+    'departamentos.Area',
+    'departamentos.Carrera',
+    'departamentos.TipoTitulo',
+    'departamentos.Resolucion',
+    'roles.Rol',
+]
+
+
+def clave_version(modelo):
+    return f"version:{modelo._meta.label_lower}"
+
+
+def version_modelo(modelo):
+    # get_or_set() no pisa una versión ya incrementada por otro proceso
+    return cache.get_or_set(clave_version(modelo), 1, timeout=None)
+
+
+def invalidar_modelo(modelo):
+    """Incrementa la versión del modelo: las respuestas cacheadas con la anterior dejan de usarse."""
+    clave = clave_version(modelo)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        cache.set(clave, 2, timeout=None)
+
+
+def _invalidar_por_senal(sender, **kwargs):
+    invalidar_modelo(sender)
+
+
+def conectar_invalidacion():
+    """Conecta post_save/post_delete de MODELOS_CACHEADOS (se llama desde AppConfig.ready)."""
+    for etiqueta in MODELOS_CACHEADOS:
+        modelo = apps.get_model(etiqueta)
+        uid = f"invalidar_cache:{modelo._meta.label_lower}"
+        post_save.connect(_invalidar_por_senal, sender=modelo, dispatch_uid=uid)
+        post_delete.connect(_invalidar_por_senal, sender=modelo, dispatch_uid=uid)
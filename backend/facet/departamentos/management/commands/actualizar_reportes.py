@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from departamentos.reportes import REPORTES, actualizar_reportes
+
+
+class Command(BaseCommand):
+    help = "Recalcula las tablas de reportes (planta docente, vacantes, vencimientos y jefaturas)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reporte', action='append', choices=list(REPORTES),
+            help='Reporte a actualizar; se puede repetir (por defecto todos)',
+        )
+
+    def handle(self, *args, **options):
+        for reporte, filas in actualizar_reportes(options['reporte']).items():
+            self.stdout.write(f"{reporte}: {filas} filas")
+        self.stdout.write(self.style.SUCCESS("Reportes actualizados"))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from departamentos.datos_sinteticos import PERSONAS_MINIMAS, generar_datos_sinteticos
+from departamentos.reportes import actualizar_reportes
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera una facultad sintética para pruebas de carga: personas con DNI únicos, roles, "
+        "estructura académica, asignaciones, resoluciones y notificaciones. Con la misma semilla "
+        "y tamaño sobre la misma base, los datos son los mismos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--personas', type=int, default=3000, help='Personas a crear; el resto se deriva de este número (por defecto 3000)')
+        parser.add_argument('--semilla', type=int, default=0, help='Semilla del generador (por defecto 0)')
+        parser.add_argument('--lote', type=int, default=5000, help='Filas por bulk_create (por defecto 5000)')
+        parser.add_argument('--sin-reportes', action='store_true', help='No recalcula las tablas de reportes al terminar')
+
+    def handle(self, *args, **options):
+        if options['personas'] < PERSONAS_MINIMAS:
+            raise CommandError(f"--personas debe ser al menos {PERSONAS_MINIMAS}")
+        if options['lote'] < 1:
+            raise CommandError("--lote debe ser mayor que cero")
+
+        inicio = time.perf_counter()
+
+        def informar(modelo, filas):
+            self.stdout.write(f"{modelo:<20}{filas:>10}{time.perf_counter() - inicio:>9.1f}s")
+
+        try:
+            generar_datos_sinteticos(
+                personas=options['personas'], semilla=options['semilla'], lote=options['lote'], informar=informar,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not options['sin_reportes']:
+            actualizar_reportes()
+            self.stdout.write(f"{'reportes':<20}{'':>10}{time.perf_counter() - inicio:>9.1f}s")
+        self.stdout.write(self.style.SUCCESS("Datos sintéticos generados"))
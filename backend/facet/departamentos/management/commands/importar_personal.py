@@ -0,0 +1,70 @@
+from zipfile import BadZipFile
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from openpyxl.utils.exceptions import InvalidFileException
+
+from departamentos.importacion import LectorPlanilla, importar_personal
+from departamentos.importacion.lectura import TAMANO_LOTE
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa la planilla de personal (Excel de liquidación o planta docente) "
+        "creando/actualizando Personas por DNI y NoDocentes para los cargos de carácter ND."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta a la planilla .xlsx o .csv')
+        parser.add_argument('--hoja', default=None, help='Nombre o índice de la hoja (por defecto la primera)')
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE, help='Filas por lote enviado a la base')
+        parser.add_argument('--dry-run', action='store_true', help='Informa altas, modificaciones y bajas sin escribir')
+        parser.add_argument(
+            '--desactivar-ausentes', action='store_true',
+            help='Desactiva los NoDocentes activos que no figuran con carácter ND en la planilla',
+        )
+
+    def handle(self, *args, **options):
+        hoja = options['hoja']
+        if isinstance(hoja, str) and hoja.isdigit():
+            hoja = int(hoja)
+
+        lector = LectorPlanilla(options['archivo'], hoja=hoja, tamano_lote=options['lote'])
+        try:
+            resumen = importar_personal(
+                lector,
+                dry_run=options['dry_run'],
+                desactivar_ausentes=options['desactivar_ausentes'],
+            )
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e))
+        except (OSError, KeyError, IndexError, BadZipFile, InvalidFileException) as e:
+            raise CommandError(f"No se pudo leer la planilla: {e}")
+
+        personas = resumen['personas']
+        campos = resumen['campos']
+        nodocentes = resumen['nodocentes']
+        self.stdout.write(f"Filas leídas: {lector.filas} (importadas: {resumen['filas']}, con errores: {lector.omitidas})")
+        for numero, error in lector.errores:
+            self.stdout.write(self.style.WARNING(f"  Fila {numero}: {error}"))
+        self.stdout.write(
+            f"Personas: {personas['total']} en la planilla, {personas['nuevas']} altas, "
+            f"{personas['modificadas']} modificaciones, {personas['sin_cambios']} sin cambios"
+        )
+        self.stdout.write(
+            f"  Campos modificados: {campos['apellido']} apellido, {campos['nombre']} nombre, "
+            f"{campos['legajo']} legajo, {campos['fecha_nacimiento']} fecha de nacimiento, "
+            f"{campos['reactivadas']} reactivadas"
+        )
+        self.stdout.write(
+            f"NoDocentes: {nodocentes['total']} en la planilla, {nodocentes['nuevos']} altas, "
+            f"{nodocentes['modificados']} modificaciones, {nodocentes['sin_cambios']} sin cambios, "
+            f"{nodocentes['ausentes']} activos que ya no figuran como ND"
+        )
+
+        if resumen['dry_run']:
+            self.stdout.write(self.style.WARNING("Simulación (--dry-run): no se escribió ningún cambio"))
+            return
+        if options['desactivar_ausentes']:
+            self.stdout.write(f"NoDocentes desactivados: {nodocentes['desactivados']}")
+        self.stdout.write(self.style.SUCCESS("Importación finalizada"))
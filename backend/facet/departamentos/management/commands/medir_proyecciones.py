@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from departamentos.apis.asignaturaDocente import PROYECCION_ASIGNATURA_DOCENTE
+from departamentos.apis.jefe import PROYECCION_JEFE
+from departamentos.apis.jefeDepartamento import PROYECCION_JEFE_DEPARTAMENTO
+from departamentos.apis.persona import PROYECCION_PERSONA
+from departamentos.models import AsignaturaDocente, Jefe, JefeDepartamento, Persona
+
+# Endpoint -> (proyección, modelo) de los listados armados a mano
+PROYECCIONES = {
+    'jefe-departamento/list_detalle': (PROYECCION_JEFE_DEPARTAMENTO, JefeDepartamento),
+    'jefe/list_jefes_persona': (PROYECCION_JEFE, Jefe),
+    'asignatura-docente/list_detalle': (PROYECCION_ASIGNATURA_DOCENTE, AsignaturaDocente),
+    'persona': (PROYECCION_PERSONA, Persona),
+}
+
+
+def medir(funcion, repeticiones):
+    """Menor tiempo de `repeticiones` ejecuciones (en segundos) y el último resultado."""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        duracion = time.perf_counter() - inicio
+        mejor = duracion if mejor is None else min(mejor, duracion)
+    return mejor, resultado
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el costo por fila de armar los listados detallados desde instancias "
+        "(select_related + dict a mano) contra la proyección con values()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--filas', type=int, default=1000, help='Filas por listado (por defecto 1000)')
+        parser.add_argument('--repeticiones', type=int, default=5, help='Se informa el mejor tiempo (por defecto 5)')
+        parser.add_argument(
+            '--endpoint', action='append', choices=list(PROYECCIONES),
+            help='Listado a medir; se puede repetir (por defecto todos)',
+        )
+
+    def handle(self, *args, **options):
+        if options['filas'] < 1 or options['repeticiones'] < 1:
+            raise CommandError("--filas y --repeticiones deben ser mayores que cero")
+
+        self.stdout.write(f"{'endpoint':<36}{'filas':>7}{'instancias µs/fila':>20}{'values() µs/fila':>18}{'mejora':>9}")
+        for endpoint in options['endpoint'] or PROYECCIONES:
+            proyeccion, modelo = PROYECCIONES[endpoint]
+            queryset = modelo.objects.order_by('pk')
+            filas = options['filas']
+
+            t_instancias, por_instancias = medir(
+                lambda: [proyeccion.desde_instancia(o) for o in queryset.select_related(*proyeccion.relaciones)[:filas]],
+                options['repeticiones'],
+            )
+            t_valores, por_valores = medir(
+                lambda: proyeccion.construir(proyeccion.valores(queryset)[:filas]),
+                options['repeticiones'],
+            )
+
+            cantidad = len(por_valores)
+            if por_instancias != por_valores:
+                raise CommandError(f"{endpoint}: la proyección no coincide con el armado desde instancias")
+            if not cantidad:
+                self.stdout.write(f"{endpoint:<36}{0:>7}{'-':>20}{'-':>18}{'-':>9}")
+                continue
+            self.stdout.write(
+                f"{endpoint:<36}{cantidad:>7}{t_instancias / cantidad * 1e6:>20.1f}"
+                f"{t_valores / cantidad * 1e6:>18.1f}{t_instancias / t_valores:>8.1f}x"
+            )
+        self.stdout.write(self.style.SUCCESS("Medición finalizada"))
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from departamentos.retencion import TAMANO_LOTE_PURGA, purgar_notificaciones, ruta_archivo
+
+
+class Command(BaseCommand):
+    help = "Elimina en lotes las notificaciones más antiguas que el período de retención."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dias', type=int, default=settings.NOTIFICACIONES_DIAS_RETENCION,
+            help='Antigüedad máxima en días (por defecto NOTIFICACIONES_DIAS_RETENCION)',
+        )
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE_PURGA, help='Notificaciones por lote')
+        parser.add_argument('--pausa', type=float, default=0, help='Segundos de espera entre lotes')
+        parser.add_argument('--archivar', action='store_true', help='Guarda las notificaciones en un .jsonl.gz antes de borrarlas')
+        parser.add_argument('--dir-archivo', default=None, help='Directorio del archivo (por defecto NOTIFICACIONES_DIR_ARCHIVO)')
+
+    def handle(self, *args, **options):
+        archivo = ruta_archivo(options['dir_archivo']) if options['archivar'] else None
+        eliminadas, lotes = purgar_notificaciones(
+            now() - timedelta(days=options['dias']),
+            tamano_lote=options['lote'],
+            archivo=archivo,
+            pausa=options['pausa'],
+        )
+        self.stdout.write(f"Notificaciones eliminadas: {eliminadas} en {lotes} lotes")
+        if archivo:
+            self.stdout.write(f"Archivo: {archivo}")
+        self.stdout.write(self.style.SUCCESS("Purga finalizada"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from departamentos import contadores
+
+
+class Command(BaseCommand):
+    help = "Reconstruye los contadores de notificaciones (total y no leídas) por persona."
+
+    def handle(self, *args, **options):
+        contadores.recalcular()
+        self.stdout.write(self.style.SUCCESS("Contadores recalculados"))
@@ -0,0 +1,42 @@
+# Índices trigram (pg_trgm) para las búsquedas icontains sobre Persona.
+# Django traduce `icontains` en PostgreSQL a UPPER(columna::text) LIKE UPPER('%valor%'),
+# por eso los índices GIN se crean sobre esa misma expresión.
+# En otros motores (SQLite), o si el servidor no trae pg_trgm, la migración no hace nada y
+# TrigramSearchFilter se comporta como el SearchFilter de DRF; instalada la extensión, se
+# crean revirtiendo y reaplicando la migración.
+from django.db import migrations
+
+CAMPOS_INDEXADOS = ['apellido', 'nombre', 'dni', 'legajo']
+
+
+def crear_indices_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for campo in CAMPOS_INDEXADOS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS persona_{campo}_trgm_idx '
+            f'ON departamentos_persona USING gin ((UPPER("{campo}"::text)) gin_trgm_ops)'
+        )
+
+
+def eliminar_indices_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for campo in CAMPOS_INDEXADOS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS persona_{campo}_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0004_alter_asignaturadocente_cargo_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices_trigram, eliminar_indices_trigram),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0005_persona_trigram_indices'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='area',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['nombre'], name='area_act_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='area',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['departamento'], name='area_act_depto_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignatura',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['nombre'], name='asignatura_act_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignatura',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['area'], name='asignatura_act_area_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignatura',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['departamento'], name='asignatura_act_depto_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignaturacarrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['carrera'], name='asigcarrera_act_carrera_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignaturacarrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['asignatura'], name='asigcarrera_act_asig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignaturadocente',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['asignatura'], name='asigdoc_act_asig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignaturadocente',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['docente'], name='asigdoc_act_docente_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asignaturadocente',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['fecha_de_vencimiento'], name='asigdoc_act_venc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='carrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['nombre'], name='carrera_act_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='departamento',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['nombre'], name='depto_act_nombre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='directorcarrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['carrera'], name='dircarrera_act_carrera_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='directorcarrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['director'], name='dircarrera_act_dir_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jefedepartamento',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['departamento'], name='jefedepto_act_depto_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jefedepartamento',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['jefe'], name='jefedepto_act_jefe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jefedepartamento',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['fecha_de_fin'], name='jefedepto_act_fin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='persona',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['apellido', 'nombre', 'id'], name='persona_act_orden_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resolucion',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['nexpediente', 'nresolucion'], name='resolucion_act_orden_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Huella (md5) de los datos importados de la planilla de personal, para que la importación
+# solo reescriba las personas cuyos datos cambiaron. Se completa con los datos actuales
+# para que la primera importación posterior no reescriba toda la tabla.
+from django.db import migrations, models
+
+
+def completar_huellas(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "UPDATE departamentos_persona SET huella_importacion = md5(concat_ws('|', "
+        "coalesce(legajo, ''), apellido, nombre, coalesce(fecha_nacimiento::text, '')))"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0006_indices_parciales_activos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='persona',
+            name='huella_importacion',
+            field=models.CharField(blank=True, editable=False, help_text='Hash de los datos de la última importación de personal', max_length=32, null=True),
+        ),
+        migrations.RunPython(completar_huellas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0007_persona_huella_importacion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportacionPersonal',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('estado', models.BooleanField(default=True, verbose_name='Estado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('fecha_modificacion', models.DateTimeField(auto_now=True, verbose_name='Fecha de modificación')),
+                ('archivo', models.FileField(upload_to='importaciones/')),
+                ('hoja', models.CharField(blank=True, help_text='Nombre o índice de la hoja (por defecto la primera)', max_length=100, null=True)),
+                ('situacion', models.CharField(choices=[('pendiente', 'Pendiente'), ('procesando', 'Procesando'), ('finalizada', 'Finalizada'), ('con_errores', 'Finalizada con errores'), ('fallida', 'Fallida')], default='pendiente', max_length=20)),
+                ('dry_run', models.BooleanField(default=False, help_text='Calcula el resumen sin escribir cambios')),
+                ('desactivar_ausentes', models.BooleanField(default=False, help_text='Desactiva los NoDocentes que ya no figuran con carácter ND')),
+                ('total_filas', models.PositiveIntegerField(default=0)),
+                ('filas_invalidas', models.PositiveIntegerField(default=0)),
+                ('total_lotes', models.PositiveIntegerField(default=0)),
+                ('lotes_procesados', models.PositiveIntegerField(default=0)),
+                ('resumen', models.JSONField(blank=True, null=True)),
+                ('mensaje_error', models.TextField(blank=True, null=True)),
+                ('task_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('fecha_inicio', models.DateTimeField(blank=True, null=True)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('actualizado_por', models.ForeignKey(default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Actualizado por')),
+                ('creado_por', models.ForeignKey(default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Creado por')),
+            ],
+            options={
+                'verbose_name': 'Importación de personal',
+                'verbose_name_plural': 'Importaciones de personal',
+                'ordering': ['-fecha_creacion'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ImportacionPersonalError',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fila', models.PositiveIntegerField(blank=True, null=True)),
+                ('lote', models.PositiveIntegerField(blank=True, null=True)),
+                ('mensaje', models.TextField()),
+                ('importacion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='errores', to='departamentos.importacionpersonal')),
+            ],
+            options={
+                'verbose_name': 'Error de importación',
+                'verbose_name_plural': 'Errores de importación',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ImportacionPersonalFila',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lote', models.PositiveIntegerField(default=0)),
+                ('dni', models.CharField(max_length=20)),
+                ('legajo', models.CharField(blank=True, max_length=50, null=True)),
+                ('apellido', models.CharField(max_length=255)),
+                ('nombre', models.CharField(max_length=255)),
+                ('fecha_nacimiento', models.DateField(blank=True, null=True)),
+                ('caracter', models.CharField(blank=True, max_length=20, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('importacion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='filas', to='departamentos.importacionpersonal')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['importacion', 'lote'], name='impfila_lote_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0008_importacion_personal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnvioNotificacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(max_length=255, unique=True)),
+                ('email', models.CharField(max_length=254)),
+                ('asunto', models.CharField(max_length=255)),
+                ('tipo', models.CharField(blank=True, max_length=30, null=True)),
+                ('asignacion_id', models.IntegerField(blank=True, null=True)),
+                ('situacion', models.CharField(choices=[('pendiente', 'Pendiente'), ('enviado', 'Enviado'), ('fallido', 'Fallido')], default='pendiente', max_length=10)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('ultimo_error', models.TextField(blank=True, null=True)),
+                ('proximo_intento', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True)),
+                ('fecha_envio', models.DateTimeField(blank=True, null=True)),
+                ('notificacion', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='envio', to='departamentos.notificacion')),
+            ],
+            options={
+                'verbose_name': 'Envío de notificación',
+                'verbose_name_plural': 'Envíos de notificaciones',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('situacion', 'pendiente')), fields=['proximo_intento', 'id'], name='envio_pend_idx')],
+            },
+        ),
+    ]
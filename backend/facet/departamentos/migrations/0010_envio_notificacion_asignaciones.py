@@ -0,0 +1,31 @@
+# Un envío puede cubrir varias asignaciones de la misma persona (docente con varias asignaturas):
+# la asignación única pasa a una lista de ids.
+from django.db import migrations, models
+
+
+def copiar_asignaciones(apps, schema_editor):
+    EnvioNotificacion = apps.get_model('departamentos', 'EnvioNotificacion')
+    envios = list(EnvioNotificacion.objects.filter(asignacion_id__isnull=False).only('id', 'asignacion_id'))
+    for envio in envios:
+        envio.asignaciones = [envio.asignacion_id]
+    EnvioNotificacion.objects.bulk_update(envios, ['asignaciones'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0009_envio_notificacion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='envionotificacion',
+            name='asignaciones',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(copiar_asignaciones, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='envionotificacion',
+            name='asignacion_id',
+        ),
+    ]
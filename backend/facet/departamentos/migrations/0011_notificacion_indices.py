@@ -0,0 +1,23 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0010_envio_notificacion_asignaciones'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificacion',
+            index=models.Index(fields=['persona', 'fecha_creacion'], name='notif_persona_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificacion',
+            index=models.Index(fields=['-fecha_creacion', 'id'], name='notif_fecha_idx'),
+        ),
+    ]
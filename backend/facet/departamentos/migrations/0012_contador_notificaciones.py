@@ -0,0 +1,40 @@
+# Contadores de notificaciones por persona; se completan con las notificaciones existentes.
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def completar_contadores(apps, schema_editor):
+    Notificacion = apps.get_model('departamentos', 'Notificacion')
+    ContadorNotificaciones = apps.get_model('departamentos', 'ContadorNotificaciones')
+    totales = (
+        Notificacion.objects.order_by().values('persona_id')
+        .annotate(total=Count('id'), no_leidas=Count('id', filter=Q(leido=False)))
+    )
+    ContadorNotificaciones.objects.bulk_create(
+        [ContadorNotificaciones(persona_id=fila['persona_id'], total=fila['total'], no_leidas=fila['no_leidas']) for fila in totales],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0011_notificacion_indices'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorNotificaciones',
+            fields=[
+                ('persona', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='contador_notificaciones', serialize=False, to='departamentos.persona')),
+                ('total', models.IntegerField(default=0)),
+                ('no_leidas', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Contador de notificaciones',
+                'verbose_name_plural': 'Contadores de notificaciones',
+            },
+        ),
+        migrations.RunPython(completar_contadores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0012_contador_notificaciones'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActualizacionReporte',
+            fields=[
+                ('reporte', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('fecha_actualizacion', models.DateTimeField()),
+                ('duracion_ms', models.PositiveIntegerField(default=0)),
+                ('filas', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Actualización de reporte',
+                'verbose_name_plural': 'Actualizaciones de reportes',
+            },
+        ),
+        migrations.CreateModel(
+            name='ReporteJefatura',
+            fields=[
+                ('departamento', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='departamentos.departamento')),
+                ('apellido', models.CharField(blank=True, max_length=255, null=True)),
+                ('nombre', models.CharField(blank=True, max_length=255, null=True)),
+                ('nresolucion', models.CharField(blank=True, max_length=100, null=True)),
+                ('fecha_de_inicio', models.DateTimeField(blank=True, null=True)),
+                ('fecha_de_fin', models.DateTimeField(blank=True, null=True)),
+                ('jefaturas', models.PositiveIntegerField(default=0, help_text='Jefaturas registradas en el departamento, vigentes o no')),
+                ('jefe_departamento', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departamentos.jefedepartamento')),
+            ],
+            options={
+                'verbose_name': 'Reporte de jefaturas',
+            },
+        ),
+        migrations.CreateModel(
+            name='ReportePlantaDocente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('agrupacion', models.CharField(choices=[('detalle', 'Cargo, dedicación y condición'), ('cargo', 'Cargo'), ('dedicacion', 'Dedicación'), ('condicion', 'Condición'), ('total', 'Total')], max_length=20)),
+                ('cargo', models.CharField(blank=True, max_length=50, null=True)),
+                ('dedicacion', models.CharField(blank=True, max_length=20, null=True)),
+                ('condicion', models.CharField(blank=True, max_length=50, null=True)),
+                ('asignaciones', models.PositiveIntegerField(default=0)),
+                ('docentes', models.PositiveIntegerField(default=0)),
+                ('asignaturas', models.PositiveIntegerField(default=0)),
+                ('departamento', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departamentos.departamento')),
+            ],
+            options={
+                'verbose_name': 'Reporte de planta docente',
+                'indexes': [models.Index(fields=['agrupacion', 'departamento'], name='rep_planta_agrup_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReporteVacante',
+            fields=[
+                ('asignatura', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='departamentos.asignatura')),
+                ('docentes', models.PositiveIntegerField(default=0)),
+                ('profesores', models.PositiveIntegerField(default=0)),
+                ('ultimo_vencimiento', models.DateTimeField(blank=True, null=True)),
+                ('area', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departamentos.area')),
+                ('departamento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departamentos.departamento')),
+            ],
+            options={
+                'verbose_name': 'Reporte de vacantes',
+                'indexes': [models.Index(fields=['departamento', 'docentes'], name='rep_vacante_depto_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReporteVencimiento',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mes', models.DateField()),
+                ('tipo', models.CharField(choices=[('asignatura_docente', 'Asignatura docente'), ('jefe_departamento', 'Jefe de departamento')], max_length=20)),
+                ('cantidad', models.PositiveIntegerField(default=0)),
+                ('notificadas', models.PositiveIntegerField(default=0)),
+                ('departamento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departamentos.departamento')),
+            ],
+            options={
+                'verbose_name': 'Reporte de vencimientos',
+                'indexes': [models.Index(fields=['mes', 'departamento'], name='rep_venc_mes_idx')],
+            },
+        ),
+    ]
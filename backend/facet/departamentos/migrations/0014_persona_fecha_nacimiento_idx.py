@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0013_reportes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='persona',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['fecha_nacimiento'], name='persona_act_nac_idx'),
+        ),
+    ]
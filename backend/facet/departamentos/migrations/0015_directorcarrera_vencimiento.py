@@ -0,0 +1,24 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departamentos', '0014_persona_fecha_nacimiento_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='directorcarrera',
+            name='notificado',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='directorcarrera',
+            index=models.Index(condition=models.Q(('estado', '1')), fields=['fecha_de_fin'], name='dircarrera_act_fin_idx'),
+        ),
+    ]
@@ -13,4 +13,8 @@ from .asignaturaDocente import AsignaturaDocente
 from .carrera import Carrera
 from .directorCarrera import DirectorCarrera
 from .tipoTitulo import TipoTitulo
-from .notificacion import Notificacion
\ No newline at end of file
+from .notificacion import Notificacion
+from .importacionPersonal import ImportacionPersonal, ImportacionPersonalFila, ImportacionPersonalError
+from .envioNotificacion import EnvioNotificacion
+from .contadorNotificaciones import ContadorNotificaciones
+from .reporte import ActualizacionReporte, ReporteJefatura, ReportePlantaDocente, ReporteVacante, ReporteVencimiento
@@ -16,3 +16,7 @@ class Area(BaseModel):
         ordering = ['nombre']
         verbose_name = 'Area'
         verbose_name_plural = 'Areas'
+        indexes = [
+            models.Index(fields=['nombre'], name='area_act_nombre_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['departamento'], name='area_act_depto_idx', condition=models.Q(estado='1')),
+        ]
@@ -24,6 +24,11 @@ class Asignatura(BaseModel):
         ordering = ['nombre']
         verbose_name = 'Asignatura'
         verbose_name_plural = 'Asignaturas'
+        indexes = [
+            models.Index(fields=['nombre'], name='asignatura_act_nombre_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['area'], name='asignatura_act_area_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['departamento'], name='asignatura_act_depto_idx', condition=models.Q(estado='1')),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['codigo'], name='ux_codigo_Asignatura'),
@@ -20,4 +20,8 @@ class AsignaturaCarrera(BaseModel):
     class Meta:
         ordering = ['id']
         verbose_name = 'AsignaturaCarrera'
-        verbose_name_plural = 'AsignaturaCarreras'
\ No newline at end of file
+        verbose_name_plural = 'AsignaturaCarreras'
+        indexes = [
+            models.Index(fields=['carrera'], name='asigcarrera_act_carrera_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['asignatura'], name='asigcarrera_act_asig_idx', condition=models.Q(estado='1')),
+        ]
\ No newline at end of file
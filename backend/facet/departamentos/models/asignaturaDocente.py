@@ -66,4 +66,9 @@ class AsignaturaDocente(BaseModel):
     class Meta:
         ordering = ['id']
         verbose_name = 'AsignaturaDocente'
-        verbose_name_plural = 'AsignaturaDocentes'
\ No newline at end of file
+        verbose_name_plural = 'AsignaturaDocentes'
+        indexes = [
+            models.Index(fields=['asignatura'], name='asigdoc_act_asig_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['docente'], name='asigdoc_act_docente_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['fecha_de_vencimiento'], name='asigdoc_act_venc_idx', condition=models.Q(estado='1')),
+        ]
\ No newline at end of file
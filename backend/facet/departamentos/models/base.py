@@ -5,6 +5,20 @@ from django.utils import timezone
 User = get_user_model()
 # from pytz import timezone
 
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """Consultas sobre el borrado lógico por `estado`."""
+
+    def activos(self):
+        return self.filter(estado=self.model.valor_estado(activo=True))
+
+    def inactivos(self):
+        return self.filter(estado=self.model.valor_estado(activo=False))
+
+    def todos(self):
+        return self.all()
+
+
 class BaseModel(models.Model):
     id = models.AutoField(primary_key = True)
     estado = models.BooleanField(default = True, verbose_name='Estado')
@@ -14,6 +28,15 @@ class BaseModel(models.Model):
     actualizado_por = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, default=None, related_name='%(class)s_updated_by', verbose_name='Actualizado por')
     # direccion_ip = models.CharField(default="0.0.0.0", blank=True, null=True, verbose_name="Direccion IP")
 
+    objects = SoftDeleteQuerySet.as_manager()
+
+    @classmethod
+    def valor_estado(cls, activo=True):
+        """Valor de `estado` activo/inactivo: la mayoría de los modelos lo redefinen como CharField '1'/'0'."""
+        if isinstance(cls._meta.get_field('estado'), models.BooleanField):
+            return activo
+        return '1' if activo else '0'
+
     class Meta:
         abstract = True
         verbose_name = 'Modelo Base'
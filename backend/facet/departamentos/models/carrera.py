@@ -16,3 +16,6 @@ class Carrera(BaseModel):
         ordering = ['nombre']
         verbose_name = 'Carrera'
         verbose_name_plural = 'Carreras'
+        indexes = [
+            models.Index(fields=['nombre'], name='carrera_act_nombre_idx', condition=models.Q(estado='1')),
+        ]
@@ -0,0 +1,20 @@
+from django.db import models
+from .persona import Persona
+
+
+class ContadorNotificaciones(models.Model):
+    """
+    Totales de notificaciones por persona, mantenidos de forma incremental (ver contadores.py)
+    para que el resumen de no leídas no tenga que contar la tabla de notificaciones.
+    """
+
+    persona = models.OneToOneField(Persona, on_delete=models.CASCADE, primary_key=True, related_name='contador_notificaciones')
+    total = models.IntegerField(default=0)
+    no_leidas = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.persona_id}: {self.no_leidas}/{self.total}"
+
+    class Meta:
+        verbose_name = 'Contador de notificaciones'
+        verbose_name_plural = 'Contadores de notificaciones'
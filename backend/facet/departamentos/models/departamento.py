@@ -17,3 +17,6 @@ class Departamento(BaseModel):
         ordering = ['nombre']
         verbose_name = 'Departamento'
         verbose_name_plural = 'Departamentos'
+        indexes = [
+            models.Index(fields=['nombre'], name='depto_act_nombre_idx', condition=models.Q(estado='1')),
+        ]
@@ -16,6 +16,7 @@ class DirectorCarrera(BaseModel):
     fecha_de_fin = models.DateTimeField(blank=True, null=True)
     observaciones = models.TextField()
     estado = models.CharField(max_length=1,blank=False, null=False)
+    notificado = models.BooleanField(default=False)
 
     def __str__(self):
         return f"{self.director.persona.apellido}"
@@ -23,4 +24,9 @@ class DirectorCarrera(BaseModel):
     class Meta:
         ordering = ['id']
         verbose_name = 'Director Carrera'
-        verbose_name_plural = 'Directores Carrera'
\ No newline at end of file
+        verbose_name_plural = 'Directores Carrera'
+        indexes = [
+            models.Index(fields=['carrera'], name='dircarrera_act_carrera_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['director'], name='dircarrera_act_dir_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['fecha_de_fin'], name='dircarrera_act_fin_idx', condition=models.Q(estado='1')),
+        ]
\ No newline at end of file
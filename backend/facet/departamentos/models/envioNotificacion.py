@@ -0,0 +1,43 @@
+from django.db import models
+from django.utils import timezone
+from .notificacion import Notificacion
+
+
+class EnvioNotificacion(models.Model):
+    """
+    Bandeja de salida de los correos de notificación. Se escribe en la misma transacción que la
+    Notificacion y la despacha `despachar_notificaciones_task`. La `clave` es única: para los
+    recordatorios, persona, cargo y vencimiento; para los mensajes manuales, persona, día y hash del
+    texto (ver notificaciones.clave_envio). Registrar dos veces el mismo aviso no duplica correos.
+    """
+
+    SITUACION_CHOICES = [
+        ('pendiente', 'Pendiente'),
+        ('enviado', 'Enviado'),
+        ('fallido', 'Fallido'),
+    ]
+
+    notificacion = models.OneToOneField(Notificacion, on_delete=models.CASCADE, related_name='envio')
+    clave = models.CharField(max_length=255, unique=True)
+    email = models.CharField(max_length=254)
+    asunto = models.CharField(max_length=255)
+    # Asignaciones a marcar como notificadas al enviarse ('jefe_departamento' o 'asignatura_docente')
+    tipo = models.CharField(max_length=30, blank=True, null=True)
+    asignaciones = models.JSONField(default=list, blank=True)
+    situacion = models.CharField(max_length=10, choices=SITUACION_CHOICES, default='pendiente')
+    intentos = models.PositiveSmallIntegerField(default=0)
+    ultimo_error = models.TextField(blank=True, null=True)
+    proximo_intento = models.DateTimeField(default=timezone.now)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_envio = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.clave} ({self.situacion})"
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = 'Envío de notificación'
+        verbose_name_plural = 'Envíos de notificaciones'
+        indexes = [
+            models.Index(fields=['proximo_intento', 'id'], name='envio_pend_idx', condition=models.Q(situacion='pendiente')),
+        ]
@@ -0,0 +1,79 @@
+from django.db import models
+from .base import BaseModel
+
+
+class ImportacionPersonal(BaseModel):
+    """Importación asíncrona de una planilla de personal, procesada en lotes por los workers de Celery."""
+
+    SITUACION_CHOICES = [
+        ('pendiente', 'Pendiente'),
+        ('procesando', 'Procesando'),
+        ('finalizada', 'Finalizada'),
+        ('con_errores', 'Finalizada con errores'),
+        ('fallida', 'Fallida'),
+    ]
+
+    archivo = models.FileField(upload_to='importaciones/')
+    hoja = models.CharField(max_length=100, blank=True, null=True, help_text="Nombre o índice de la hoja (por defecto la primera)")
+    situacion = models.CharField(max_length=20, choices=SITUACION_CHOICES, default='pendiente')
+    dry_run = models.BooleanField(default=False, help_text="Calcula el resumen sin escribir cambios")
+    desactivar_ausentes = models.BooleanField(default=False, help_text="Desactiva los NoDocentes que ya no figuran con carácter ND")
+    total_filas = models.PositiveIntegerField(default=0)
+    filas_invalidas = models.PositiveIntegerField(default=0)
+    total_lotes = models.PositiveIntegerField(default=0)
+    lotes_procesados = models.PositiveIntegerField(default=0)
+    resumen = models.JSONField(blank=True, null=True)
+    mensaje_error = models.TextField(blank=True, null=True)
+    task_id = models.CharField(max_length=255, blank=True, null=True)
+    fecha_inicio = models.DateTimeField(blank=True, null=True)
+    fecha_fin = models.DateTimeField(blank=True, null=True)
+
+    @property
+    def progreso(self):
+        """Porcentaje de lotes procesados."""
+        if self.situacion in ('finalizada', 'con_errores'):
+            return 100
+        if not self.total_lotes:
+            return 0
+        return round(100 * self.lotes_procesados / self.total_lotes)
+
+    def __str__(self):
+        return f"Importación {self.id} ({self.situacion})"
+
+    class Meta:
+        ordering = ['-fecha_creacion']
+        verbose_name = 'Importación de personal'
+        verbose_name_plural = 'Importaciones de personal'
+
+
+class ImportacionPersonalFila(models.Model):
+    """Fila normalizada de la planilla, asignada a un lote; se eliminan al finalizar la importación."""
+
+    importacion = models.ForeignKey(ImportacionPersonal, on_delete=models.CASCADE, related_name='filas')
+    lote = models.PositiveIntegerField(default=0)
+    dni = models.CharField(max_length=20)
+    legajo = models.CharField(max_length=50, blank=True, null=True)
+    apellido = models.CharField(max_length=255)
+    nombre = models.CharField(max_length=255)
+    fecha_nacimiento = models.DateField(blank=True, null=True)
+    caracter = models.CharField(max_length=20, blank=True, null=True)
+    observaciones = models.TextField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['importacion', 'lote'], name='impfila_lote_idx'),
+        ]
+
+
+class ImportacionPersonalError(models.Model):
+    """Error de una fila de la planilla (o de un lote completo cuando `fila` es nula)."""
+
+    importacion = models.ForeignKey(ImportacionPersonal, on_delete=models.CASCADE, related_name='errores')
+    fila = models.PositiveIntegerField(blank=True, null=True)
+    lote = models.PositiveIntegerField(blank=True, null=True)
+    mensaje = models.TextField()
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = 'Error de importación'
+        verbose_name_plural = 'Errores de importación'
@@ -27,4 +27,9 @@ class JefeDepartamento(BaseModel):
     class Meta:
         ordering = ['id']
         verbose_name = 'JefeDepartamento'
-        verbose_name_plural = 'Jefes Departamentos'
\ No newline at end of file
+        verbose_name_plural = 'Jefes Departamentos'
+        indexes = [
+            models.Index(fields=['departamento'], name='jefedepto_act_depto_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['jefe'], name='jefedepto_act_jefe_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['fecha_de_fin'], name='jefedepto_act_fin_idx', condition=models.Q(estado='1')),
+        ]
\ No newline at end of file
@@ -15,3 +15,8 @@ class Notificacion(BaseModel):  # Hereda de BaseModel
         ordering = ['-fecha_creacion']
         verbose_name = 'Notificación'
         verbose_name_plural = 'Notificaciones'
+        indexes = [
+            models.Index(fields=['persona', 'fecha_creacion'], name='notif_persona_fecha_idx'),
+            # Listado por -fecha_creacion (con el id de desempate de la paginación por cursor) y purga por antigüedad
+            models.Index(fields=['-fecha_creacion', 'id'], name='notif_fecha_idx'),
+        ]
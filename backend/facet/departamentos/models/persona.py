@@ -13,6 +13,7 @@ class Persona(BaseModel):
     legajo = models.CharField(blank=True, null=True)
     titulo = models.ForeignKey(TipoTitulo, on_delete=models.SET_NULL, null=True, blank=True)
     fecha_nacimiento = models.DateField(blank=True, null=True, help_text="Fecha de nacimiento para cálculo de jubilación")
+    huella_importacion = models.CharField(max_length=32, blank=True, null=True, editable=False, help_text="Hash de los datos de la última importación de personal")
 
     def __str__(self):
         return f"{self.apellido,self.nombre}"
@@ -21,6 +22,10 @@ class Persona(BaseModel):
         ordering = ['apellido','nombre']
         verbose_name = 'Persona'
         verbose_name_plural = 'Personas'
+        indexes = [
+            models.Index(fields=['apellido', 'nombre', 'id'], name='persona_act_orden_idx', condition=models.Q(estado='1')),
+            models.Index(fields=['fecha_nacimiento'], name='persona_act_nac_idx', condition=models.Q(estado='1')),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['dni'], name='ux_dni_personas'),
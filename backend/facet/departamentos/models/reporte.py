@@ -0,0 +1,103 @@
+from django.db import models
+from .departamento import Departamento
+
+
+class ActualizacionReporte(models.Model):
+    """Última actualización de cada tabla de reportes (ver reportes.py)."""
+
+    reporte = models.CharField(max_length=50, primary_key=True)
+    fecha_actualizacion = models.DateTimeField()
+    duracion_ms = models.PositiveIntegerField(default=0)
+    filas = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.reporte} ({self.fecha_actualizacion})"
+
+    class Meta:
+        verbose_name = 'Actualización de reporte'
+        verbose_name_plural = 'Actualizaciones de reportes'
+
+
+class ReportePlantaDocente(models.Model):
+    """
+    Asignaciones vigentes por departamento y cargo/dedicación/condición.
+    Cada `agrupacion` tiene sus propias filas (GROUPING SETS), así los docentes distintos
+    son exactos en todos los niveles; `departamento` nulo es el total de la facultad.
+    """
+
+    AGRUPACION_CHOICES = [
+        ('detalle', 'Cargo, dedicación y condición'),
+        ('cargo', 'Cargo'),
+        ('dedicacion', 'Dedicación'),
+        ('condicion', 'Condición'),
+        ('total', 'Total'),
+    ]
+
+    agrupacion = models.CharField(max_length=20, choices=AGRUPACION_CHOICES)
+    departamento = models.ForeignKey(Departamento, on_delete=models.CASCADE, blank=True, null=True, related_name='+')
+    cargo = models.CharField(max_length=50, blank=True, null=True)
+    dedicacion = models.CharField(max_length=20, blank=True, null=True)
+    condicion = models.CharField(max_length=50, blank=True, null=True)
+    asignaciones = models.PositiveIntegerField(default=0)
+    docentes = models.PositiveIntegerField(default=0)
+    asignaturas = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Reporte de planta docente'
+        indexes = [
+            models.Index(fields=['agrupacion', 'departamento'], name='rep_planta_agrup_idx'),
+        ]
+
+
+class ReporteVacante(models.Model):
+    """Asignaturas activas y su cobertura docente vigente."""
+
+    asignatura = models.OneToOneField('Asignatura', on_delete=models.CASCADE, primary_key=True, related_name='+')
+    departamento = models.ForeignKey(Departamento, on_delete=models.CASCADE, related_name='+')
+    area = models.ForeignKey('Area', on_delete=models.CASCADE, related_name='+')
+    docentes = models.PositiveIntegerField(default=0)
+    profesores = models.PositiveIntegerField(default=0)
+    ultimo_vencimiento = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Reporte de vacantes'
+        indexes = [
+            models.Index(fields=['departamento', 'docentes'], name='rep_vacante_depto_idx'),
+        ]
+
+
+class ReporteVencimiento(models.Model):
+    """Asignaciones activas que vencen en cada mes, desde el mes en curso."""
+
+    TIPO_CHOICES = [
+        ('asignatura_docente', 'Asignatura docente'),
+        ('jefe_departamento', 'Jefe de departamento'),
+    ]
+
+    mes = models.DateField()
+    departamento = models.ForeignKey(Departamento, on_delete=models.CASCADE, related_name='+')
+    tipo = models.CharField(max_length=20, choices=TIPO_CHOICES)
+    cantidad = models.PositiveIntegerField(default=0)
+    notificadas = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Reporte de vencimientos'
+        indexes = [
+            models.Index(fields=['mes', 'departamento'], name='rep_venc_mes_idx'),
+        ]
+
+
+class ReporteJefatura(models.Model):
+    """Jefatura vigente (o su ausencia) de cada departamento activo."""
+
+    departamento = models.OneToOneField(Departamento, on_delete=models.CASCADE, primary_key=True, related_name='+')
+    jefe_departamento = models.ForeignKey('JefeDepartamento', on_delete=models.CASCADE, blank=True, null=True, related_name='+')
+    apellido = models.CharField(max_length=255, blank=True, null=True)
+    nombre = models.CharField(max_length=255, blank=True, null=True)
+    nresolucion = models.CharField(max_length=100, blank=True, null=True)
+    fecha_de_inicio = models.DateTimeField(blank=True, null=True)
+    fecha_de_fin = models.DateTimeField(blank=True, null=True)
+    jefaturas = models.PositiveIntegerField(default=0, help_text="Jefaturas registradas en el departamento, vigentes o no")
+
+    class Meta:
+        verbose_name = 'Reporte de jefaturas'
@@ -17,3 +17,6 @@ class Resolucion(BaseModel):
         ordering = ['nexpediente','nresolucion']
         verbose_name = 'Resolucion'
         verbose_name_plural = 'Resoluciones'
+        indexes = [
+            models.Index(fields=['nexpediente', 'nresolucion'], name='resolucion_act_orden_idx', condition=models.Q(estado='1')),
+        ]
@@ -0,0 +1,218 @@
+import hashlib
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils.timezone import localdate, now
+
+from . import contadores
+from .emails import crear_mensaje, enviar_mensajes
+from .models import AsignaturaDocente, DirectorCarrera, EnvioNotificacion, JefeDepartamento, Notificacion
+
+logger = logging.getLogger(__name__)
+
+# Asignaciones que se marcan como `notificado` al enviarse el aviso
+MODELOS_ASIGNACION = {
+    'jefe_departamento': JefeDepartamento,
+    'asignatura_docente': AsignaturaDocente,
+    'director_carrera': DirectorCarrera,
+}
+
+# Origen de un aviso: recordatorio automático de vencimiento o mensaje cargado a mano
+ORIGEN_VENCIMIENTO = 'vencimiento'
+ORIGEN_MANUAL = 'manual'
+
+TAMANO_LOTE_ENVIOS = 50
+MAX_INTENTOS_ENVIO = 5
+# Espera antes del reintento n: 1, 2, 4, 8... minutos
+ESPERA_REINTENTO = timedelta(minutes=1)
+# Tiempo que un despachador tiene reservado su lote; debe cubrir el envío completo
+DURACION_RESERVA = timedelta(minutes=10)
+
+
+def clave_envio(tipo, destinatario):
+    """
+    Clave de idempotencia de un aviso. Los recordatorios de vencimiento se identifican por
+    persona, cargos (asignaciones) y fecha de vencimiento, así el beat no repite un aviso.
+    Los mensajes manuales (origen ORIGEN_MANUAL) llevan el día y un hash de cargos y texto:
+    solo se descarta el mismo mensaje repetido a la misma persona en el día, nunca un
+    mensaje distinto ni el recordatorio automático.
+    """
+    if destinatario.get('origen', ORIGEN_VENCIMIENTO) == ORIGEN_MANUAL or not destinatario['asignaciones']:
+        contenido = f"{sorted(destinatario['asignaciones'])}|{destinatario['mensaje']}"
+        huella = hashlib.md5(contenido.encode()).hexdigest()
+        return f"{tipo}:{ORIGEN_MANUAL}:{destinatario['persona_id']}:{localdate():%Y-%m-%d}:{huella}"
+    asignaciones = '-'.join(str(asignacion) for asignacion in sorted(destinatario['asignaciones']))
+    vencimiento = destinatario['vencimiento']
+    fecha = vencimiento.strftime('%Y-%m-%d') if vencimiento else 'sin-vencimiento'
+    return f"{tipo}:{asignaciones}:{destinatario['persona_id']}:{fecha}"
+
+
+def envio_registrado(tipo, destinatario):
+    """EnvioNotificacion ya registrado con la misma clave que el aviso, o None."""
+    return EnvioNotificacion.objects.filter(clave=clave_envio(tipo, destinatario)).first()
+
+
+def registrar_envios(tipo, destinatarios, asunto):
+    """
+    Registra en una transacción la Notificacion y su EnvioNotificacion pendiente para cada
+    destinatario ({'persona_id', 'asignaciones', 'email', 'mensaje', 'vencimiento'} y 'origen'
+    opcional, ORIGEN_VENCIMIENTO por defecto).
+    Los avisos cuya clave ya existe se ignoran. Devuelve los envíos creados.
+    """
+    pendientes = {}
+    for destinatario in destinatarios:
+        clave = clave_envio(tipo, destinatario)
+        pendientes.setdefault(clave, destinatario)
+
+    existentes = set(EnvioNotificacion.objects.filter(clave__in=list(pendientes)).values_list('clave', flat=True))
+    nuevos = [(clave, destinatario) for clave, destinatario in pendientes.items() if clave not in existentes]
+    if not nuevos:
+        return []
+
+    try:
+        with transaction.atomic():
+            return _crear_envios(tipo, nuevos, asunto)
+    except IntegrityError:
+        # Otro proceso registró alguna de las claves en paralelo: se crean de a uno
+        creados = []
+        for nuevo in nuevos:
+            try:
+                with transaction.atomic():
+                    creados.extend(_crear_envios(tipo, [nuevo], asunto))
+            except IntegrityError:
+                continue
+        return creados
+
+
+def _crear_envios(tipo, nuevos, asunto):
+    notificaciones = Notificacion.objects.bulk_create([
+        Notificacion(persona_id=destinatario['persona_id'], mensaje=destinatario['mensaje'])
+        for _, destinatario in nuevos
+    ])
+    contadores.registrar_creadas(notificaciones)
+    return EnvioNotificacion.objects.bulk_create([
+        EnvioNotificacion(
+            notificacion=notificacion,
+            clave=clave,
+            email=destinatario['email'],
+            asunto=asunto,
+            tipo=tipo,
+            asignaciones=list(destinatario['asignaciones']),
+        )
+        for (clave, destinatario), notificacion in zip(nuevos, notificaciones)
+    ])
+
+
+def reservar_envios(limite=TAMANO_LOTE_ENVIOS, ids=None):
+    """
+    Toma hasta `limite` envíos pendientes en una transacción corta: SELECT ... FOR UPDATE
+    SKIP LOCKED y `proximo_intento` corrido DURACION_RESERVA hacia adelante. Mientras dura la
+    reserva ningún otro despachador los ve; si el proceso muere sin guardar el resultado,
+    vuelven a tomarse cuando vence.
+    """
+    with transaction.atomic():
+        queryset = (
+            EnvioNotificacion.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('notificacion')
+            .filter(situacion='pendiente', proximo_intento__lte=now())
+            .order_by('proximo_intento', 'id')
+        )
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        envios = list(queryset[:limite])
+        if envios:
+            reserva = now() + DURACION_RESERVA
+            EnvioNotificacion.objects.filter(id__in=[envio.id for envio in envios]).update(proximo_intento=reserva)
+            for envio in envios:
+                envio.proximo_intento = reserva
+    return envios
+
+
+def guardar_resultado(envio, resultado):
+    """
+    Guarda el resultado de un envío reservado. Los fallidos se reprograman con espera
+    creciente y pasan a 'fallido' tras MAX_INTENTOS_ENVIO intentos. Devuelve False si la
+    reserva ya no es de este despachador. Las asignaciones las marca marcar_notificadas().
+    """
+    reserva = envio.proximo_intento
+    momento = now()
+    envio.intentos += 1
+    if resultado['enviado']:
+        envio.situacion = 'enviado'
+        envio.fecha_envio = momento
+        envio.ultimo_error = None
+    else:
+        envio.ultimo_error = resultado['error'] or "El servidor no aceptó el mensaje"
+        if envio.intentos >= MAX_INTENTOS_ENVIO:
+            envio.situacion = 'fallido'
+        else:
+            envio.proximo_intento = momento + ESPERA_REINTENTO * 2 ** (envio.intentos - 1)
+
+    # La reserva identifica al despachador: si venció y otro tomó el envío, no se pisa
+    actualizados = EnvioNotificacion.objects.filter(
+        id=envio.id, situacion='pendiente', proximo_intento=reserva,
+    ).update(
+        situacion=envio.situacion, intentos=envio.intentos, ultimo_error=envio.ultimo_error,
+        proximo_intento=envio.proximo_intento, fecha_envio=envio.fecha_envio,
+    )
+    if not actualizados:
+        logger.warning(f"Envío {envio.id}: la reserva venció antes de guardar el resultado")
+    return bool(actualizados)
+
+
+def marcar_notificadas(envios):
+    """Marca `notificado` las asignaciones de los envíos: un UPDATE por modelo."""
+    asignaciones = {}
+    for envio in envios:
+        if envio.tipo in MODELOS_ASIGNACION and envio.asignaciones:
+            asignaciones.setdefault(envio.tipo, set()).update(envio.asignaciones)
+    with transaction.atomic():
+        for tipo, ids in asignaciones.items():
+            MODELOS_ASIGNACION[tipo].objects.filter(id__in=ids).update(notificado=True)
+
+
+def despachar_envios(limite=TAMANO_LOTE_ENVIOS, ids=None):
+    """
+    Envía un lote de envíos pendientes por una única conexión SMTP.
+
+    El lote se reserva en una transacción corta (ver reservar_envios) y los correos salen
+    fuera de ella: las esperas del limitador y del servidor no mantienen bloqueos abiertos.
+    El resultado de cada correo se guarda apenas se conoce, así que un error posterior no
+    vuelve a dejar pendiente un correo que ya salió. Las asignaciones de los enviados cuya
+    reserva seguía vigente se marcan `notificado` al final, en un UPDATE por modelo.
+    """
+    envios = reservar_envios(limite, ids)
+    if not envios:
+        return {"enviados": 0, "fallidos": 0}
+
+    enviados = []
+    fallidos = []
+    # Enviados con la reserva vigente al guardar: los únicos cuyas asignaciones se marcan
+    reservados = []
+
+    def al_enviar(indice, resultado):
+        envio = envios[indice]
+        guardado = guardar_resultado(envio, resultado)
+        if resultado['enviado']:
+            enviados.append(envio)
+            if guardado:
+                reservados.append(envio)
+        else:
+            fallidos.append(envio)
+
+    try:
+        enviar_mensajes(
+            [crear_mensaje(envio.email, envio.asunto, envio.notificacion.mensaje) for envio in envios],
+            al_enviar=al_enviar,
+        )
+    finally:
+        # Aunque el lote se corte, lo que ya salió queda marcado
+        marcar_notificadas(reservados)
+
+    logger.info(f"Despacho de notificaciones: {len(enviados)} enviadas, {len(fallidos)} con error")
+    return {
+        "enviados": len(enviados),
+        "fallidos": len(fallidos),
+        "errores": [{"email": envio.email, "error": envio.ultimo_error} for envio in fallidos],
+    }
@@ -0,0 +1,153 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import (
+    ActualizacionReporte, Asignatura, AsignaturaDocente, Departamento, Jefe, JefeDepartamento, Persona,
+    ReporteJefatura, ReportePlantaDocente, ReporteVacante, ReporteVencimiento, Resolucion,
+)
+
+logger = logging.getLogger(__name__)
+
+# Condiciones que no cubren el cargo al calcular vacantes
+CONDICIONES_SIN_COBERTURA = ('Renuncia',)
+
+TABLAS = {
+    'asignatura': Asignatura._meta.db_table,
+    'asignatura_docente': AsignaturaDocente._meta.db_table,
+    'departamento': Departamento._meta.db_table,
+    'jefe': Jefe._meta.db_table,
+    'jefe_departamento': JefeDepartamento._meta.db_table,
+    'persona': Persona._meta.db_table,
+    'resolucion': Resolucion._meta.db_table,
+}
+
+# Una asignación está vigente si está activa y no venció
+ASIGNACION_VIGENTE = "ad.estado = '1' AND (ad.fecha_de_vencimiento IS NULL OR ad.fecha_de_vencimiento >= %(ahora)s)"
+
+# GROUPING() devuelve un bit por columna agregada (departamento=8, cargo=4, dedicacion=2, condicion=1)
+SQL_PLANTA_DOCENTE = """
+    INSERT INTO {reporte} (agrupacion, departamento_id, cargo, dedicacion, condicion, asignaciones, docentes, asignaturas)
+    SELECT
+        CASE GROUPING(a.departamento_id, ad.cargo, ad.dedicacion, ad.condicion)
+            WHEN 0 THEN 'detalle'
+            WHEN 3 THEN 'cargo' WHEN 11 THEN 'cargo'
+            WHEN 5 THEN 'dedicacion' WHEN 13 THEN 'dedicacion'
+            WHEN 6 THEN 'condicion' WHEN 14 THEN 'condicion'
+            ELSE 'total'
+        END,
+        a.departamento_id, ad.cargo, ad.dedicacion, ad.condicion,
+        count(*), count(DISTINCT ad.docente_id), count(DISTINCT ad.asignatura_id)
+    FROM {asignatura_docente} ad
+    JOIN {asignatura} a ON a.id = ad.asignatura_id AND a.estado = '1'
+    WHERE {vigente}
+    GROUP BY GROUPING SETS (
+        (a.departamento_id, ad.cargo, ad.dedicacion, ad.condicion),
+        (a.departamento_id, ad.cargo), (a.departamento_id, ad.dedicacion), (a.departamento_id, ad.condicion),
+        (a.departamento_id), (ad.cargo), (ad.dedicacion), (ad.condicion), ()
+    )
+"""
+
+# Sin fecha de vencimiento en alguna asignación vigente, la cobertura no tiene fin
+SQL_VACANTES = """
+    INSERT INTO {reporte} (asignatura_id, departamento_id, area_id, docentes, profesores, ultimo_vencimiento)
+    SELECT
+        a.id, a.departamento_id, a.area_id,
+        count(DISTINCT ad.docente_id),
+        count(DISTINCT ad.docente_id) FILTER (WHERE ad.cargo LIKE 'PROFESOR%%'),
+        CASE WHEN bool_or(ad.id IS NOT NULL AND ad.fecha_de_vencimiento IS NULL) THEN NULL
+             ELSE max(ad.fecha_de_vencimiento) END
+    FROM {asignatura} a
+    LEFT JOIN {asignatura_docente} ad
+        ON ad.asignatura_id = a.id AND {vigente} AND ad.condicion <> ALL(%(sin_cobertura)s)
+    WHERE a.estado = '1'
+    GROUP BY a.id
+"""
+
+SQL_VENCIMIENTOS = """
+    INSERT INTO {reporte} (mes, departamento_id, tipo, cantidad, notificadas)
+    SELECT
+        date_trunc('month', v.fecha AT TIME ZONE %(zona)s)::date, v.departamento_id, v.tipo,
+        count(*), count(*) FILTER (WHERE v.notificado)
+    FROM (
+        SELECT a.departamento_id, 'asignatura_docente' AS tipo, ad.fecha_de_vencimiento AS fecha, ad.notificado
+        FROM {asignatura_docente} ad
+        JOIN {asignatura} a ON a.id = ad.asignatura_id
+        WHERE ad.estado = '1' AND ad.fecha_de_vencimiento >= %(inicio_mes)s
+        UNION ALL
+        SELECT jd.departamento_id, 'jefe_departamento', jd.fecha_de_fin, jd.notificado
+        FROM {jefe_departamento} jd
+        WHERE jd.estado = '1' AND jd.fecha_de_fin >= %(inicio_mes)s
+    ) v
+    GROUP BY 1, 2, 3
+"""
+
+SQL_JEFATURAS = """
+    INSERT INTO {reporte} (
+        departamento_id, jefe_departamento_id, apellido, nombre, nresolucion, fecha_de_inicio, fecha_de_fin, jefaturas
+    )
+    SELECT
+        d.id, v.id, v.apellido, v.nombre, v.nresolucion, v.fecha_de_inicio, v.fecha_de_fin,
+        (SELECT count(*) FROM {jefe_departamento} h WHERE h.departamento_id = d.id)
+    FROM {departamento} d
+    LEFT JOIN LATERAL (
+        SELECT jd.id, p.apellido, p.nombre, r.nresolucion, jd.fecha_de_inicio, jd.fecha_de_fin
+        FROM {jefe_departamento} jd
+        JOIN {jefe} j ON j.id = jd.jefe_id
+        JOIN {persona} p ON p.id = j.persona_id
+        JOIN {resolucion} r ON r.id = jd.resolucion_id
+        WHERE jd.departamento_id = d.id AND jd.estado = '1' AND jd.fecha_de_inicio <= %(ahora)s
+          AND (jd.fecha_de_fin IS NULL OR jd.fecha_de_fin >= %(ahora)s)
+        ORDER BY jd.fecha_de_inicio DESC
+        LIMIT 1
+    ) v ON true
+    WHERE d.estado = '1'
+"""
+
+REPORTES = {
+    'planta_docente': (ReportePlantaDocente, SQL_PLANTA_DOCENTE),
+    'vacantes': (ReporteVacante, SQL_VACANTES),
+    'vencimientos': (ReporteVencimiento, SQL_VENCIMIENTOS),
+    'jefaturas': (ReporteJefatura, SQL_JEFATURAS),
+}
+
+
+def actualizar_reportes(reportes=None):
+    """
+    Recalcula las tablas de reportes indicadas (todas por defecto) con un INSERT ... SELECT.
+
+    Cada tabla se reemplaza en su propia transacción: mientras tanto las consultas siguen
+    leyendo los datos anteriores, y el LOCK EXCLUSIVE solo frena a otra actualización
+    simultánea de la misma tabla. Devuelve {reporte: filas}.
+    """
+    ahora = timezone.now()
+    inicio_mes = timezone.localtime(ahora).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    parametros = {
+        'ahora': ahora,
+        'inicio_mes': inicio_mes,
+        'zona': settings.TIME_ZONE,
+        'sin_cobertura': list(CONDICIONES_SIN_COBERTURA),
+    }
+
+    resultado = {}
+    for nombre in reportes or REPORTES:
+        modelo, sql = REPORTES[nombre]
+        tabla = modelo._meta.db_table
+        inicio = time.monotonic()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {tabla} IN EXCLUSIVE MODE")
+            cursor.execute(f"DELETE FROM {tabla}")
+            cursor.execute(sql.format(reporte=tabla, vigente=ASIGNACION_VIGENTE, **TABLAS), parametros)
+            filas = cursor.rowcount
+            ActualizacionReporte.objects.update_or_create(reporte=nombre, defaults={
+                'fecha_actualizacion': timezone.now(),
+                'duracion_ms': round((time.monotonic() - inicio) * 1000),
+                'filas': filas,
+            })
+        resultado[nombre] = filas
+
+    logger.info(f"Reportes actualizados: {resultado}")
+    return resultado
@@ -0,0 +1,69 @@
+import gzip
+import json
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+from . import contadores
+from .models import EnvioNotificacion, Notificacion
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE_PURGA = 5000
+CAMPOS_ARCHIVO = ('id', 'persona_id', 'persona__dni', 'mensaje', 'leido', 'fecha_creacion')
+
+
+def ruta_archivo(directorio=None):
+    directorio = directorio or settings.NOTIFICACIONES_DIR_ARCHIVO
+    os.makedirs(directorio, exist_ok=True)
+    return os.path.join(directorio, f"notificaciones-{now():%Y%m%d-%H%M%S}.jsonl.gz")
+
+
+def archivar(archivo, filas):
+    """Agrega las filas al .jsonl.gz (cada lote queda como un miembro gzip más)."""
+    with gzip.open(archivo, 'at', encoding='utf-8') as salida:
+        for fila in filas:
+            salida.write(json.dumps(fila, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n')
+
+
+def purgar_notificaciones(antes_de, tamano_lote=TAMANO_LOTE_PURGA, archivo=None, pausa=0):
+    """
+    Elimina las notificaciones creadas antes de `antes_de` en lotes de `tamano_lote`, cada uno
+    en su propia transacción corta (DELETE ... WHERE id IN sobre ids tomados por el índice de
+    fecha), sin cargar los objetos en Python. Con `archivo` cada lote se agrega a un
+    .jsonl.gz (una notificación por línea) recién cuando su DELETE confirma: un lote que
+    vuelve atrás no queda archivado. `pausa` son segundos entre lotes.
+
+    Devuelve (eliminadas, lotes).
+    """
+    tabla_envios = EnvioNotificacion._meta.db_table
+    eliminadas = 0
+    lotes = 0
+    while True:
+        with transaction.atomic():
+            ids = tuple(
+                Notificacion.objects.filter(fecha_creacion__lt=antes_de)
+                .order_by('-fecha_creacion', 'id')
+                .values_list('id', flat=True)[:tamano_lote]
+            )
+            if not ids:
+                break
+            if archivo:
+                filas = list(Notificacion.objects.filter(id__in=ids).order_by('id').values(*CAMPOS_ARCHIVO))
+                transaction.on_commit(lambda filas=filas: archivar(archivo, filas))
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {tabla_envios} WHERE notificacion_id IN %s", [ids])
+                eliminadas += contadores.eliminar(cursor, ids)
+        lotes += 1
+        if len(ids) < tamano_lote:
+            break
+        if pausa:
+            time.sleep(pausa)
+
+    logger.info(f"Purga de notificaciones: {eliminadas} eliminadas en {lotes} lotes")
+    return eliminadas, lotes
@@ -13,4 +13,5 @@ from .asignaturaDocente import AsignaturaDocenteSerializer, AsignaturaDocenteCre
 from .carrera import CarreraSerializer
 from .directorCarrera import DirectorCarreraSerializer
 from .tipoTitulo import TipoTituloSerializer
-from .notificacion import NotificacionSerializer
\ No newline at end of file
+from .notificacion import NotificacionSerializer
+from .importacionPersonal import ImportacionPersonalSerializer, ImportacionPersonalErrorSerializer
\ No newline at end of file
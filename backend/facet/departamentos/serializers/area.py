@@ -1,11 +1,14 @@
 from rest_framework import serializers
 from ..models import Area, Departamento
+from .campos import CamposDinamicosSerializerMixin
 
-class AreaSerializer(serializers.ModelSerializer):
+class AreaSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     # Agregamos el ID de departamento para escritura y un campo adicional para mostrar los datos completos
     departamento = serializers.PrimaryKeyRelatedField(queryset=Departamento.objects.all())
     departamento_detalle = serializers.SerializerMethodField()
 
+    campos_fuente = {'departamento_detalle': ['departamento__id', 'departamento__nombre']}
+
     class Meta:
         model = Area
         fields = '__all__'  # Incluye todos los campos, incluyendo departamento y departamento_detalle
@@ -1,13 +1,19 @@
 from rest_framework import serializers
 from ..models import Asignatura, Area, Departamento
+from .campos import CamposDinamicosSerializerMixin
 
-class AsignaturaSerializer(serializers.ModelSerializer):
+class AsignaturaSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     # Agregamos los IDs para escritura y campos adicionales para mostrar los datos completos
     area = serializers.PrimaryKeyRelatedField(queryset=Area.objects.all())
     departamento = serializers.PrimaryKeyRelatedField(queryset=Departamento.objects.all())
     area_detalle = serializers.SerializerMethodField()
     departamento_detalle = serializers.SerializerMethodField()
 
+    campos_fuente = {
+        'area_detalle': ['area__id', 'area__nombre'],
+        'departamento_detalle': ['departamento__id', 'departamento__nombre'],
+    }
+
     class Meta:
         model = Asignatura
         fields = '__all__'  # Incluye todos los campos, incluyendo los detalles
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import AsignaturaCarrera
+from .campos import CamposDinamicosSerializerMixin
 
-class AsignaturaCarreraSerializer(serializers.ModelSerializer):
+class AsignaturaCarreraSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = AsignaturaCarrera
         fields = '__all__'
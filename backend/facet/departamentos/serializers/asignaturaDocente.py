@@ -3,8 +3,9 @@ from ..models import AsignaturaDocente,Docente,Asignatura,Resolucion
 from .docente import DocenteSerializer
 from .resolucion import ResolucionSerializer
 from .asignatura import AsignaturaSerializer
+from .campos import CamposDinamicosSerializerMixin
 
-class AsignaturaDocenteSerializer(serializers.ModelSerializer):
+class AsignaturaDocenteSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = AsignaturaDocente
         fields = '__all__'
@@ -18,7 +19,7 @@ class AsignaturaDocenteCreateSerializer(serializers.ModelSerializer):
         model = AsignaturaDocente
         fields = '__all__'
 
-class AsignaturaDocenteDetailSerializer(serializers.ModelSerializer):
+class AsignaturaDocenteDetailSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     docente = DocenteSerializer()
     asignatura = AsignaturaSerializer()
     resolucion = ResolucionSerializer()
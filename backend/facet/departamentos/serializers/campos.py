@@ -0,0 +1,78 @@
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def arbol_de_rutas(valor):
+    """'id,jefe.persona.apellido' -> {'id': {}, 'jefe': {'persona': {'apellido': {}}}}."""
+    arbol = {}
+    for ruta in valor.split(','):
+        nodo = arbol
+        for parte in ruta.strip().split('.'):
+            if parte:
+                nodo = nodo.setdefault(parte, {})
+    return arbol
+
+
+def pedido_de_campos(request):
+    """
+    (campos, expandir) pedidos con ?fields= y ?expand= en una lectura, como árboles de
+    rutas; cada uno es None si el parámetro no vino. Devuelve None si no vino ninguno.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    params = request.query_params
+    if 'fields' not in params and 'expand' not in params:
+        return None
+    campos = arbol_de_rutas(params['fields']) if 'fields' in params else None
+    expandir = arbol_de_rutas(params['expand']) if 'expand' in params else None
+    return campos or None, expandir
+
+
+class CamposDinamicosSerializerMixin:
+    """
+    Recorta la salida según ?fields= y ?expand= (solo en lecturas).
+
+    ?fields=id,jefe.persona deja esos campos; las rutas con punto recortan los serializers
+    anidados, y nombrar solo la relación la deja completa. Sin ?expand= los anidados se
+    mantienen como están declarados; con ?expand= solo se anidan las relaciones nombradas
+    (con punto para los niveles internos) y el resto se devuelve como id.
+
+    `campos_fuente` declara qué rutas ORM lee cada SerializerMethodField, para que la vista
+    pueda armar el only()/select_related de la consulta (ver apis.campos).
+    """
+    campos_fuente = {}
+
+    def ruta_en_raiz(self):
+        """Nombres de campo desde el serializer raíz hasta este (vacío en la raíz)."""
+        ruta = []
+        nodo = self
+        while nodo.parent is not None:
+            if nodo.field_name:
+                ruta.append(nodo.field_name)
+            nodo = nodo.parent
+        return ruta[::-1]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        pedido = pedido_de_campos(self.context.get('request'))
+        if pedido is None:
+            return fields
+        campos, expandir = pedido
+        for parte in self.ruta_en_raiz():
+            if campos is not None:
+                # Una relación nombrada sin subcampos se devuelve completa
+                campos = campos.get(parte) or None
+            if expandir is not None:
+                expandir = expandir.get(parte, {})
+
+        if campos is not None:
+            fields = {nombre: campo for nombre, campo in fields.items() if nombre in campos}
+        if expandir is not None:
+            for nombre, campo in fields.items():
+                if isinstance(campo, serializers.BaseSerializer) and nombre not in expandir:
+                    # Sin bind todavía, `source` solo está definido si difiere del nombre
+                    opciones = {'source': campo.source} if campo.source else {}
+                    fields[nombre] = serializers.PrimaryKeyRelatedField(
+                        read_only=True, many=isinstance(campo, serializers.ListSerializer), **opciones,
+                    )
+        return fields
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Carrera
+from .campos import CamposDinamicosSerializerMixin
 
-class CarreraSerializer(serializers.ModelSerializer):
+class CarreraSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Carrera
         fields = '__all__'
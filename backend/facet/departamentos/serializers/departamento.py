@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Departamento
+from .campos import CamposDinamicosSerializerMixin
 
-class DepartamentoSerializer(serializers.ModelSerializer):
+class DepartamentoSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Departamento
         fields = '__all__'
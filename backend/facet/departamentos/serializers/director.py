@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Director
+from .campos import CamposDinamicosSerializerMixin
 
-class DirectorSerializer(serializers.ModelSerializer):
+class DirectorSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Director
         fields = '__all__'
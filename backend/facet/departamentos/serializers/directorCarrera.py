@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import DirectorCarrera
+from .campos import CamposDinamicosSerializerMixin
 
-class DirectorCarreraSerializer(serializers.ModelSerializer):
+class DirectorCarreraSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = DirectorCarrera
         fields = '__all__'
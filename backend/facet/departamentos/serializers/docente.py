@@ -1,11 +1,19 @@
 from rest_framework import serializers
 from ..models import Docente, Persona
+from .campos import CamposDinamicosSerializerMixin
 
-class DocenteSerializer(serializers.ModelSerializer):
+class DocenteSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     # Agregamos el ID de persona para escritura y un campo adicional para mostrar los datos completos
     persona = serializers.PrimaryKeyRelatedField(queryset=Persona.objects.all())
     persona_detalle = serializers.SerializerMethodField()
 
+    campos_fuente = {
+        'persona_detalle': [
+            'persona__id', 'persona__nombre', 'persona__apellido', 'persona__dni',
+            'persona__telefono', 'persona__legajo', 'persona__email',
+        ],
+    }
+
     class Meta:
         model = Docente
         fields = '__all__'  # Incluye todos los campos, incluyendo persona y persona_detalle
@@ -0,0 +1,31 @@
+import os
+
+from rest_framework import serializers
+from ..models import ImportacionPersonal, ImportacionPersonalError
+
+EXTENSIONES_PLANILLA = ('.xlsx', '.csv')
+
+class ImportacionPersonalSerializer(serializers.ModelSerializer):
+    progreso = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = ImportacionPersonal
+        fields = [
+            'id', 'archivo', 'hoja', 'dry_run', 'desactivar_ausentes', 'situacion', 'progreso',
+            'total_filas', 'filas_invalidas', 'total_lotes', 'lotes_procesados', 'resumen',
+            'mensaje_error', 'task_id', 'fecha_creacion', 'fecha_inicio', 'fecha_fin',
+        ]
+        read_only_fields = [
+            'situacion', 'total_filas', 'filas_invalidas', 'total_lotes', 'lotes_procesados',
+            'resumen', 'mensaje_error', 'task_id', 'fecha_inicio', 'fecha_fin',
+        ]
+
+    def validate_archivo(self, archivo):
+        if os.path.splitext(archivo.name)[1].lower() not in EXTENSIONES_PLANILLA:
+            raise serializers.ValidationError("La planilla debe ser un archivo .xlsx o .csv")
+        return archivo
+
+class ImportacionPersonalErrorSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ImportacionPersonalError
+        fields = ['id', 'fila', 'lote', 'mensaje']
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Jefe, Persona
+from .campos import CamposDinamicosSerializerMixin
 
-class JefeSerializer(serializers.ModelSerializer):
+class JefeSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     # Permitimos tanto lectura como escritura del ID de persona
     persona = serializers.PrimaryKeyRelatedField(queryset=Persona.objects.all())
 
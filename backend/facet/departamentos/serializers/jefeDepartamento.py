@@ -3,8 +3,9 @@ from ..models import JefeDepartamento, Jefe, Departamento, Resolucion
 from .jefe import JefeSerializer
 from .resolucion import ResolucionSerializer
 from .departamento import DepartamentoSerializer
+from .campos import CamposDinamicosSerializerMixin
 
-class JefeDepartamentoSerializer(serializers.ModelSerializer):
+class JefeDepartamentoSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     """Serializer general para JefeDepartamento, incluyendo el campo 'notificado'."""
     
     class Meta:
@@ -23,7 +24,7 @@ class JefeDepartamentoCreateSerializer(serializers.ModelSerializer):
         model = JefeDepartamento
         fields = '__all__'
 
-class JefeDepartamentoDetailSerializer(serializers.ModelSerializer):
+class JefeDepartamentoDetailSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     """Serializer detallado que anida las relaciones en lugar de usar IDs."""
     
     jefe = JefeSerializer()
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Notificacion
+from .campos import CamposDinamicosSerializerMixin
 
-class NotificacionSerializer(serializers.ModelSerializer):
+class NotificacionSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     persona_nombre = serializers.CharField(source="persona.nombre", read_only=True)
     persona_apellido = serializers.CharField(source="persona.apellido", read_only=True)
 
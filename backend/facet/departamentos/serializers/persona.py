@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Persona
+from .campos import CamposDinamicosSerializerMixin
 
-class PersonaSerializer(serializers.ModelSerializer):
+class PersonaSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Persona
         fields = '__all__'
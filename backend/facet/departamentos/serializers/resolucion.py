@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import Resolucion
+from .campos import CamposDinamicosSerializerMixin
 
-class ResolucionSerializer(serializers.ModelSerializer):
+class ResolucionSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Resolucion
         fields = '__all__'
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from ..models import TipoTitulo
+from .campos import CamposDinamicosSerializerMixin
 
-class TipoTituloSerializer(serializers.ModelSerializer):
+class TipoTituloSerializer(CamposDinamicosSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = TipoTitulo
         fields = '__all__'
@@ -1,168 +1,224 @@
 from celery import shared_task
-from django.core.mail import send_mail
 from django.conf import settings
 from django.utils.timezone import now
 from datetime import timedelta
-from .models import Notificacion, Persona, JefeDepartamento, AsignaturaDocente
+from . import contadores
+from .models import Notificacion, Persona
+from .notificaciones import (
+    ORIGEN_MANUAL, TAMANO_LOTE_ENVIOS, despachar_envios, envio_registrado, registrar_envios,
+)
+from .reportes import actualizar_reportes
+from .retencion import purgar_notificaciones, ruta_archivo
+from .vencimientos import DIAS_AVISO_VENCIMIENTO, TIPOS_VENCIMIENTO, consulta_vencimientos
 import logging
 
 logger = logging.getLogger(__name__)
 
-@shared_task(bind=True, max_retries=3)
-def enviar_email_notificacion_task(self, persona_id, mensaje, subject="Notificación - Renovación de jefatura"):
+@shared_task
+def enviar_email_notificacion_task(persona_id, mensaje, subject="Notificación - Renovación de jefatura", asignacion_ids=None):
     """
     Tarea asíncrona para enviar notificaciones por email a jefes de departamento
     """
-    try:
-        persona = Persona.objects.get(id=persona_id)
-        
-        if not persona.email:
-            logger.error(f"Persona {persona_id} no tiene email registrado")
-            return {"error": "La persona no tiene un correo registrado"}
-
-        # Crear notificación en la base de datos
-        notificacion = Notificacion.objects.create(
-            persona=persona,
-            mensaje=mensaje
-        )
+    return notificar_asignacion('jefe_departamento', persona_id, mensaje, subject, asignacion_ids)
 
-        # Enviar correo
-        send_mail(
-            subject=subject,
-            message=mensaje,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[persona.email],
-            fail_silently=False,
-        )
 
-        # Marcar como notificado
-        try:
-            jefe_departamento = JefeDepartamento.objects.get(jefe__persona__id=persona_id)
-            jefe_departamento.notificado = True
-            jefe_departamento.save()
-        except JefeDepartamento.DoesNotExist:
-            logger.warning(f"No se encontró JefeDepartamento para persona {persona_id}")
+@shared_task
+def enviar_email_asignatura_task(persona_id, mensaje, subject="Notificación - Renovación de cargo", asignacion_ids=None):
+    """
+    Tarea asíncrona para enviar notificaciones por email a docentes de asignatura
+    """
+    return notificar_asignacion('asignatura_docente', persona_id, mensaje, subject, asignacion_ids)
 
-        logger.info(f"Email enviado exitosamente a {persona.email}")
-        return {
-            "success": True,
-            "email": persona.email,
-            "notificacion_id": notificacion.id
-        }
 
-    except Persona.DoesNotExist:
-        logger.error(f"Persona {persona_id} no encontrada")
-        return {"error": "Persona no encontrada"}
-    
-    except Exception as exc:
-        logger.error(f"Error enviando email: {str(exc)}")
-        # Reintento automático
-        if self.request.retries < self.max_retries:
-            raise self.retry(countdown=60, exc=exc)
-        return {"error": f"Error después de {self.max_retries} intentos: {str(exc)}"}
+def aviso_manual(tipo, persona, mensaje, asignacion_ids=None):
+    """Destinatario de un mensaje cargado a mano para las asignaciones activas de la persona."""
+    asignaciones = asignaciones_de_persona(tipo, persona.id, asignacion_ids)
+    if not asignaciones:
+        logger.warning(f"No se encontró {TIPOS_VENCIMIENTO[tipo]['modelo'].__name__} para persona {persona.id}")
+    vencimientos = [vencimiento for _, vencimiento in asignaciones if vencimiento]
+    return {
+        'persona_id': persona.id,
+        'asignaciones': [asignacion_id for asignacion_id, _ in asignaciones],
+        'vencimiento': min(vencimientos, default=None),
+        'email': persona.email,
+        'mensaje': mensaje,
+        'origen': ORIGEN_MANUAL,
+    }
 
 
-@shared_task(bind=True, max_retries=3)
-def enviar_email_asignatura_task(self, persona_id, mensaje, subject="Notificación - Renovación de cargo"):
+def notificar_asignacion(tipo, persona_id, mensaje, subject, asignacion_ids=None):
     """
-    Tarea asíncrona para enviar notificaciones por email a docentes de asignatura
+    Registra el aviso en la bandeja de salida y lo envía en el momento. Si el mismo mensaje
+    ya se registró hoy para la persona y los mismos cargos no se envía de nuevo y se devuelve
+    como duplicado; si el envío falla lo reintenta `despachar_notificaciones_task` en lugar
+    de reencolar esta tarea.
+
+    `asignacion_ids` son las asignaciones exactas que se marcan como notificadas; sin ellas
+    se toman todas las asignaciones activas de la persona (un docente puede tener varias).
     """
     try:
         persona = Persona.objects.get(id=persona_id)
-        
-        if not persona.email:
-            logger.error(f"Persona {persona_id} no tiene email registrado")
-            return {"error": "La persona no tiene un correo registrado"}
-
-        # Crear notificación en la base de datos
-        notificacion = Notificacion.objects.create(
-            persona=persona,
-            mensaje=mensaje
-        )
-
-        # Enviar correo
-        send_mail(
-            subject=subject,
-            message=mensaje,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[persona.email],
-            fail_silently=False,
-        )
+    except Persona.DoesNotExist:
+        logger.error(f"Persona {persona_id} no encontrada")
+        return {"error": "Persona no encontrada"}
 
-        # Marcar como notificado
-        try:
-            asignatura_docente = AsignaturaDocente.objects.get(docente__persona__id=persona_id)
-            asignatura_docente.notificado = True
-            asignatura_docente.save()
-        except AsignaturaDocente.DoesNotExist:
-            logger.warning(f"No se encontró AsignaturaDocente para persona {persona_id}")
+    if not persona.email:
+        logger.error(f"Persona {persona_id} no tiene email registrado")
+        return {"error": "La persona no tiene un correo registrado"}
 
-        logger.info(f"Email enviado exitosamente a {persona.email}")
+    destinatario = aviso_manual(tipo, persona, mensaje, asignacion_ids)
+    envios = registrar_envios(tipo, [destinatario], subject)
+    if not envios:
+        existente = envio_registrado(tipo, destinatario)
+        logger.warning(f"Notificación ya registrada para persona {persona_id}: no se reenvía")
         return {
-            "success": True,
+            "success": False,
+            "duplicado": True,
+            "error": "El mismo mensaje ya fue registrado hoy para esta persona",
             "email": persona.email,
-            "notificacion_id": notificacion.id
+            "notificacion_id": existente.notificacion_id if existente else None,
         }
 
-    except Persona.DoesNotExist:
-        logger.error(f"Persona {persona_id} no encontrada")
-        return {"error": "Persona no encontrada"}
-    
-    except Exception as exc:
-        logger.error(f"Error enviando email: {str(exc)}")
-        # Reintento automático
-        if self.request.retries < self.max_retries:
-            raise self.retry(countdown=60, exc=exc)
-        return {"error": f"Error después de {self.max_retries} intentos: {str(exc)}"}
+    envio = envios[0]
+    resultado = despachar_envios(ids=[envio.id])
+    if resultado["enviados"]:
+        logger.info(f"Email enviado exitosamente a {persona.email}")
+    return {
+        "success": bool(resultado["enviados"]),
+        "email": persona.email,
+        "notificacion_id": envio.notificacion_id,
+        "errores": resultado.get("errores", []),
+    }
 
 
-@shared_task
-def verificar_documentaciones_task():
-    """
-    Tarea programada para verificar vencimientos de documentaciones
-    Se ejecuta diariamente para detectar documentaciones que vencen en 30 días
-    """
-    try:
-        fecha_limite = now() + timedelta(days=30)
-        jefes_departamentos = JefeDepartamento.objects.filter(
-            fecha_de_fin__lte=fecha_limite.date(),
-            fecha_de_fin__isnull=False,
-            estado=1  # Solo activos
-        )
+MENSAJE_VENCIMIENTO_JEFE = """
+Estimado/a {nombre} {apellido},
+
+Le informamos que su cargo como jefe/a del departamento {departamento} 
+vence el {vencimiento}.
+
+Para renovar su cargo, debe acercarse al área de Personal con la documentación necesaria.
+
+Gracias por su atención.
+
+Área de Personal
+""".strip()
+
+MENSAJE_VENCIMIENTO_ASIGNATURA = """
+Estimado/a {nombre} {apellido},
 
-        emails_enviados = 0
-        
-        for jefe_departamento in jefes_departamentos:
-            persona = jefe_departamento.jefe.persona
-            
-            # Evitar enviar múltiples notificaciones para la misma persona
-            if jefe_departamento.notificado:
-                continue
-                
-            mensaje = f"""
-Estimado/a {persona.nombre} {persona.apellido},
-
-Le informamos que su cargo como jefe/a del departamento {jefe_departamento.departamento.nombre} 
-vence el {jefe_departamento.fecha_de_fin.strftime('%d/%m/%Y')}.
+Le informamos que su cargo de {cargo} en la asignatura {asignatura} 
+vence el {vencimiento}.
 
 Para renovar su cargo, debe acercarse al área de Personal con la documentación necesaria.
 
 Gracias por su atención.
 
 Área de Personal
-            """.strip()
+""".strip()
 
-            # Enviar notificación de forma asíncrona
-            enviar_email_notificacion_task.delay(
-                persona_id=persona.id,
-                mensaje=mensaje,
-                subject="Recordatorio de Renovación de Cargo - Próximo Vencimiento"
-            )
-            
-            emails_enviados += 1
+MENSAJE_VENCIMIENTO_DIRECTOR = """
+Estimado/a {nombre} {apellido},
 
-        logger.info(f"Proceso de verificación completado. {emails_enviados} notificaciones programadas.")
-        return {"success": True, "emails_programados": emails_enviados}
+Le informamos que su cargo como director/a de la carrera {carrera} 
+vence el {vencimiento}.
+
+Para renovar su cargo, debe acercarse al área de Personal con la documentación necesaria.
+
+Gracias por su atención.
+
+Área de Personal
+""".strip()
+
+# Aviso de vencimiento de cada tipo (ver vencimientos.TIPOS_VENCIMIENTO): plantilla, asunto y
+# columnas de la consulta de vencimientos que completa la plantilla
+VENCIMIENTOS = {
+    'jefe_departamento': {
+        'campos': {'departamento': 'detalle'},
+        'plantilla': MENSAJE_VENCIMIENTO_JEFE,
+        'subject': "Recordatorio de Renovación de Cargo - Próximo Vencimiento",
+    },
+    'asignatura_docente': {
+        'campos': {'cargo': 'puesto', 'asignatura': 'detalle'},
+        'plantilla': MENSAJE_VENCIMIENTO_ASIGNATURA,
+        'subject': "Recordatorio de Renovación de Cargo Docente - Próximo Vencimiento",
+    },
+    'director_carrera': {
+        'campos': {'carrera': 'detalle'},
+        'plantilla': MENSAJE_VENCIMIENTO_DIRECTOR,
+        'subject': "Recordatorio de Renovación de Cargo de Director - Próximo Vencimiento",
+    },
+}
+
+
+def asignaciones_de_persona(tipo, persona_id, asignacion_ids=None):
+    """Pares (id, vencimiento) de las asignaciones activas de la persona, en una consulta."""
+    config = TIPOS_VENCIMIENTO[tipo]
+    queryset = config['modelo'].objects.activos().filter(**{f"{config['persona']}__id": persona_id})
+    if asignacion_ids is not None:
+        queryset = queryset.filter(id__in=asignacion_ids)
+    return list(queryset.order_by('id').values_list('id', config['campo_fecha']))
+
+
+def destinatarios_vencimiento(fecha_limite):
+    """
+    Asignaciones activas de todos los tipos, sin notificar y con vencimiento hasta `fecha_limite`,
+    leídas con la consulta única de vencimientos; devuelve {tipo: mensajes ya armados}.
+    """
+    destinatarios = {tipo: [] for tipo in VENCIMIENTOS}
+    filas = consulta_vencimientos(fin=fecha_limite, tipos=list(VENCIMIENTOS), notificado=False, con_email=True)
+    for fila in filas:
+        config = VENCIMIENTOS[fila['tipo']]
+        mensaje = config['plantilla'].format(
+            nombre=fila['nombre'],
+            apellido=fila['apellido'],
+            vencimiento=fila['fecha'].strftime('%d/%m/%Y'),
+            **{campo: fila[columna] for campo, columna in config['campos'].items()},
+        )
+        destinatarios[fila['tipo']].append({
+            'asignaciones': [fila['id']],
+            'persona_id': fila['persona'],
+            'vencimiento': fila['fecha'],
+            'email': fila['email'],
+            'mensaje': mensaje,
+        })
+    return destinatarios
+
+
+@shared_task
+def despachar_notificaciones_task(max_lotes=20):
+    """Vacía la bandeja de salida de notificaciones en lotes de TAMANO_LOTE_ENVIOS."""
+    total = {"enviados": 0, "fallidos": 0}
+    for _ in range(max_lotes):
+        resultado = despachar_envios()
+        total["enviados"] += resultado["enviados"]
+        total["fallidos"] += resultado["fallidos"]
+        if resultado["enviados"] + resultado["fallidos"] < TAMANO_LOTE_ENVIOS:
+            break
+    return total
+
+
+@shared_task
+def verificar_documentaciones_task():
+    """
+    Tarea programada para verificar vencimientos de documentaciones
+    Se ejecuta diariamente para detectar jefaturas, cargos docentes y direcciones de carrera
+    que vencen en 30 días, registra los avisos en la bandeja de salida y lanza el despacho.
+    """
+    try:
+        fecha_limite = now() + timedelta(days=DIAS_AVISO_VENCIMIENTO)
+        resultado = {"success": True, "emails_programados": 0}
+
+        for tipo, destinatarios in destinatarios_vencimiento(fecha_limite).items():
+            registrados = registrar_envios(tipo, destinatarios, VENCIMIENTOS[tipo]['subject'])
+            resultado[tipo] = len(registrados)
+            resultado["emails_programados"] += len(registrados)
+
+        if resultado["emails_programados"]:
+            despachar_notificaciones_task.delay()
+
+        logger.info(f"Proceso de verificación completado. {resultado['emails_programados']} notificaciones programadas.")
+        return resultado
 
     except Exception as exc:
         logger.error(f"Error en verificación de documentaciones: {str(exc)}")
@@ -170,19 +226,46 @@ Gracias por su atención.
 
 
 @shared_task
-def limpiar_notificaciones_antiguas():
+def limpiar_notificaciones_antiguas(dias=None, archivar=None):
     """
-    Tarea para limpiar notificaciones antiguas (más de 6 meses)
+    Tarea para limpiar notificaciones antiguas (por defecto más de 6 meses)
+    Borra en lotes cortos (ver retencion.purgar_notificaciones) y, si NOTIFICACIONES_ARCHIVAR
+    está activo, guarda antes las notificaciones en un archivo .jsonl.gz.
     """
     try:
-        fecha_limite = now() - timedelta(days=180)
-        notificaciones_eliminadas = Notificacion.objects.filter(
-            fecha_creacion__lt=fecha_limite
-        ).delete()[0]
-        
+        dias = dias if dias is not None else settings.NOTIFICACIONES_DIAS_RETENCION
+        archivar = archivar if archivar is not None else settings.NOTIFICACIONES_ARCHIVAR
+        fecha_limite = now() - timedelta(days=dias)
+        archivo = ruta_archivo() if archivar else None
+        notificaciones_eliminadas, lotes = purgar_notificaciones(fecha_limite, archivo=archivo)
+
         logger.info(f"Eliminadas {notificaciones_eliminadas} notificaciones antiguas")
-        return {"success": True, "eliminadas": notificaciones_eliminadas}
-        
+        return {"success": True, "eliminadas": notificaciones_eliminadas, "lotes": lotes, "archivo": archivo}
+
     except Exception as exc:
         logger.error(f"Error limpiando notificaciones: {str(exc)}")
-        return {"error": str(exc)} 
\ No newline at end of file
+        return {"error": str(exc)}
+
+
+@shared_task
+def actualizar_reportes_task(reportes=None):
+    """Recalcula las tablas de reportes (ver reportes.actualizar_reportes)."""
+    try:
+        return {"success": True, "filas": actualizar_reportes(reportes)}
+    except Exception as exc:
+        logger.error(f"Error actualizando reportes: {str(exc)}")
+        return {"error": str(exc)}
+
+
+@shared_task
+def recalcular_contadores_task():
+    """
+    Reconstruye los contadores de notificaciones por persona. Corrige los desvíos de las
+    escrituras que no pasan por save()/delete() (UPDATE o DELETE por queryset, SQL directo).
+    """
+    try:
+        contadores.recalcular()
+        return {"success": True}
+    except Exception as exc:
+        logger.error(f"Error recalculando contadores de notificaciones: {str(exc)}")
+        return {"error": str(exc)}
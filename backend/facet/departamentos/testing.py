@@ -0,0 +1,54 @@
+from urllib.parse import urlsplit
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+
+def parametro_tamanio_pagina(url):
+    """Parámetro de tamaño de página de la paginación que usa la vista de `url`."""
+    vista = resolve(urlsplit(url).path).func
+    paginacion = getattr(getattr(vista, 'cls', None), 'pagination_class', None)
+    if paginacion is None:
+        return None
+    return getattr(paginacion, 'page_size_query_param', None) or getattr(paginacion, 'limit_query_param', None)
+
+
+def contar_consultas(cliente, url):
+    """(respuesta, consultas SQL ejecutadas) de un GET con el cliente de prueba de DRF."""
+    with CaptureQueriesContext(connection) as contexto:
+        respuesta = cliente.get(url)
+    return respuesta, len(contexto)
+
+
+def assert_consultas_constantes(cliente, url, tamanios=(1, 20)):
+    """
+    Pide el listado `url` con cada tamaño de página y falla si la cantidad de consultas
+    cambia: una consulta por fila (relación sin select_related, método del serializer que
+    recorre una relación) hace crecer el total con la página. Hacen falta más filas que el
+    menor tamaño para que la comparación diga algo. Devuelve {tamaño: consultas}.
+
+    Antes de medir se hace un pedido con otro tamaño, para que el conteo cacheado por
+    filtros (apis.conteo) no cuente solo en la primera medición; la cache de respuestas
+    va por URL y no lo reutiliza.
+    """
+    parametro = parametro_tamanio_pagina(url)
+    if parametro is None:
+        raise AssertionError(f"{url}: la vista no tiene paginación con tamaño configurable")
+
+    separador = '&' if '?' in url else '?'
+    cliente.get(f'{url}{separador}{parametro}={max(tamanios) + 1}')
+    consultas = {}
+    filas = {}
+    for tamanio in tamanios:
+        respuesta, consultas[tamanio] = contar_consultas(cliente, f'{url}{separador}{parametro}={tamanio}')
+        if respuesta.status_code != 200:
+            raise AssertionError(f"{url}: respuesta {respuesta.status_code} con {parametro}={tamanio}")
+        datos = respuesta.data
+        filas[tamanio] = len(datos['results'] if isinstance(datos, dict) else datos)
+
+    if len(set(filas.values())) < 2:
+        raise AssertionError(f"{url}: faltan datos, todas las páginas trajeron las mismas filas {filas}")
+    if len(set(consultas.values())) > 1:
+        raise AssertionError(f"{url}: las consultas crecen con la página {consultas} (filas {filas})")
+    return consultas
@@ -1,3 +1,1275 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import os
+import smtplib
+import tempfile
+from datetime import date, timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models import Count, DateField, Q, Value
+from django.db.models.sql import Query
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from openpyxl import load_workbook
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import contadores
+from .models import (
+    ActualizacionReporte, Area, Asignatura, AsignaturaCarrera, AsignaturaDocente, Carrera, ContadorNotificaciones,
+    Departamento, Director, DirectorCarrera, Docente, EnvioNotificacion, Jefe, JefeDepartamento, NoDocente,
+    Notificacion, Persona, ReporteJefatura, ReportePlantaDocente, ReporteVacante, ReporteVencimiento, Resolucion,
+    TipoTitulo,
+)
+from .apis.conteo import clave_conteo, contar, estimar_conteo, modelos_consultados
+from .apis.exportacion import CONTENT_TYPE_XLSX
+from .apis.pagination import StandardResultsSetPagination
+from .apis.persona import Edad, PersonaViewSet, SumarAnios, sumar_anios
+from .apis.search import trigram_disponible
+from .emails import MAX_RECONEXIONES, LimitadorEnvios, crear_mensaje, enviar_mensajes
+from .importacion import importar_personal
+from .invalidacion import invalidar_modelo, version_modelo
+from .notificaciones import despachar_envios, guardar_resultado, registrar_envios, reservar_envios
+from .reportes import actualizar_reportes
+from .retencion import CAMPOS_ARCHIVO, purgar_notificaciones
+from .tasks import enviar_email_notificacion_task, recalcular_contadores_task
+from .testing import assert_consultas_constantes
+
+FILAS = 25
+
+# Listados paginados; las variantes con ?fields=/?expand= recorren otro árbol de serializers
+LISTADOS = [
+    '/facet/area/',
+    '/facet/asignatura/',
+    '/facet/asignatura-carrera/',
+    '/facet/asignatura-docente/',
+    '/facet/asignatura-docente/?expand=asignatura,docente',
+    '/facet/asignatura-docente/?fields=id,docente.persona_detalle&expand=docente',
+    '/facet/carrera/',
+    '/facet/departamento/',
+    '/facet/director/',
+    '/facet/director-carrera/',
+    '/facet/docente/',
+    '/facet/jefe/',
+    '/facet/jefe-departamento/',
+    '/facet/jefe-departamento/?fields=id,jefe.persona,departamento.nombre',
+    '/facet/nodocente/',
+    '/facet/notificacion/',
+    '/facet/persona/',
+    '/facet/resolucion/',
+    '/facet/tipo-titulo/',
+    '/facet/vencimientos/?dias=90',
+]
+
+
+class ConsultasPorListadoTests(TestCase):
+    """La cantidad de consultas de cada listado no depende del tamaño de página."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ahora = timezone.now()
+        cls.usuario = get_user_model().objects.create_user(email='consultas@facet.test', password='x')
+        departamento = Departamento.objects.create(nombre='Informática', estado='1')
+        area = Area.objects.create(departamento=departamento, nombre='Programación', estado='1')
+        carrera = Carrera.objects.create(nombre='Licenciatura', tipo='Grado', planestudio='2020', estado='1')
+        resolucion = Resolucion.objects.create(
+            nexpediente='1/2024', nresolucion='100/2024', tipo='Consejo_Superior',
+            adjunto='res.pdf', fecha=ahora, estado='1',
+        )
+        for i in range(FILAS):
+            TipoTitulo.objects.create(nombre=f'Título {i}')
+            Departamento.objects.create(nombre=f'Departamento {i}', estado='1')
+            Carrera.objects.create(nombre=f'Carrera {i}', tipo='Grado', planestudio='2020', estado='1')
+            Resolucion.objects.create(
+                nexpediente=f'{i}/2024', nresolucion=f'{i}/2024', tipo='Consejo_Superior',
+                adjunto='res.pdf', fecha=ahora, estado='1',
+            )
+            Area.objects.create(departamento=departamento, nombre=f'Área {i}', estado='1')
+            asignatura = Asignatura.objects.create(
+                area=area, departamento=departamento, codigo=str(i), nombre=f'Asignatura {i}',
+                modulo='1', tipo='Obligatoria', estado='1',
+            )
+            AsignaturaCarrera.objects.create(asignatura=asignatura, carrera=carrera, estado='1')
+
+            # Cuatro personas por vuelta: docente, jefe, director y no docente
+            personas = [
+                Persona.objects.create(
+                    nombre=f'Nombre {i}-{j}', apellido=f'Apellido {i}-{j}', dni=f'{i:04d}{j}',
+                    email=f'p{i}-{j}@facet.test', estado='1',
+                )
+                for j in range(4)
+            ]
+            docente = Docente.objects.create(persona=personas[0], estado='1')
+            jefe = Jefe.objects.create(persona=personas[1], estado='1')
+            director = Director.objects.create(persona=personas[2], estado='1')
+            NoDocente.objects.create(persona=personas[3], estado='1')
+            vence = ahora + timedelta(days=1 + i)
+            AsignaturaDocente.objects.create(
+                asignatura=asignatura, docente=docente, resolucion=resolucion, condicion='Regular',
+                cargo='AUX DOC DE PRIMERA', dedicacion='SIMP', fecha_de_inicio=ahora,
+                fecha_de_vencimiento=vence, estado='1',
+            )
+            JefeDepartamento.objects.create(
+                departamento=departamento, jefe=jefe, resolucion=resolucion,
+                fecha_de_inicio=ahora, fecha_de_fin=vence, estado='1',
+            )
+            DirectorCarrera.objects.create(
+                carrera=carrera, director=director, resolucion=resolucion,
+                fecha_de_inicio=ahora, fecha_de_fin=vence, observaciones='', estado='1',
+            )
+            Notificacion.objects.create(persona=personas[0], mensaje=f'Aviso {i}')
+
+    def setUp(self):
+        # Las respuestas cacheadas no consultan la base y esconderían el N+1
+        cache.clear()
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.usuario)
+
+    def test_listados_con_consultas_constantes(self):
+        for url in LISTADOS:
+            with self.subTest(url=url):
+                assert_consultas_constantes(self.cliente, url, tamanios=(2, 20))
+
+    def test_cursor_con_campos_sin_clave_primaria(self):
+        # ?fields= sin 'id': el cursor igual necesita la clave primaria de la última fila
+        url = '/facet/persona/?paginacion=cursor&limit=5&fields=nombre'
+        nombres = []
+        while url and len(nombres) < 15:
+            respuesta = self.cliente.get(url)
+            self.assertEqual(respuesta.status_code, 200)
+            self.assertTrue(all(set(fila) == {'nombre'} for fila in respuesta.data['results']))
+            nombres += [fila['nombre'] for fila in respuesta.data['results']]
+            url = respuesta.data['next']
+        self.assertEqual(len(nombres), 15)
+        self.assertEqual(len(set(nombres)), 15)
+
+
+def crear_jefatura(dni='30111222', email='jefe@facet.test', vence=None):
+    """Persona con email, jefe y una jefatura activa que vence en `vence` (por defecto 10 días)."""
+    ahora = timezone.now()
+    persona = Persona.objects.create(nombre='Ana', apellido='Paz', dni=dni, email=email, estado='1')
+    departamento = Departamento.objects.create(nombre=f'Departamento {dni}', estado='1')
+    resolucion = Resolucion.objects.create(
+        nexpediente=f'{dni}/2024', nresolucion=f'{dni}/2024', tipo='Consejo_Superior',
+        adjunto='res.pdf', fecha=ahora, estado='1',
+    )
+    return JefeDepartamento.objects.create(
+        departamento=departamento, jefe=Jefe.objects.create(persona=persona, estado='1'),
+        resolucion=resolucion, fecha_de_inicio=ahora,
+        fecha_de_fin=vence or ahora + timedelta(days=10), estado='1',
+    )
+
+
+class DespachoEnviosTests(TestCase):
+    """Bandeja de salida: reserva del lote, envío y resultado guardado por correo."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jefatura = crear_jefatura()
+
+    def registrar(self):
+        persona = self.jefatura.jefe.persona
+        [envio] = registrar_envios('jefe_departamento', [{
+            'persona_id': persona.id,
+            'asignaciones': [self.jefatura.id],
+            'vencimiento': self.jefatura.fecha_de_fin,
+            'email': persona.email,
+            'mensaje': 'Su jefatura vence pronto',
+        }], 'Vencimiento')
+        return envio
+
+    def test_envio_exitoso_marca_enviado_y_notificado(self):
+        envio = self.registrar()
+        resultado = despachar_envios()
+
+        self.assertEqual((resultado['enviados'], resultado['fallidos']), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        envio.refresh_from_db()
+        self.assertEqual((envio.situacion, envio.intentos), ('enviado', 1))
+        self.jefatura.refresh_from_db()
+        self.assertTrue(self.jefatura.notificado)
+
+    def test_asignaciones_marcadas_en_un_update_por_modelo(self):
+        self.registrar()
+        otras = [crear_jefatura(dni=f'3000000{i}', email=f'jefe{i}@facet.test') for i in range(3)]
+        for jefatura in otras:
+            persona = jefatura.jefe.persona
+            registrar_envios('jefe_departamento', [{
+                'persona_id': persona.id, 'asignaciones': [jefatura.id], 'vencimiento': jefatura.fecha_de_fin,
+                'email': persona.email, 'mensaje': 'Su jefatura vence pronto',
+            }], 'Vencimiento')
+
+        with CaptureQueriesContext(connection) as consultas:
+            self.assertEqual(despachar_envios()['enviados'], 4)
+        tabla = JefeDepartamento._meta.db_table
+        updates = [q['sql'] for q in consultas.captured_queries if q['sql'].startswith(f'UPDATE "{tabla}"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(JefeDepartamento.objects.filter(notificado=True).count(), 4)
+
+    def test_reserva_perdida_no_marca_asignaciones(self):
+        self.registrar()
+        with mock.patch('departamentos.notificaciones.guardar_resultado', return_value=False):
+            self.assertEqual(despachar_envios()['enviados'], 1)
+        self.jefatura.refresh_from_db()
+        self.assertFalse(self.jefatura.notificado)
+
+    def test_lote_reservado_no_lo_toma_otro_despachador(self):
+        self.registrar()
+        self.assertEqual(len(reservar_envios()), 1)
+        self.assertEqual(reservar_envios(), [])
+        self.assertEqual(despachar_envios()['enviados'], 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_fallo_reprograma_con_espera(self):
+        self.registrar()
+        [envio] = reservar_envios()
+        self.assertTrue(guardar_resultado(envio, {'enviado': False, 'error': 'Buzón lleno'}))
+
+        envio.refresh_from_db()
+        self.assertEqual((envio.situacion, envio.intentos, envio.ultimo_error), ('pendiente', 1, 'Buzón lleno'))
+        self.assertGreater(envio.proximo_intento, timezone.now())
+        self.jefatura.refresh_from_db()
+        self.assertFalse(self.jefatura.notificado)
+
+    def test_reserva_vencida_no_pisa_al_otro_despachador(self):
+        self.registrar()
+        [envio] = reservar_envios()
+        # La reserva venció y otro despachador tomó el envío con una reserva nueva
+        EnvioNotificacion.objects.filter(id=envio.id).update(proximo_intento=timezone.now() + timedelta(hours=1))
+
+        self.assertFalse(guardar_resultado(envio, {'enviado': True, 'error': None}))
+        envio.refresh_from_db()
+        self.assertEqual((envio.situacion, envio.intentos), ('pendiente', 0))
+
+
+class ConexionPrueba(locmem.EmailBackend):
+    """Backend locmem que cuenta aperturas y corta la sesión en los envíos indicados."""
+
+    def __init__(self, cortes=(), **kwargs):
+        super().__init__(**kwargs)
+        # Cantidad de veces que el servidor corta la sesión al enviar a cada destinatario
+        self.cortes = dict(cortes)
+        self.aperturas = 0
+        self.abierta = False
+
+    def open(self):
+        self.aperturas += 1
+        self.abierta = True
+        return True
+
+    def close(self):
+        self.abierta = False
+
+    def send_messages(self, messages):
+        if not self.abierta:
+            raise smtplib.SMTPServerDisconnected('Conexión cerrada')
+        destinatario = messages[0].to[0]
+        if self.cortes.get(destinatario):
+            self.cortes[destinatario] -= 1
+            self.abierta = False
+            raise smtplib.SMTPServerDisconnected('El servidor cerró la sesión')
+        return super().send_messages(messages)
+
+
+class EnvioMensajesTests(SimpleTestCase):
+    """enviar_mensajes: una conexión por lote, reconexiones y resultado por destinatario."""
+
+    def mensajes(self, cantidad):
+        return [crear_mensaje(f'persona{i}@facet.test', 'Aviso', 'Texto') for i in range(cantidad)]
+
+    def test_una_conexion_para_todo_el_lote(self):
+        conexion = ConexionPrueba()
+        resultados = enviar_mensajes(self.mensajes(5), por_segundo=0, conexion=conexion)
+
+        self.assertEqual(conexion.aperturas, 1)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(
+            resultados,
+            [{'destinatarios': [f'persona{i}@facet.test'], 'enviado': True, 'error': None} for i in range(5)],
+        )
+
+    def test_reconecta_si_el_servidor_corta(self):
+        conexion = ConexionPrueba(cortes={'persona2@facet.test': 1})
+        llamadas = []
+        resultados = enviar_mensajes(
+            self.mensajes(4), por_segundo=0, conexion=conexion,
+            al_enviar=lambda indice, resultado: llamadas.append(indice),
+        )
+
+        self.assertEqual(conexion.aperturas, 2)
+        self.assertTrue(all(resultado['enviado'] for resultado in resultados))
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(llamadas, [0, 1, 2, 3])
+
+    def test_tope_de_reconexiones(self):
+        # Cada mensaje corta la sesión una vez: solo los primeros MAX_RECONEXIONES se reintentan
+        cortes = {f'persona{i}@facet.test': 1 for i in range(5)}
+        conexion = ConexionPrueba(cortes=cortes)
+        resultados = enviar_mensajes(self.mensajes(5), por_segundo=0, conexion=conexion)
+
+        self.assertEqual(conexion.aperturas, 1 + MAX_RECONEXIONES)
+        self.assertEqual([resultado['enviado'] for resultado in resultados], [True, True, True, False, False])
+        self.assertEqual(resultados[3]['error'], 'El servidor cerró la sesión')
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_resultado_por_destinatario(self):
+        # persona1 corta dos veces: el reintento también falla y solo ese mensaje queda con error
+        conexion = ConexionPrueba(cortes={'persona1@facet.test': 2})
+        resultados = enviar_mensajes(self.mensajes(3), por_segundo=0, conexion=conexion)
+
+        self.assertEqual(
+            [(resultado['destinatarios'], resultado['enviado']) for resultado in resultados],
+            [(['persona0@facet.test'], True), (['persona1@facet.test'], False), (['persona2@facet.test'], True)],
+        )
+        self.assertEqual(resultados[1]['error'], 'El servidor cerró la sesión')
+        self.assertIsNone(resultados[2]['error'])
+
+    def test_sin_servidor_todos_con_error(self):
+        conexion = ConexionPrueba()
+        with mock.patch.object(conexion, 'open', side_effect=ConnectionRefusedError('Conexión rechazada')):
+            resultados = enviar_mensajes(self.mensajes(2), por_segundo=0, conexion=conexion)
+        self.assertEqual([resultado['error'] for resultado in resultados], ['Conexión rechazada'] * 2)
+
+    def test_limitador_espacia_los_envios(self):
+        limitador = LimitadorEnvios(por_segundo=4)
+        with mock.patch('departamentos.emails.time') as reloj:
+            reloj.monotonic.side_effect = [10.0, 10.1, 10.25]
+            limitador.esperar()
+            limitador.esperar()
+        reloj.sleep.assert_called_once()
+        self.assertAlmostEqual(reloj.sleep.call_args[0][0], 0.15)
+        self.assertEqual(LimitadorEnvios(por_segundo=0).intervalo, 0)
+
+
+class AvisosManualesTests(TestCase):
+    """Clave de idempotencia de los mensajes manuales frente a los recordatorios del beat."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jefatura = crear_jefatura()
+        cls.persona = cls.jefatura.jefe.persona
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_mensaje_manual_no_choca_con_el_recordatorio(self):
+        registrar_envios('jefe_departamento', [{
+            'persona_id': self.persona.id,
+            'asignaciones': [self.jefatura.id],
+            'vencimiento': self.jefatura.fecha_de_fin,
+            'email': self.persona.email,
+            'mensaje': 'Su jefatura vence pronto',
+        }], 'Vencimiento')
+
+        resultado = enviar_email_notificacion_task(self.persona.id, 'Recuerde presentar la documentación')
+        self.assertTrue(resultado['success'])
+        otro = enviar_email_notificacion_task(self.persona.id, 'Segundo aviso con otro texto')
+        self.assertTrue(otro['success'])
+        self.assertEqual(EnvioNotificacion.objects.count(), 3)
+
+    def test_mismo_mensaje_manual_se_informa_duplicado(self):
+        primero = enviar_email_notificacion_task(self.persona.id, 'Recuerde presentar la documentación')
+        repetido = enviar_email_notificacion_task(self.persona.id, 'Recuerde presentar la documentación')
+
+        self.assertFalse(repetido['success'])
+        self.assertTrue(repetido['duplicado'])
+        self.assertEqual(repetido['notificacion_id'], primero['notificacion_id'])
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_api_responde_409_con_el_duplicado(self):
+        primero = enviar_email_notificacion_task(self.persona.id, 'Recuerde presentar la documentación')
+
+        respuesta = self.client.post('/facet/notificacion/crear_notificacion/', {
+            'persona_id': self.persona.id, 'mensaje': 'Recuerde presentar la documentación',
+        }, format='json')
+        self.assertEqual(respuesta.status_code, 409)
+        self.assertEqual(respuesta.data['notificacion_id'], primero['notificacion_id'])
+
+
+class ContadoresNotificacionesTests(TestCase):
+    """Contadores por persona: señales del ORM, marcar_leidas y resumen."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ana = Persona.objects.create(nombre='Ana', apellido='Paz', dni='20111222', estado='1')
+        cls.luis = Persona.objects.create(nombre='Luis', apellido='Sosa', dni='20333444', estado='1')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def contador(self, persona):
+        contador = ContadorNotificaciones.objects.filter(persona=persona).values_list('total', 'no_leidas').first()
+        return contador or (0, 0)
+
+    def test_orm_mantiene_los_contadores(self):
+        primera = Notificacion.objects.create(persona=self.ana, mensaje='Uno')
+        Notificacion.objects.create(persona=self.ana, mensaje='Dos', leido=True)
+        self.assertEqual(self.contador(self.ana), (2, 1))
+
+        primera.persona = self.luis
+        primera.save()
+        self.assertEqual((self.contador(self.ana), self.contador(self.luis)), ((1, 0), (1, 1)))
+
+        primera.leido = True
+        primera.save(update_fields=['leido'])
+        self.assertEqual(self.contador(self.luis), (1, 0))
+
+        primera.delete()
+        self.assertEqual(self.contador(self.luis), (0, 0))
+
+    def test_marcar_leidas_por_persona_y_por_ids(self):
+        notificaciones = [Notificacion.objects.create(persona=self.ana, mensaje=f'Aviso {i}') for i in range(3)]
+        otra = Notificacion.objects.create(persona=self.luis, mensaje='Aviso')
+
+        respuesta = self.client.post('/facet/notificacion/marcar_leidas/', {'ids': [notificaciones[0].id]}, format='json')
+        self.assertEqual(respuesta.data, {'actualizadas': 1})
+        respuesta = self.client.post('/facet/notificacion/marcar_leidas/', {'persona': str(self.ana.id)}, format='json')
+        self.assertEqual(respuesta.data, {'actualizadas': 2})
+
+        self.assertEqual(self.contador(self.ana), (3, 0))
+        otra.refresh_from_db()
+        self.assertFalse(otra.leido)
+
+    def test_marcar_leidas_valida_el_body(self):
+        for body in ({'persona': 'abc'}, {'persona': [1]}, {'ids': 'uno'}, {}):
+            with self.subTest(body=body):
+                respuesta = self.client.post('/facet/notificacion/marcar_leidas/', body, format='json')
+                self.assertEqual(respuesta.status_code, 400)
+
+    def test_resumen(self):
+        Notificacion.objects.create(persona=self.ana, mensaje='Uno')
+        Notificacion.objects.create(persona=self.ana, mensaje='Dos', leido=True)
+        Notificacion.objects.create(persona=self.luis, mensaje='Tres')
+        sin_avisos = Persona.objects.create(nombre='Eva', apellido='Ruiz', dni='20555666', estado='1')
+
+        respuesta = self.client.get(f'/facet/notificacion/resumen/?persona={self.ana.id},{sin_avisos.id}')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual((respuesta.data['total'], respuesta.data['no_leidas']), (3, 2))
+        self.assertEqual(respuesta.data['personas'], [
+            {'persona': self.ana.id, 'total': 2, 'no_leidas': 1},
+            {'persona': sin_avisos.id, 'total': 0, 'no_leidas': 0},
+        ])
+        self.assertEqual(self.client.get('/facet/notificacion/resumen/?persona=x').status_code, 400)
+
+    def test_recalcular_corrige_escrituras_por_queryset(self):
+        Notificacion.objects.create(persona=self.ana, mensaje='Uno')
+        Notificacion.objects.filter(persona=self.ana).update(leido=True)
+        self.assertEqual(self.contador(self.ana), (1, 1))
+
+        recalcular_contadores_task()
+        self.assertEqual(self.contador(self.ana), (1, 0))
+
+
+def fila_personal(dni, apellido='PAZ', nombre='ANA', legajo=None, caracter='ND', fecha_nacimiento=None):
+    """Fila ya normalizada, como las que arma importacion.lectura.normalizar_fila."""
+    return {
+        'dni': dni, 'legajo': legajo, 'apellido': apellido, 'nombre': nombre,
+        'fecha_nacimiento': fecha_nacimiento, 'caracter': caracter, 'observaciones': None,
+    }
+
+
+class PurgaNotificacionesTests(TestCase):
+    """retencion.purgar_notificaciones: lotes, archivo .jsonl.gz y contadores."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ana = Persona.objects.create(nombre='Ana', apellido='Paz', dni='20111222', estado='1')
+        cls.luis = Persona.objects.create(nombre='Luis', apellido='Sosa', dni='20333444', estado='1')
+        viejas = [
+            Notificacion.objects.create(persona=cls.ana, mensaje=f'Aviso {i}', leido=i < 2) for i in range(4)
+        ] + [Notificacion.objects.create(persona=cls.luis, mensaje='Aviso')]
+        EnvioNotificacion.objects.create(
+            notificacion=viejas[0], clave='purga', email='ana@facet.test', asunto='Aviso', tipo='jefe_departamento',
+        )
+        cls.antes_de = timezone.now() - timedelta(days=30)
+        Notificacion.objects.filter(id__in=[n.id for n in viejas]).update(fecha_creacion=cls.antes_de - timedelta(days=1))
+        cls.viejas = sorted(n.id for n in viejas)
+        cls.reciente = Notificacion.objects.create(persona=cls.ana, mensaje='Reciente')
+
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.archivo = os.path.join(directorio.name, 'notificaciones.jsonl.gz')
+
+    def archivadas(self):
+        if not os.path.exists(self.archivo):
+            return []
+        with gzip.open(self.archivo, 'rt', encoding='utf-8') as entrada:
+            return [json.loads(linea) for linea in entrada]
+
+    def contador(self, persona):
+        return ContadorNotificaciones.objects.filter(persona=persona).values_list('total', 'no_leidas').first()
+
+    def test_purga_en_lotes_y_archiva(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(purgar_notificaciones(self.antes_de, tamano_lote=2, archivo=self.archivo), (5, 3))
+
+        self.assertEqual(list(Notificacion.objects.values_list('id', flat=True)), [self.reciente.id])
+        self.assertFalse(EnvioNotificacion.objects.exists())
+        filas = self.archivadas()
+        self.assertEqual(sorted(fila['id'] for fila in filas), self.viejas)
+        self.assertEqual(set(filas[0]), set(CAMPOS_ARCHIVO))
+        self.assertEqual({fila['persona__dni'] for fila in filas}, {'20111222', '20333444'})
+        self.assertEqual((self.contador(self.ana), self.contador(self.luis)), ((1, 1), (0, 0)))
+
+    def test_lote_revertido_no_se_archiva(self):
+        eliminar = contadores.eliminar
+        llamadas = []
+
+        def eliminar_y_fallar(cursor, ids):
+            llamadas.append(ids)
+            if len(llamadas) == 2:
+                raise DatabaseError('Lote interrumpido')
+            return eliminar(cursor, ids)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with mock.patch('departamentos.retencion.contadores.eliminar', side_effect=eliminar_y_fallar):
+                with self.assertRaises(DatabaseError):
+                    purgar_notificaciones(self.antes_de, tamano_lote=2, archivo=self.archivo)
+
+        # Solo el primer lote confirmó: es lo único que está en el archivo y lo único borrado
+        self.assertEqual(sorted(fila['id'] for fila in self.archivadas()), sorted(llamadas[0]))
+        self.assertEqual(Notificacion.objects.count(), 4)
+
+    def test_sin_archivo(self):
+        self.assertEqual(purgar_notificaciones(self.antes_de), (5, 1))
+        self.assertFalse(os.path.exists(self.archivo))
+
+
+class ExportacionTests(TestCase):
+    """Acción export/ de ExportacionViewSetMixin sobre el listado de personas."""
+
+    URL = '/facet/persona/export/'
+
+    @classmethod
+    def setUpTestData(cls):
+        Persona.objects.create(nombre='Ana', apellido='Paz', dni='20111222', legajo='10', estado='1')
+        Persona.objects.create(nombre='Luis', apellido='Sosa', dni='20333444', estado='1', fecha_nacimiento=date(1980, 3, 1))
+        Persona.objects.create(nombre='Eva', apellido='Pazos', dni='20555666', estado='0')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def exportar_csv(self, **params):
+        respuesta = self.client.get(self.URL, {'formato': 'csv', **params})
+        self.assertEqual(respuesta.status_code, 200)
+        contenido = b''.join(respuesta.streaming_content).decode('utf-8')
+        return respuesta, contenido
+
+    def test_formato_invalido(self):
+        respuesta = self.client.get(self.URL, {'formato': 'pdf'})
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertIn('error', respuesta.data)
+
+    def test_csv_con_bom_y_encabezado(self):
+        respuesta, contenido = self.exportar_csv()
+        self.assertTrue(respuesta.streaming)
+        self.assertEqual(respuesta['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('personas_', respuesta['Content-Disposition'])
+        self.assertTrue(contenido.startswith('\ufeff'))
+
+        filas = list(csv.reader(io.StringIO(contenido.lstrip('\ufeff'))))
+        self.assertEqual(filas[0], [columna[0] for columna in PersonaViewSet.columnas_exportacion])
+        # Solo activos por defecto, con los formatos de cada columna
+        self.assertEqual(
+            sorted((fila[2], fila[-2], fila[-1]) for fila in filas[1:]),
+            [('20111222', '', 'Activo'), ('20333444', '1980-03-01', 'Activo')],
+        )
+
+    def test_xlsx_con_las_columnas_declaradas(self):
+        respuesta = self.client.get(self.URL)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta['Content-Type'], CONTENT_TYPE_XLSX)
+        libro = load_workbook(io.BytesIO(b''.join(respuesta.streaming_content)), read_only=True)
+        filas = list(libro.active.iter_rows(values_only=True))
+        self.assertEqual(list(filas[0]), [columna[0] for columna in PersonaViewSet.columnas_exportacion])
+        self.assertEqual(sorted(fila[2] for fila in filas[1:]), ['20111222', '20333444'])
+
+    def test_respeta_filtros_busqueda_y_show_all(self):
+        casos = [
+            ({'apellido__icontains': 'paz'}, ['20111222']),
+            ({'apellido__icontains': 'paz', 'show_all': 'true'}, ['20111222', '20555666']),
+            ({'estado': '0'}, ['20555666']),
+            ({'search': 'Sosa'}, ['20333444']),
+        ]
+        for params, dnis in casos:
+            with self.subTest(params=params):
+                _, contenido = self.exportar_csv(**params)
+                filas = list(csv.reader(io.StringIO(contenido.lstrip('\ufeff'))))[1:]
+                self.assertEqual(sorted(fila[2] for fila in filas), dnis)
+
+
+class ImportacionPersonalTests(TransactionTestCase):
+    """
+    Carga por conjuntos de la planilla de personal (importacion.carga). Las tablas temporales
+    son ON COMMIT DROP, así que cada importación tiene que confirmar su propia transacción.
+    """
+
+    def test_planilla_sin_legajo_conserva_el_cargado(self):
+        Persona.objects.create(nombre='ANA', apellido='PAZ', dni='30111222', legajo='4521', estado='1')
+
+        importar_personal([[fila_personal('30111222', apellido='PAZ DIAZ')]])
+        persona = Persona.objects.get(dni='30111222')
+        self.assertEqual((persona.apellido, persona.legajo), ('PAZ DIAZ', '4521'))
+
+        # La huella se calcula con el legajo completado: reimportar no cuenta cambios
+        resumen = importar_personal([[fila_personal('30111222', apellido='PAZ DIAZ')]], dry_run=True)
+        self.assertEqual(resumen['personas']['sin_cambios'], 1)
+        self.assertEqual(resumen['campos']['legajo'], 0)
+
+    def test_huella_con_los_datos_actuales_de_la_persona(self):
+        # Alta por la API/ORM: huella_importacion queda NULL, pero los datos coinciden
+        Persona.objects.create(nombre='ANA', apellido='PAZ', dni='30111222', legajo='10', estado='1')
+        fila = fila_personal('30111222', apellido='PAZ', nombre='ANA', legajo='10')
+        self.assertEqual(importar_personal([[fila]], dry_run=True)['personas']['sin_cambios'], 1)
+
+        # Edición posterior por la API: la huella guardada no cambia, pero la persona sí
+        importar_personal([[fila]])
+        Persona.objects.filter(dni='30111222').update(apellido='PAZ EDITADO')
+        resumen = importar_personal([[fila]])
+        self.assertEqual((resumen['personas']['modificadas'], resumen['campos']['apellido']), (1, 1))
+        self.assertEqual(Persona.objects.get(dni='30111222').apellido, 'PAZ')
+
+    def planilla(self, filas):
+        archivo = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8', newline='')
+        self.addCleanup(os.remove, archivo.name)
+        with archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(['cuil', 'nrolegajo', 'apellido', 'nombre', 'fechanac', 'caracter', 'descrip'])
+            escritor.writerows(filas)
+        return archivo.name
+
+    def test_dry_run_resume_sin_escribir(self):
+        Persona.objects.create(nombre='ANA', apellido='PAZ', dni='30111222', legajo='10', estado='1')
+        Persona.objects.create(nombre='LUIS', apellido='SOSA', dni='30333444', legajo='20', estado='1')
+        # Persona sin cambios: su huella ya coincide con la de la planilla
+        importar_personal([[fila_personal('30333444', apellido='SOSA', nombre='LUIS', legajo='20', caracter='DOC')]])
+        antes = list(Persona.objects.order_by('dni').values())
+
+        archivo = self.planilla([
+            ['20301112223', '10', 'Paz Diaz', 'Ana', '', 'ND', 'Mesa de entradas'],   # modifica apellido
+            ['20303334445', '20', 'Sosa', 'Luis', '', 'DOC', ''],                     # sin cambios
+            ['20305556667', '30', 'Ruiz', 'Eva', '1970-05-01', 'ND', ''],             # alta
+            ['20305556667', '30', 'Ruiz', 'Eva', '1970-05-01', 'DOC', ''],            # mismo DNI, otro cargo
+            ['123', '', '', 'Sin', '', '', ''],                                       # inválida
+        ])
+        salida = io.StringIO()
+        call_command('importar_personal', archivo, '--dry-run', stdout=salida)
+        salida = salida.getvalue()
+
+        self.assertIn('Filas leídas: 5 (importadas: 4, con errores: 1)', salida)
+        self.assertIn('Personas: 3 en la planilla, 1 altas, 1 modificaciones, 1 sin cambios', salida)
+        self.assertIn('Campos modificados: 1 apellido, 0 nombre, 0 legajo', salida)
+        self.assertIn('NoDocentes: 2 en la planilla, 2 altas', salida)
+        self.assertIn('Simulación (--dry-run)', salida)
+        self.assertEqual(list(Persona.objects.order_by('dni').values()), antes)
+        self.assertFalse(NoDocente.objects.exists())
+
+        # Sin --dry-run se escribe exactamente lo que informó la simulación
+        call_command('importar_personal', archivo, stdout=io.StringIO())
+        self.assertEqual(Persona.objects.get(dni='30111222').apellido, 'PAZ DIAZ')
+        self.assertEqual(Persona.objects.get(dni='30555666').nombre, 'EVA')
+        self.assertEqual(NoDocente.objects.count(), 2)
+
+
+class FuncionesFechaTests(TestCase):
+    """Edad y SumarAnios dan lo mismo en PostgreSQL, en SQLite y en Python."""
+
+    FECHAS = [date(1960, 2, 29), date(1960, 3, 1), date(1961, 2, 28), date(1959, 12, 31), date(1960, 6, 15)]
+
+    def evaluar(self, conexion, expresion):
+        query = Query(Persona)
+        sql, params = query.get_compiler(connection=conexion).compile(expresion.resolve_expression(query))
+        with conexion.cursor() as cursor:
+            cursor.execute(f'SELECT {sql}', params)
+            return cursor.fetchone()[0]
+
+    def test_motores_coinciden(self):
+        sqlite = ConnectionHandler({'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}})['default']
+        hoy = date(2025, 2, 28)
+        try:
+            for fecha in self.FECHAS:
+                edad = hoy.year - fecha.year - ((hoy.month, hoy.day) < (fecha.month, fecha.day))
+                for anios in (1, 4, 65, -1):
+                    with self.subTest(fecha=fecha, anios=anios):
+                        esperado = sumar_anios(fecha, anios)
+                        expresion = SumarAnios(Value(fecha, output_field=DateField()), anios=anios)
+                        self.assertEqual(self.evaluar(connection, expresion), esperado)
+                        self.assertEqual(self.evaluar(sqlite, expresion), esperado.isoformat())
+
+                expresion = Edad(Value(hoy, output_field=DateField()), Value(fecha, output_field=DateField()))
+                self.assertEqual(self.evaluar(connection, expresion), edad)
+                self.assertEqual(self.evaluar(sqlite, expresion), edad)
+        finally:
+            sqlite.close()
+
+
+class PaginacionCursorTests(TestCase):
+    """Modo cursor de KeysetPaginationMixin: codificación, navegación, empates y cursores inválidos."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Apellidos repetidos: el desempate lo hace el id
+        for i, apellido in enumerate(['B', 'A', 'C', 'A', 'B', 'A', 'C']):
+            Persona.objects.create(nombre=f'N{i}', apellido=apellido, dni=f'4000000{i}', estado='1')
+        cls.esperado = list(Persona.objects.order_by('apellido', 'id').values_list('id', flat=True))
+
+    def pagina(self, params):
+        request = Request(APIRequestFactory().get('/facet/persona/', params))
+        paginador = StandardResultsSetPagination()
+        filas = paginador.paginate_queryset(Persona.objects.order_by('apellido'), request)
+        datos = paginador.get_paginated_response([fila.id for fila in filas]).data
+        siguiente, anterior = (
+            {clave: valores[0] for clave, valores in parse_qs(urlparse(link).query).items()} if link else None
+            for link in (datos['next'], datos['previous'])
+        )
+        return datos['results'], siguiente, anterior
+
+    def test_codificar_y_decodificar(self):
+        paginador = StandardResultsSetPagination()
+        cursor = paginador.encode_cursor(['Pérez', timezone.localdate(), 7], True)
+        request = Request(APIRequestFactory().get('/', {'cursor': cursor}))
+        self.assertEqual(paginador.decode_cursor(request, 3), (['Pérez', timezone.localdate().isoformat(), 7], True))
+        self.assertEqual(paginador.decode_cursor(Request(APIRequestFactory().get('/')), 3), (None, False))
+
+    def test_avanza_y_retrocede_con_empates(self):
+        paginas = []
+        params = {'paginacion': 'cursor', 'limit': 2}
+        while params:
+            ids, params, anterior = self.pagina(params)
+            paginas.append((ids, anterior))
+        self.assertEqual([id for ids, _ in paginas for id in ids], self.esperado)
+        self.assertIsNone(paginas[0][1])
+        self.assertEqual([len(ids) for ids, _ in paginas], [2, 2, 2, 1])
+
+        # Desde la última página, 'previous' recorre las mismas páginas en orden inverso
+        params = paginas[-1][1]
+        for ids, _ in reversed(paginas[:-1]):
+            obtenidos, siguiente, params = self.pagina(params)
+            self.assertEqual(obtenidos, ids)
+            self.assertIsNotNone(siguiente)
+        self.assertIsNone(params)
+
+    def test_cursor_invalido_responde_400(self):
+        paginador = StandardResultsSetPagination()
+        cursores = [
+            'no-es-base64!',
+            # El listado ordena por apellido, nombre e id
+            paginador.encode_cursor(['A', 'N1'], False),
+            paginador.encode_cursor(['A', 'N1', 'no-es-id'], False),
+        ]
+        for cursor in cursores:
+            with self.subTest(cursor=cursor):
+                respuesta = APIClient().get('/facet/persona/', {'cursor': cursor})
+                self.assertEqual(respuesta.status_code, 400)
+
+
+class ConteoTests(TestCase):
+    """Estrategia de conteo de los paginadores: cache, estimación y COUNT exacto."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(12):
+            Persona.objects.create(nombre=f'N{i}', apellido='Paz' if i % 2 else 'Sosa', dni=f'5000{i:04d}', estado='1')
+
+    def setUp(self):
+        cache.clear()
+
+    def request(self, params, path='/facet/persona/'):
+        return Request(APIRequestFactory().get(path, params))
+
+    def test_clave_ignora_paginacion_y_orden_de_parametros(self):
+        clave = clave_conteo(self.request({'apellido': 'Paz', 'estado': '1'}))
+        self.assertEqual(clave, clave_conteo(self.request({'estado': '1', 'apellido': 'Paz', 'limit': 5, 'offset': 10})))
+        self.assertEqual(clave, clave_conteo(self.request({'apellido': 'Paz', 'estado': '1', 'paginacion': 'cursor'})))
+        self.assertNotEqual(clave, clave_conteo(self.request({'apellido': 'Sosa', 'estado': '1'})))
+        self.assertNotEqual(clave, clave_conteo(self.request({'apellido': 'Paz', 'estado': '1'}, path='/facet/docente/')))
+
+    def test_estimacion_de_postgresql(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE departamentos_persona')
+        self.assertEqual(estimar_conteo(Persona.objects.all()), 12)
+        self.assertIsInstance(estimar_conteo(Persona.objects.filter(apellido='Paz')), int)
+        self.assertEqual(estimar_conteo(Persona.objects.none()), 0)
+
+    @override_settings(CONTEO_UMBRAL_EXACTO=100)
+    @mock.patch('departamentos.apis.conteo.filas_tabla', return_value=None)
+    def test_umbral_entre_estimado_y_exacto(self, filas_tabla):
+        queryset = Persona.objects.filter(apellido='Paz')
+        with mock.patch('departamentos.apis.conteo.estimar_conteo', return_value=101):
+            self.assertEqual(contar(queryset, self.request({'apellido': 'Paz'})), (101, False))
+        with mock.patch('departamentos.apis.conteo.estimar_conteo', return_value=100):
+            self.assertEqual(contar(queryset, self.request({'apellido': 'Paz'})), (6, True))
+        # El exacto queda en cache para los mismos filtros, aunque la estimación cambie
+        with mock.patch('departamentos.apis.conteo.estimar_conteo', return_value=5000) as estimar:
+            self.assertEqual(contar(queryset, self.request({'apellido': 'Paz', 'offset': 20})), (6, True))
+            estimar.assert_not_called()
+
+    @override_settings(CONTEO_UMBRAL_EXACTO=100)
+    def test_tabla_chica_cuenta_sin_estimar(self):
+        with mock.patch('departamentos.apis.conteo.filas_tabla', return_value=100), \
+                mock.patch('departamentos.apis.conteo.estimar_conteo') as estimar:
+            self.assertEqual(contar(Persona.objects.filter(apellido='Paz'), self.request({'apellido': 'Paz'})), (6, True))
+            estimar.assert_not_called()
+        # Con un JOIN la tabla base no acota el resultado: se estima
+        with mock.patch('departamentos.apis.conteo.filas_tabla', return_value=100) as filas_tabla, \
+                mock.patch('departamentos.apis.conteo.estimar_conteo', return_value=500):
+            self.assertEqual(contar(Docente.objects.filter(persona__apellido='Paz')), (500, False))
+            filas_tabla.assert_not_called()
+
+    def test_version_de_los_modelos_del_join(self):
+        for persona in Persona.objects.filter(apellido='Paz')[:2]:
+            Docente.objects.create(persona=persona, estado='1')
+        queryset = Docente.objects.filter(persona__apellido='Paz')
+        self.assertEqual(modelos_consultados(queryset), [Docente, Persona])
+        request = self.request({'persona__apellido': 'Paz'}, path='/facet/docente/')
+        self.assertEqual(contar(queryset, request), (2, True))
+
+        Persona.objects.filter(pk=queryset[0].persona_id).update(apellido='Sosa')
+        self.assertEqual(contar(queryset, request), (2, True))
+        invalidar_modelo(Persona)
+        self.assertEqual(contar(queryset, request), (1, True))
+
+    @override_settings(CONTEO_UMBRAL_EXACTO=1000)
+    @mock.patch('departamentos.apis.conteo.filas_tabla', return_value=None)
+    def test_count_exacto_en_la_respuesta(self, filas_tabla):
+        respuesta = APIClient().get('/facet/persona/', {'limit': 5})
+        self.assertEqual((respuesta.data['count'], respuesta.data['count_exacto']), (12, True))
+
+        cache.clear()
+        with mock.patch('departamentos.apis.conteo.estimar_conteo', return_value=5000):
+            respuesta = APIClient().get('/facet/persona/', {'limit': 5})
+            self.assertEqual((respuesta.data['count'], respuesta.data['count_exacto']), (5000, False))
+            # La última página corrige el total estimado
+            respuesta = APIClient().get('/facet/persona/', {'limit': 5, 'offset': 10})
+            self.assertEqual((respuesta.data['count'], respuesta.data['count_exacto']), (12, True))
+
+
+class AccionesMasivasTests(TestCase):
+    """bulk_deactivate / bulk_restore de SoftDeleteViewSetMixin."""
+
+    URL = '/facet/departamento/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fisica = Departamento.objects.create(nombre='Física', estado='1')
+        cls.quimica = Departamento.objects.create(nombre='Química', estado='1')
+        cls.fisica_aplicada = Departamento.objects.create(nombre='Física Aplicada', estado='1')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def post(self, accion, body):
+        return self.client.post(f'{self.URL}{accion}/', body, format='json')
+
+    def estados(self):
+        return dict(Departamento.objects.order_by('id').values_list('nombre', 'estado'))
+
+    def test_por_ids(self):
+        respuesta = self.post('bulk_deactivate', {'ids': [self.fisica.id, self.quimica.id]})
+        self.assertEqual(respuesta.data, {'actualizados': 2})
+        self.assertEqual(self.estados(), {'Física': '0', 'Química': '0', 'Física Aplicada': '1'})
+
+        # Solo cuentan las filas que cambian de estado
+        respuesta = self.post('bulk_restore', {'ids': [self.fisica.id, self.fisica_aplicada.id]})
+        self.assertEqual(respuesta.data, {'actualizados': 1})
+        self.assertEqual(self.estados(), {'Física': '1', 'Química': '0', 'Física Aplicada': '1'})
+
+    def test_por_filtros(self):
+        respuesta = self.post('bulk_deactivate', {'filtros': {'nombre__icontains': 'física'}})
+        self.assertEqual(respuesta.data, {'actualizados': 2})
+        self.assertEqual(self.estados(), {'Física': '0', 'Química': '1', 'Física Aplicada': '0'})
+
+    def test_rechaza_selecciones_invalidas(self):
+        bodies = [
+            {},
+            {'ids': 'todos'},
+            {'ids': ['uno']},
+            {'filtros': ['nombre']},
+            {'filtros': {'estado': '1'}},
+            {'filtros': {'mail_jefe_departamento': 'x'}},
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assertEqual(self.post('bulk_deactivate', body).status_code, 400)
+        respuesta = self.post('bulk_deactivate', {'filtros': {'nombre': 'Física', 'nombre__icontains': 'a'}})
+        self.assertEqual(respuesta.data, {'error': 'Filtros no válidos: nombre'})
+        self.assertEqual(set(self.estados().values()), {'1'})
+
+    def test_invalida_la_cache_del_listado(self):
+        self.assertEqual(self.client.get(self.URL).data['count'], 3)
+        version = version_modelo(Departamento)
+
+        self.post('bulk_deactivate', {'ids': [self.quimica.id]})
+        self.assertGreater(version_modelo(Departamento), version)
+        self.assertEqual(self.client.get(self.URL).data['count'], 2)
+
+        # Sin filas afectadas no se invalida
+        version = version_modelo(Departamento)
+        self.post('bulk_deactivate', {'ids': [self.quimica.id]})
+        self.assertEqual(version_modelo(Departamento), version)
+
+
+
+class CacheRespuestasTests(TestCase):
+    """CacheRespuestaViewSetMixin: validadores condicionales e invalidación por versión."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.departamento = Departamento.objects.create(nombre='Física', estado='1')
+        cls.area = Area.objects.create(departamento=cls.departamento, nombre='Óptica', estado='1')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_etag_y_last_modified_responden_304(self):
+        respuesta = self.client.get('/facet/area/')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertIn('no-cache', respuesta['Cache-Control'])
+
+        for encabezado, valor in (('HTTP_IF_NONE_MATCH', respuesta['ETag']),
+                                  ('HTTP_IF_MODIFIED_SINCE', respuesta['Last-Modified'])):
+            with self.subTest(encabezado=encabezado):
+                revalidada = self.client.get('/facet/area/', **{encabezado: valor})
+                self.assertEqual(revalidada.status_code, 304)
+                self.assertEqual(revalidada['ETag'], respuesta['ETag'])
+
+        self.assertEqual(self.client.get('/facet/area/', HTTP_IF_NONE_MATCH='"otro"').status_code, 200)
+
+    def test_guardar_borrar_y_actualizar_en_bloque_cambian_la_version(self):
+        cambios = [
+            lambda: Departamento.objects.create(nombre='Química', estado='1'),
+            lambda: self.departamento.save(),
+            lambda: Departamento.objects.filter(nombre='Química').delete(),
+            lambda: self.client.post('/facet/departamento/bulk_deactivate/', {'ids': [self.departamento.id]}, format='json'),
+        ]
+        for cambio in cambios:
+            version = version_modelo(Departamento)
+            cambio()
+            self.assertGreater(version_modelo(Departamento), version)
+
+    def test_etag_cambia_al_modificar_el_registro(self):
+        respuesta = self.client.get(f'/facet/area/{self.area.id}/')
+        self.area.nombre = 'Óptica y Láseres'
+        self.area.save()
+
+        actualizada = self.client.get(f'/facet/area/{self.area.id}/', HTTP_IF_NONE_MATCH=respuesta['ETag'])
+        self.assertEqual(actualizada.status_code, 200)
+        self.assertEqual(actualizada.data['nombre'], 'Óptica y Láseres')
+        self.assertNotEqual(actualizada['ETag'], respuesta['ETag'])
+
+    def test_area_ve_los_cambios_del_departamento(self):
+        respuesta = self.client.get('/facet/area/')
+        self.assertEqual(respuesta.data['results'][0]['departamento_detalle']['nombre'], 'Física')
+
+        self.departamento.nombre = 'Física Teórica'
+        self.departamento.save()
+        respuesta = self.client.get('/facet/area/')
+        self.assertEqual(respuesta.data['results'][0]['departamento_detalle']['nombre'], 'Física Teórica')
+
+
+class ProximosVencimientosJefesTests(TestCase):
+    """list_proximos_vencimientos: activas por defecto, todas con ?show_all."""
+
+    URL = '/facet/jefe-departamento/list_proximos_vencimientos/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.activa = crear_jefatura()
+        cls.inactiva = crear_jefatura(dni='30999888', email='otro@facet.test')
+        cls.inactiva.estado = '0'
+        cls.inactiva.save()
+        # Fuera de la ventana de 30 días
+        crear_jefatura(dni='30777666', email='lejos@facet.test', vence=timezone.now() + timedelta(days=45))
+
+    def ids(self, params=None):
+        respuesta = APIClient().get(self.URL, params or {})
+        self.assertEqual(respuesta.status_code, 200)
+        return [fila['id'] for fila in respuesta.data['results']]
+
+    def test_solo_activas_por_defecto(self):
+        self.assertEqual(self.ids(), [self.activa.id])
+
+    def test_show_all_incluye_inactivas(self):
+        self.assertEqual(sorted(self.ids({'show_all': 'true'})), sorted([self.activa.id, self.inactiva.id]))
+
+
+class BusquedaTrigramTests(TestCase):
+    """TrigramSearchFilter e índices de la migración 0005 sobre Persona."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.exacta = Persona.objects.create(nombre='ANA', apellido='GARCIA', dni='60000001', estado='1')
+        # Misma similitud con 'garcia' (0.538..., no exacta en real): empatan y el cursor tiene
+        # que volver a encontrar el valor del límite para desempatar por el resto de la clave
+        for i in range(6):
+            Persona.objects.create(nombre=f'N{i}', apellido='GARCIA LOPEZ', dni=f'6000010{i}', estado='1')
+        Persona.objects.create(nombre='LUIS', apellido='SOSA', dni='60000200', estado='1')
+
+    def requerir_pg_trgm(self):
+        if not trigram_disponible(connection):
+            self.skipTest('requiere la extensión pg_trgm')
+
+    def buscar(self, params):
+        respuesta = APIClient().get('/facet/persona/', params)
+        self.assertEqual(respuesta.status_code, 200)
+        return respuesta.data
+
+    def recorrer_cursor(self, params):
+        ids, siguiente = [], {**params, 'paginacion': 'cursor', 'limit': 2}
+        for _ in range(10):
+            datos = self.buscar(siguiente)
+            ids += [fila['id'] for fila in datos['results']]
+            if not datos['next']:
+                return ids
+            siguiente = {clave: valores[0] for clave, valores in parse_qs(urlparse(datos['next']).query).items()}
+        self.fail(f'El cursor no avanza: {ids}')
+
+    def test_ordena_por_similitud(self):
+        self.requerir_pg_trgm()
+        ids = [fila['id'] for fila in self.buscar({'search': 'garcia', 'limit': 20})['results']]
+        self.assertEqual(len(ids), 7)
+        self.assertEqual(ids[0], self.exacta.id)
+
+    def test_cursor_con_similitudes_empatadas(self):
+        self.requerir_pg_trgm()
+        ids = self.recorrer_cursor({'search': 'garcia'})
+        self.assertEqual(len(ids), 7)
+        self.assertEqual(len(set(ids)), 7)
+        self.assertEqual(ids[0], self.exacta.id)
+
+    def test_sin_pg_trgm_filtra_como_search_filter(self):
+        with mock.patch('departamentos.apis.search.trigram_disponible', return_value=False):
+            datos = self.buscar({'search': 'garcia', 'limit': 20})
+            ids = self.recorrer_cursor({'search': 'garcia'})
+        esperados = list(
+            Persona.objects.filter(apellido__icontains='garcia').order_by('apellido', 'nombre', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual([fila['id'] for fila in datos['results']], esperados)
+        self.assertEqual(ids, esperados)
+
+    def test_indices_de_la_migracion(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE indexname LIKE 'persona_%%_trgm_idx'")
+            indices = {fila[0] for fila in cursor.fetchall()}
+        if not trigram_disponible(connection):
+            # Sin la extensión la migración no crea nada y la búsqueda cae en el SearchFilter de DRF
+            self.assertEqual(indices, set())
+            return
+        self.assertEqual(indices, {f'persona_{campo}_trgm_idx' for campo in ('apellido', 'nombre', 'dni', 'legajo')})
+
+        # El índice sirve a la misma expresión que arma icontains
+        sql, params = Persona.objects.filter(apellido__icontains='garc').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}', params)
+            plan = '\n'.join(fila[0] for fila in cursor.fetchall())
+        self.assertIn('persona_apellido_trgm_idx', plan)
+
+
+class ReportesTests(TestCase):
+    """Tablas de reportes (reportes.py) contra las tablas de origen y la API /reportes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ahora = timezone.now()
+        cls.jefatura = crear_jefatura(vence=ahora + timedelta(days=40))
+        cls.informatica = cls.jefatura.departamento
+        cls.quimica = Departamento.objects.create(nombre='Química', estado='1')
+        Departamento.objects.create(nombre='Cerrado', estado='0')
+        # Jefatura anterior del mismo departamento: cuenta en `jefaturas`, no es la vigente
+        JefeDepartamento.objects.create(
+            departamento=cls.informatica, jefe=cls.jefatura.jefe, resolucion=cls.jefatura.resolucion,
+            fecha_de_inicio=ahora - timedelta(days=800), fecha_de_fin=ahora - timedelta(days=400), estado='1',
+        )
+
+        resolucion = cls.jefatura.resolucion
+        asignaturas = {}
+        for codigo, departamento, estado in [
+            ('A1', cls.informatica, '1'), ('A2', cls.informatica, '1'),
+            ('A3', cls.quimica, '1'), ('A4', cls.quimica, '1'), ('A5', cls.quimica, '0'),
+        ]:
+            area = Area.objects.create(departamento=departamento, nombre=f'Área {codigo}', estado='1')
+            asignaturas[codigo] = Asignatura.objects.create(
+                area=area, departamento=departamento, codigo=codigo, nombre=f'Asignatura {codigo}',
+                modulo='1', tipo='Obligatoria', estado=estado,
+            )
+        cls.asignaturas = asignaturas
+        docentes = [
+            Docente.objects.create(
+                persona=Persona.objects.create(nombre=f'D{i}', apellido='Docente', dni=f'4000000{i}', estado='1'),
+                estado='1',
+            )
+            for i in range(3)
+        ]
+
+        def asignar(codigo, docente, cargo, dedicacion, condicion, vence, estado='1', notificado=False):
+            AsignaturaDocente.objects.create(
+                asignatura=asignaturas[codigo], docente=docentes[docente], resolucion=resolucion,
+                cargo=cargo, dedicacion=dedicacion, condicion=condicion, fecha_de_inicio=ahora,
+                fecha_de_vencimiento=vence, estado=estado, notificado=notificado,
+            )
+
+        asignar('A1', 0, 'PROFESOR TITULAR', 'EXCL', 'Regular', ahora + timedelta(days=60))
+        asignar('A2', 0, 'JEFE TRABAJOS PRACT.', 'SIMP', 'Interino', None)
+        asignar('A3', 1, 'PROFESOR ADJUNTO', 'EXCL', 'Regular', ahora + timedelta(days=40), notificado=True)
+        # Vigente pero con renuncia: cuenta en la planta, no cubre la asignatura
+        asignar('A3', 0, 'JEFE TRABAJOS PRACT.', 'SIMP', 'Renuncia', ahora + timedelta(days=40))
+        # No vigentes o sobre asignaturas inactivas
+        asignar('A1', 2, 'PROFESOR ADJUNTO', 'SIMP', 'Regular', ahora + timedelta(days=60), estado='0')
+        asignar('A2', 1, 'PROFESOR ADJUNTO', 'SIMP', 'Regular', ahora - timedelta(days=400))
+        asignar('A5', 2, 'PROFESOR ADJUNTO', 'SIMP', 'Regular', None)
+        cls.usuario = get_user_model().objects.create_user(email='reportes@facet.test', password='x')
+
+    def setUp(self):
+        self.ahora = timezone.now()
+        self.filas = actualizar_reportes()
+        self.client = APIClient()
+        self.client.force_authenticate(self.usuario)
+
+    def vigentes(self):
+        return AsignaturaDocente.objects.filter(estado='1', asignatura__estado='1').filter(
+            Q(fecha_de_vencimiento__isnull=True) | Q(fecha_de_vencimiento__gte=self.ahora)
+        )
+
+    def test_planta_docente_contra_las_asignaciones(self):
+        # Cada agrupación deja en NULL las columnas que suma; el departamento puede estar o no
+        dimensiones = {
+            'detalle': {'cargo', 'dedicacion', 'condicion'},
+            'cargo': {'cargo'}, 'dedicacion': {'dedicacion'}, 'condicion': {'condicion'}, 'total': set(),
+        }
+        filas = list(ReportePlantaDocente.objects.values())
+        self.assertEqual(len(filas), self.filas['planta_docente'])
+        for fila in filas:
+            with self.subTest(fila=fila):
+                presentes = {campo for campo in ('cargo', 'dedicacion', 'condicion') if fila[campo] is not None}
+                self.assertEqual(presentes, dimensiones[fila['agrupacion']])
+                filtros = {campo: fila[campo] for campo in presentes}
+                if fila['departamento_id'] is not None:
+                    filtros['asignatura__departamento_id'] = fila['departamento_id']
+                esperado = self.vigentes().filter(**filtros).aggregate(
+                    asignaciones=Count('id'),
+                    docentes=Count('docente', distinct=True),
+                    asignaturas=Count('asignatura', distinct=True),
+                )
+                self.assertEqual({campo: fila[campo] for campo in esperado}, esperado)
+
+        # Todas las agrupaciones tienen filas por departamento y, salvo el detalle, de la facultad
+        self.assertEqual(
+            set(ReportePlantaDocente.objects.values_list('agrupacion', Q(departamento__isnull=True))),
+            {(agrupacion, facultad) for agrupacion in dimensiones for facultad in (True, False)} - {('detalle', True)},
+        )
+
+    def test_total_por_departamento_y_de_la_facultad(self):
+        totales = {
+            departamento: (asignaciones, docentes, asignaturas)
+            for departamento, asignaciones, docentes, asignaturas in ReportePlantaDocente.objects.filter(
+                agrupacion='total'
+            ).values_list('departamento_id', 'asignaciones', 'docentes', 'asignaturas')
+        }
+        # 'total' es a la vez el total de cada departamento y el de la facultad (departamento NULL);
+        # los docentes distintos de la facultad no son la suma de los de cada departamento
+        self.assertEqual(totales, {self.informatica.id: (2, 1, 2), self.quimica.id: (2, 2, 1), None: (4, 2, 3)})
+
+        respuesta = self.client.get('/facet/reportes/planta-docente/', {'agrupacion': 'total'})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual([fila['departamento'] for fila in respuesta.data['results']], [None, self.informatica.id, self.quimica.id])
+        respuesta = self.client.get('/facet/reportes/planta-docente/', {'agrupacion': 'cargo', 'cargo': 'JEFE TRABAJOS PRACT.'})
+        self.assertEqual(
+            [(fila['departamento'], fila['asignaciones'], fila['docentes']) for fila in respuesta.data['results']],
+            [(None, 2, 1), (self.informatica.id, 1, 1), (self.quimica.id, 1, 1)],
+        )
+        for params in ({'agrupacion': 'todo'}, {'departamento': 'x'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get('/facet/reportes/planta-docente/', params).status_code, 400)
+
+    def test_vacantes(self):
+        cobertura = dict(ReporteVacante.objects.values_list('asignatura__codigo', 'docentes'))
+        self.assertEqual(cobertura, {'A1': 1, 'A2': 1, 'A3': 1, 'A4': 0})
+        # Una asignación vigente sin vencimiento deja la cobertura sin fin
+        self.assertIsNone(ReporteVacante.objects.get(asignatura=self.asignaturas['A2']).ultimo_vencimiento)
+
+        respuesta = self.client.get('/facet/reportes/vacantes/', {'sin': 'profesor'})
+        self.assertEqual([fila['asignatura_codigo'] for fila in respuesta.data['results']], ['A2', 'A4'])
+        self.assertEqual(
+            [(fila['departamento'], fila['asignaturas'], fila['sin_docente'], fila['sin_profesor'])
+             for fila in respuesta.data['resumen']],
+            [(self.informatica.id, 2, 0, 1), (self.quimica.id, 2, 1, 1)],
+        )
+        respuesta = self.client.get('/facet/reportes/vacantes/')
+        self.assertEqual([fila['asignatura_codigo'] for fila in respuesta.data['results']], ['A4'])
+
+    def test_vencimientos_contra_las_asignaciones(self):
+        inicio_mes = timezone.localtime(self.ahora).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        esperado = {}
+        fuentes = [
+            ('asignatura_docente', AsignaturaDocente.objects.filter(estado='1', fecha_de_vencimiento__gte=inicio_mes)
+             .values_list('asignatura__departamento_id', 'fecha_de_vencimiento', 'notificado')),
+            ('jefe_departamento', JefeDepartamento.objects.filter(estado='1', fecha_de_fin__gte=inicio_mes)
+             .values_list('departamento_id', 'fecha_de_fin', 'notificado')),
+        ]
+        for tipo, filas in fuentes:
+            for departamento, fecha, notificado in filas:
+                clave = (timezone.localtime(fecha).date().replace(day=1), departamento, tipo)
+                cantidad, notificadas = esperado.get(clave, (0, 0))
+                esperado[clave] = (cantidad + 1, notificadas + notificado)
+
+        reporte = {
+            (mes, departamento, tipo): (cantidad, notificadas)
+            for mes, departamento, tipo, cantidad, notificadas in ReporteVencimiento.objects.values_list(
+                'mes', 'departamento_id', 'tipo', 'cantidad', 'notificadas'
+            )
+        }
+        self.assertEqual(reporte, esperado)
+        self.assertEqual(sum(cantidad for cantidad, _ in reporte.values()), 4)
+
+        respuesta = self.client.get('/facet/reportes/vencimientos/', {'tipo': 'asignatura_docente'})
+        self.assertEqual(sum(fila['cantidad'] for fila in respuesta.data['totales']), 3)
+        self.assertEqual(sum(fila['notificadas'] for fila in respuesta.data['totales']), 1)
+        self.assertEqual(self.client.get('/facet/reportes/vencimientos/', {'desde': '2024'}).status_code, 400)
+
+    def test_jefaturas(self):
+        jefaturas = {
+            departamento: (jefe_departamento, jefaturas)
+            for departamento, jefe_departamento, jefaturas in ReporteJefatura.objects.values_list(
+                'departamento_id', 'jefe_departamento_id', 'jefaturas'
+            )
+        }
+        self.assertEqual(jefaturas, {self.informatica.id: (self.jefatura.id, 2), self.quimica.id: (None, 0)})
+
+        respuesta = self.client.get('/facet/reportes/jefaturas/', {'vacantes': 'true'})
+        self.assertEqual([fila['departamento'] for fila in respuesta.data['results']], [self.quimica.id])
+
+    def test_antiguedad_de_los_reportes(self):
+        respuesta = self.client.get('/facet/reportes/')
+        self.assertEqual(
+            {fila['reporte']: fila['filas'] for fila in respuesta.data},
+            {
+                'planta_docente': ReportePlantaDocente.objects.count(), 'vacantes': ReporteVacante.objects.count(),
+                'vencimientos': ReporteVencimiento.objects.count(), 'jefaturas': ReporteJefatura.objects.count(),
+            },
+        )
+        self.assertTrue(all(fila['antiguedad'] is not None and fila['antiguedad'] < 60 for fila in respuesta.data))
+
+        actualizado = self.ahora - timedelta(hours=1)
+        ActualizacionReporte.objects.filter(reporte='vacantes').update(fecha_actualizacion=actualizado)
+        respuesta = self.client.get('/facet/reportes/vacantes/')
+        self.assertEqual(respuesta.data['actualizado'], actualizado)
+        self.assertAlmostEqual(respuesta.data['antiguedad'], 3600, delta=60)
+
+        ActualizacionReporte.objects.filter(reporte='jefaturas').delete()
+        respuesta = self.client.get('/facet/reportes/jefaturas/')
+        self.assertEqual((respuesta.data['actualizado'], respuesta.data['antiguedad']), (None, None))
@@ -23,6 +23,9 @@ router.register(r'jefe-departamento', JefeDepartamentoViewSet)
 router.register(r'nodocente', NoDocenteViewSet)
 router.register(r'tipo-titulo', TipoTituloViewSet)
 router.register(r'notificacion', NotificacionViewSet)
+router.register(r'importacion-personal', ImportacionPersonalViewSet)
+router.register(r'reportes', ReporteViewSet, basename='reportes')
+router.register(r'vencimientos', VencimientoViewSet, basename='vencimientos')
 
 urlpatterns = [
     path('', include(router.urls)),
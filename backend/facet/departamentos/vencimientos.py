@@ -0,0 +1,107 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import CharField, F, Value
+from django.utils import timezone
+
+from .models import AsignaturaDocente, DirectorCarrera, JefeDepartamento
+
+DIAS_AVISO_VENCIMIENTO = 30
+
+# Asignaciones con fecha de fin: modelo, campo de fecha (con índice parcial sobre estado='1'),
+# ruta hasta la persona y hasta el departamento, y columnas que describen el cargo
+TIPOS_VENCIMIENTO = {
+    'jefe_departamento': {
+        'modelo': JefeDepartamento,
+        'campo_fecha': 'fecha_de_fin',
+        'persona': 'jefe__persona',
+        'departamento': 'departamento',
+        'puesto': Value('Jefe de departamento'),
+        'detalle': F('departamento__nombre'),
+    },
+    'asignatura_docente': {
+        'modelo': AsignaturaDocente,
+        'campo_fecha': 'fecha_de_vencimiento',
+        'persona': 'docente__persona',
+        'departamento': 'asignatura__departamento',
+        'puesto': F('cargo'),
+        'detalle': F('asignatura__nombre'),
+    },
+    'director_carrera': {
+        'modelo': DirectorCarrera,
+        'campo_fecha': 'fecha_de_fin',
+        'persona': 'director__persona',
+        'departamento': None,
+        'puesto': Value('Director de carrera'),
+        'detalle': F('carrera__nombre'),
+    },
+}
+
+
+def ventana_vencimientos(desde=None, hasta=None, dias=DIAS_AVISO_VENCIMIENTO):
+    """
+    Ventana [inicio, fin) de instantes para fechas locales `desde`/`hasta` (inclusive).
+    Sin `desde` empieza ahora; sin `hasta` termina `dias` días después del inicio.
+    """
+    zona = timezone.get_current_timezone()
+    inicio = timezone.make_aware(datetime.combine(desde, time.min), zona) if desde else timezone.now()
+    if hasta:
+        fin = timezone.make_aware(datetime.combine(hasta + timedelta(days=1), time.min), zona)
+    else:
+        fin = inicio + timedelta(days=dias)
+    return inicio, fin
+
+
+def _rama(tipo, inicio, fin, departamento, notificado, con_email):
+    config = TIPOS_VENCIMIENTO[tipo]
+    campo_fecha = config['campo_fecha']
+    persona = config['persona']
+    filtros = {f'{campo_fecha}__lt': fin}
+    if inicio is not None:
+        filtros[f'{campo_fecha}__gte'] = inicio
+    if departamento is not None:
+        filtros[f"{config['departamento']}_id"] = departamento
+    if notificado is not None:
+        filtros['notificado'] = notificado
+
+    queryset = config['modelo'].objects.activos().filter(**filtros).order_by()
+    if con_email:
+        queryset = queryset.exclude(**{f'{persona}__email__isnull': True}).exclude(**{f'{persona}__email': ''})
+
+    departamento_nombre = (
+        F(f"{config['departamento']}__nombre") if config['departamento']
+        else Value(None, output_field=CharField())
+    )
+    return queryset.values(
+        'id', 'notificado',
+        tipo=Value(tipo),
+        fecha=F(campo_fecha),
+        persona=F(f'{persona}__id'),
+        apellido=F(f'{persona}__apellido'),
+        nombre=F(f'{persona}__nombre'),
+        email=F(f'{persona}__email'),
+        puesto=config['puesto'],
+        detalle=config['detalle'],
+        departamento_nombre=departamento_nombre,
+    )
+
+
+def consulta_vencimientos(inicio=None, fin=None, tipos=None, departamento=None, notificado=None, con_email=False):
+    """
+    Asignaciones activas que vencen en [inicio, fin), de todos los tipos en una sola consulta
+    UNION ALL ordenada por fecha. Cada rama filtra por rango sobre el índice parcial de su
+    fecha de fin; el filtro por departamento deja afuera a los directores de carrera.
+
+    Filas: id, notificado, tipo, fecha, persona, apellido, nombre, email, puesto (cargo), detalle
+    (departamento, asignatura o carrera) y departamento_nombre.
+    """
+    if fin is None:
+        inicio, fin = ventana_vencimientos()
+    tipos = [
+        tipo for tipo in (tipos or TIPOS_VENCIMIENTO)
+        if departamento is None or TIPOS_VENCIMIENTO[tipo]['departamento']
+    ]
+    if not tipos:
+        return JefeDepartamento.objects.none().values('id')
+
+    ramas = [_rama(tipo, inicio, fin, departamento, notificado, con_email) for tipo in tipos]
+    return ramas[0].union(*ramas[1:], all=True).order_by('fecha', 'tipo', 'id')
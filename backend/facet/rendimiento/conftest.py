@@ -0,0 +1,166 @@
+"""
+Suite de rendimiento: siembra una facultad sintética una vez por sesión y mide cada endpoint
+GET de los routers (ver test_endpoints.py) contra la línea de base comprometida.
+
+    pytest rendimiento                              # compara contra linea_base.json
+    pytest rendimiento --actualizar-linea-base      # reescribe la línea de base
+    pytest rendimiento --tolerancia-tiempo=0        # solo compara cantidad de consultas
+
+Solo corre sobre PostgreSQL: los reportes se recalculan con LOCK TABLE, el conteo estima con
+EXPLAIN y las búsquedas usan pg_trgm. Con otro motor los tests se marcan como omitidos.
+
+No entra en la corrida por defecto (pytest.ini la excluye) y siembra su propia base de test
+(sufijo _rendimiento), así los datos sintéticos no llegan a los tests de las apps. Se corre
+sola: mezclarla con otros tests en la misma invocación es un error de uso.
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from departamentos.datos_sinteticos import generar_datos_sinteticos
+from departamentos.models import (
+    ImportacionPersonal, ImportacionPersonalError, Jefe, NoDocente, Notificacion, Persona,
+)
+from departamentos.reportes import actualizar_reportes
+from roles.models import Rol
+
+LINEA_BASE = Path(__file__).with_name('linea_base.json')
+SEMILLA = 20240301
+PERSONAS = 3000
+USUARIO = 'rendimiento@facet.test'
+
+resultados_key = pytest.StashKey[dict]()
+
+
+def leer_linea_base():
+    if not LINEA_BASE.exists():
+        return {}
+    return json.loads(LINEA_BASE.read_text(encoding='utf-8'))
+
+
+def pytest_addoption(parser):
+    grupo = parser.getgroup('rendimiento')
+    grupo.addoption('--actualizar-linea-base', action='store_true', default=False,
+                    help='Guarda las mediciones como nueva línea de base en lugar de comparar')
+    grupo.addoption('--personas', type=int, default=PERSONAS,
+                    help=f'Personas de la facultad sintética (por defecto {PERSONAS})')
+    grupo.addoption('--tolerancia-tiempo', type=float, default=2.0,
+                    help='Factor sobre los tiempos de la línea de base; 0 desactiva la comparación de tiempos')
+    grupo.addoption('--repeticiones', type=int, default=3,
+                    help='Pedidos por endpoint; se toma el menor tiempo (por defecto 3)')
+
+
+def pytest_configure(config):
+    config.stash[resultados_key] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    from django.db import connection
+
+    directorio = Path(__file__).parent
+    propios = [item for item in items if item.path.is_relative_to(directorio)]
+    if propios and len(propios) != len(items):
+        raise pytest.UsageError('La suite de rendimiento siembra su propia base: correrla sola (pytest rendimiento)')
+    if connection.vendor == 'postgresql':
+        return
+    omitir = pytest.mark.skip(reason=f'La suite de rendimiento requiere PostgreSQL (motor: {connection.vendor})')
+    for item in propios:
+        item.add_marker(omitir)
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings():
+    """Base de test propia (test_<nombre>_rendimiento) para que la siembra no quede en la de las apps."""
+    from django.conf import settings
+
+    for ajustes in settings.DATABASES.values():
+        # SQLite sin nombre de test usa una base en memoria: no hay nada que separar
+        if ajustes['ENGINE'].endswith('sqlite3'):
+            continue
+        nombre = ajustes.get('TEST', {}).get('NAME') or f"test_{ajustes['NAME']}"
+        ajustes.setdefault('TEST', {})['NAME'] = f'{nombre}_rendimiento'
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker, pytestconfig):
+    """Siembra los datos una sola vez; con --reuse-db se aprovechan los de la corrida anterior."""
+    from django.db import connection
+
+    with django_db_blocker.unblock():
+        if not Persona.objects.exists():
+            generar_datos_sinteticos(personas=pytestconfig.getoption('personas'), semilla=SEMILLA)
+            actualizar_reportes()
+            rol = Rol.objects.create(descripcion='ADMINISTRADOR')
+            get_user_model().objects.create_superuser(USUARIO, 'rendimiento', rol=rol)
+            Group.objects.create(name='Administración')
+            importacion = ImportacionPersonal.objects.create(archivo='importaciones/personal.xlsx', situacion='finalizada')
+            ImportacionPersonalError.objects.create(importacion=importacion, fila=2, mensaje='DNI inválido')
+            # Sin estadísticas reltuples vale -1 y el conteo estima con EXPLAIN: una consulta más
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+
+@pytest.fixture(scope='session')
+def muestras(django_db_setup, django_db_blocker):
+    """Ids y valores reales que completan las URLs con parámetros."""
+    with django_db_blocker.unblock():
+        usuario = get_user_model().objects.get(email=USUARIO)
+        return {
+            'usuario': usuario,
+            'email_usuario': usuario.email,
+            'descripcion_rol': Rol.objects.values_list('descripcion', flat=True).first(),
+            'persona_jefe': Jefe.objects.values_list('persona_id', flat=True).first(),
+            'persona_no_docente': NoDocente.objects.values_list('persona_id', flat=True).first(),
+            'persona_notificada': Notificacion.objects.values_list('persona_id', flat=True).first(),
+        }
+
+
+@pytest.fixture
+def cliente(muestras):
+    from rest_framework.test import APIClient
+
+    cliente = APIClient()
+    cliente.force_authenticate(muestras['usuario'])
+    return cliente
+
+
+@pytest.fixture(scope='session')
+def linea_base():
+    return leer_linea_base()
+
+
+@pytest.fixture
+def registro(request):
+    """Mediciones de la sesión, {endpoint: {...}}; se escriben o resumen al terminar."""
+    return request.config.stash[resultados_key]
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    resultados = config.stash.get(resultados_key, {})
+    if config.getoption('actualizar_linea_base') and resultados:
+        # Con -k solo se reemplazan los endpoints medidos
+        endpoints = leer_linea_base().get('endpoints', {})
+        endpoints.update(resultados)
+        contenido = {
+            'personas': config.getoption('personas'),
+            'endpoints': dict(sorted(endpoints.items())),
+        }
+        LINEA_BASE.write_text(json.dumps(contenido, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    resultados = config.stash.get(resultados_key, {})
+    if not resultados:
+        return
+    terminalreporter.section('rendimiento por endpoint')
+    terminalreporter.write_line(f"{'endpoint':<58}{'consultas':>10}{'sql ms':>10}{'total ms':>10}")
+    for endpoint, medicion in sorted(resultados.items()):
+        terminalreporter.write_line(
+            f"{endpoint:<58}{medicion['consultas']:>10}{medicion['sql_ms']:>10.1f}{medicion['total_ms']:>10.1f}"
+        )
+    if config.getoption('actualizar_linea_base'):
+        terminalreporter.write_line(f'Línea de base actualizada en {LINEA_BASE}')
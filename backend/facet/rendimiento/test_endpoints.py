@@ -0,0 +1,136 @@
+"""
+Cantidad de consultas, tiempo de SQL y tiempo total de cada endpoint GET registrado en los
+routers de departamentos, usuarios y roles, comparados contra linea_base.json.
+
+Una consulta más que en la línea de base siempre falla (suele ser un N+1 nuevo); los
+tiempos fallan si superan la base por más de --tolerancia-tiempo veces, con un margen fijo
+para los endpoints de pocos milisegundos.
+"""
+import re
+import time
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from departamentos.urls import router as router_departamentos
+from roles.urls import router as router_roles
+from usuarios.urls import router as router_usuarios
+
+# Margen absoluto sobre los tiempos, para que el ruido no haga fallar endpoints muy rápidos
+MARGEN_MS = 25
+
+# Acciones con parámetros obligatorios: sufijo de la URL (se completa con las muestras)
+PARAMETROS = {
+    'asignatura-docente/list_detalle': '?asignatura={asignatura}',
+    'jefe/existe_jefe': '?persona_id={persona_jefe}',
+    'nodocente/buscar_por_persona': '?persona_id={persona_no_docente}',
+    'notificacion/resumen': '?persona={persona_notificada}',
+    'vencimientos': '?dias=90',
+}
+# Acciones cuya ruta lleva un segmento variable en lugar del url_path literal
+RUTAS = {
+    'users/busquedaEmail': 'busquedaEmail/{email_usuario}',
+    'roles/busqueda': 'busqueda/{descripcion_rol}',
+}
+# Fuera de la suite, con el motivo
+EXCLUIDOS = {
+    'notificacion/estado_tarea': 'consulta el backend de resultados de Celery, no la base',
+}
+
+
+def endpoints():
+    """(clave, plantilla de URL, modelo del detalle) de cada GET de los routers."""
+    encontrados = []
+    for router in (router_departamentos, router_usuarios, router_roles):
+        for prefijo, viewset, _ in router.registry:
+            modelo = viewset.queryset.model if getattr(viewset, 'queryset', None) is not None else None
+            if hasattr(viewset, 'list'):
+                encontrados.append((prefijo, f'/facet/{prefijo}/', None))
+            if hasattr(viewset, 'retrieve') and modelo is not None:
+                encontrados.append((f'{prefijo}/detalle', f'/facet/{prefijo}/{{pk}}/', modelo))
+            for accion in viewset.get_extra_actions():
+                if 'get' not in accion.mapping:
+                    continue
+                nombre = re.sub(r'/.*', '', accion.url_path)
+                clave = f'{prefijo}/{nombre}'
+                ruta = RUTAS.get(clave, accion.url_path)
+                if accion.detail:
+                    encontrados.append((clave, f'/facet/{prefijo}/{{pk}}/{ruta}/', modelo))
+                else:
+                    encontrados.append((clave, f'/facet/{prefijo}/{ruta}/', None))
+    return [
+        (clave, url + PARAMETROS.get(clave, ''), modelo)
+        for clave, url, modelo in encontrados
+        if clave not in EXCLUIDOS
+    ]
+
+
+def primer_id(modelo):
+    """Id de un registro visible para el detalle (activo en los modelos con borrado lógico)."""
+    queryset = modelo._default_manager.all()
+    if hasattr(queryset, 'activos'):
+        queryset = queryset.activos()
+    return queryset.order_by('pk').values_list('pk', flat=True).first()
+
+
+def medir(cliente, url, repeticiones):
+    """Menor tiempo total y de SQL en `repeticiones` pedidos, cada uno con la cache vacía."""
+    mejor = None
+    for _ in range(repeticiones):
+        # Sin cache: se mide el trabajo contra la base, no una respuesta guardada
+        cache.clear()
+        with CaptureQueriesContext(connection) as contexto:
+            inicio = time.perf_counter()
+            respuesta = cliente.get(url)
+            total_ms = (time.perf_counter() - inicio) * 1000
+        medicion = {
+            'consultas': len(contexto),
+            'sql_ms': round(sum(float(consulta['time']) for consulta in contexto.captured_queries) * 1000, 1),
+            'total_ms': round(total_ms, 1),
+        }
+        if mejor is None:
+            mejor = medicion
+        else:
+            mejor = {
+                'consultas': max(mejor['consultas'], medicion['consultas']),
+                'sql_ms': min(mejor['sql_ms'], medicion['sql_ms']),
+                'total_ms': min(mejor['total_ms'], medicion['total_ms']),
+            }
+    return respuesta, mejor
+
+
+ENDPOINTS = endpoints()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('clave,plantilla,modelo', ENDPOINTS, ids=[clave for clave, _, _ in ENDPOINTS])
+def test_endpoint(clave, plantilla, modelo, cliente, muestras, registro, linea_base, pytestconfig):
+    valores = dict(muestras)
+    if modelo is not None:
+        valores['pk'] = primer_id(modelo)
+        assert valores['pk'] is not None, f"{clave}: no hay registros de {modelo.__name__} para el detalle"
+    if '{asignatura}' in plantilla:
+        from departamentos.models import Asignatura
+        valores['asignatura'] = primer_id(Asignatura)
+    url = plantilla.format(**valores)
+
+    respuesta, medicion = medir(cliente, url, pytestconfig.getoption('repeticiones'))
+    assert respuesta.status_code == 200, f"{url}: respuesta {respuesta.status_code}"
+    registro[clave] = medicion
+
+    if pytestconfig.getoption('actualizar_linea_base'):
+        return
+    base = linea_base.get('endpoints', {}).get(clave)
+    assert base is not None, f"{clave} no está en la línea de base: correr con --actualizar-linea-base"
+
+    assert medicion['consultas'] <= base['consultas'], (
+        f"{url}: {medicion['consultas']} consultas, la línea de base tiene {base['consultas']}"
+    )
+    tolerancia = pytestconfig.getoption('tolerancia_tiempo')
+    # Con otra escala de datos los tiempos no son comparables
+    if tolerancia and linea_base.get('personas') == pytestconfig.getoption('personas'):
+        for campo in ('sql_ms', 'total_ms'):
+            limite = base[campo] * tolerancia + MARGEN_MS
+            assert medicion[campo] <= limite, f"{url}: {campo} {medicion[campo]} supera {limite:.1f}"
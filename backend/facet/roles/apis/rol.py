@@ -6,8 +6,9 @@ from rest_framework import status
 from ..serializers import RolSerializer
 from ..models import Rol
 from rest_framework import viewsets
+from departamentos.apis.cache import CacheRespuestaViewSetMixin
 
-class RolViewSet(viewsets.ModelViewSet):
+class RolViewSet(CacheRespuestaViewSetMixin, viewsets.ModelViewSet):
     """
     API endpoint que permite ver o editar Tipo sorteo.
     """
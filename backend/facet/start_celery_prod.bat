@@ -32,4 +32,4 @@ echo 📝 Logs: logs/celery_prod.log
 echo.
 
 :: Iniciar Worker con nombre personalizado
-celery -A administracion worker --loglevel=info --pool=solo --concurrency=2 --queues=celery,emails --hostname=facet-worker-1@%%h --logfile=logs/celery_prod.log 
\ No newline at end of file
+celery -A administracion worker --loglevel=info --pool=solo --concurrency=2 --queues=celery,emails,importaciones,reportes --hostname=facet-worker-1@%%h --logfile=logs/celery_prod.log 
\ No newline at end of file
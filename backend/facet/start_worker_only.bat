@@ -35,11 +35,11 @@ if not exist "logs" mkdir logs
 
 echo ✅ Iniciando Celery Worker...
 echo 📍 Broker: Redis (localhost:6379)
-echo 📊 Colas: celery, emails
+echo 📊 Colas: celery, emails, importaciones, reportes
 echo 📝 Logs: logs/celery_worker.log
 echo.
 echo 📌 Para detener: Presiona Ctrl+C
 echo.
 
 :: Iniciar Worker con TODAS las colas
-celery -A administracion worker --loglevel=info --pool=solo --concurrency=2 --queues=celery,emails --logfile=logs/celery_worker.log 
\ No newline at end of file
+celery -A administracion worker --loglevel=info --pool=solo --concurrency=2 --queues=celery,emails,importaciones,reportes --logfile=logs/celery_worker.log 
\ No newline at end of file
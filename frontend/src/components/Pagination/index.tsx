@@ -7,6 +7,7 @@ interface PaginationProps {
   onNext: () => void;
   hasPrevious: boolean;
   hasNext: boolean;
+  isCountExact?: boolean;
   className?: string;
 }
 
@@ -21,6 +22,7 @@ const Pagination: React.FC<PaginationProps> = ({
   onNext,
   hasPrevious,
   hasNext,
+  isCountExact = true,
   className = "",
 }) => {
   const buttonBaseClasses =
@@ -40,7 +42,8 @@ const Pagination: React.FC<PaginationProps> = ({
         Anterior
       </button>
       <span className="text-gray-600 font-medium">
-        Pagina {currentPage} de {totalPages || 1}
+        Pagina {currentPage} de {isCountExact ? "" : "aprox. "}
+        {totalPages || 1}
       </span>
       <button
         onClick={onNext}
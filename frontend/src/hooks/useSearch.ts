@@ -3,6 +3,7 @@ import API from "@/api/axiosConfig";
 
 interface PaginatedResponse<T> {
   count: number;
+  count_exacto?: boolean;
   next: string | null;
   previous: string | null;
   results: T[];
@@ -19,6 +20,7 @@ interface UseSearchReturn<T> {
   isLoading: boolean;
   error: string | null;
   totalItems: number;
+  isCountExact: boolean;
   currentPage: number;
   totalPages: number;
   nextUrl: string | null;
@@ -57,6 +59,7 @@ export function useSearch<T>({
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [totalItems, setTotalItems] = useState(0);
+  const [isCountExact, setIsCountExact] = useState(true);
   const [currentPage, setCurrentPage] = useState(1);
   const [nextUrl, setNextUrl] = useState<string | null>(null);
   const [prevUrl, setPrevUrl] = useState<string | null>(null);
@@ -78,6 +81,8 @@ export function useSearch<T>({
 
       setData(response.data.results);
       setTotalItems(response.data.count);
+      // El backend indica si el total es exacto o una estimación
+      setIsCountExact(response.data.count_exacto ?? true);
 
       // Normalizar URLs de paginación
       setNextUrl(response.data.next ? normalizeUrl(response.data.next) : null);
@@ -184,6 +189,7 @@ export function useSearch<T>({
     isLoading,
     error,
     totalItems,
+    isCountExact,
     currentPage,
     totalPages,
     nextUrl,
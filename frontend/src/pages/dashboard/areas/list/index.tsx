@@ -35,7 +35,7 @@ import {
   FilterInput,
   EstadoFilter,
 } from "../../../../components/Filters";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 
 // Función para normalizar URLs de paginación
 const normalizeUrl = (url: string) => {
@@ -138,7 +138,6 @@ const ListaAreas = () => {
 
   const descargarExcel = async () => {
     try {
-      let allAreas: Area[] = [];
       let url = `/facet/area/?`;
       const params = new URLSearchParams();
 
@@ -152,22 +151,7 @@ const ListaAreas = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allAreas = [...allAreas, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "areas.xlsx",
-        sheetName: "Areas",
-        rows: allAreas.map((area) => ({
-          Nombre: area.nombre,
-          Departamento: area.departamento_detalle?.nombre || "N/A",
-          Estado: area.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "areas.xlsx");
     } catch (error) {
       Swal.fire({
         icon: "error",
@@ -13,7 +13,7 @@ import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import PeopleIcon from "@mui/icons-material/People";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../..";
@@ -62,6 +62,7 @@ const ListaAsignaturas = () => {
     `/facet/asignatura/`
   );
   const [totalItems, setTotalItems] = useState<number>(0);
+  const [isCountExact, setIsCountExact] = useState<boolean>(true);
   const [pageSize, setPageSize] = useState<number>(10);
   const [currentPage, setCurrentPage] = useState<number>(1);
   const [isLoading, setIsLoading] = useState<boolean>(true);
@@ -80,6 +81,7 @@ const ListaAsignaturas = () => {
       setNextUrl(response.data.next ? normalizeUrl(response.data.next) : null);
       setPrevUrl(response.data.previous ? normalizeUrl(response.data.previous) : null);
       setTotalItems(response.data.count);
+      setIsCountExact(response.data.count_exacto ?? true);
       
       // Extract current page from URL (handle both 'page' and 'offset' parameters)
       const urlParams = new URLSearchParams(url.split('?')[1] || '');
@@ -216,7 +218,6 @@ const ListaAsignaturas = () => {
 
   const descargarExcel = async () => {
     try {
-      let allAsignaturas: Asignatura[] = [];
       let url = `/facet/asignatura/?`;
       const params = new URLSearchParams();
 
@@ -233,27 +234,7 @@ const ListaAsignaturas = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allAsignaturas = [...allAsignaturas, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "asignaturas.xlsx",
-        sheetName: "Asignaturas",
-        rows: allAsignaturas.map((asignatura) => ({
-          Código: asignatura.codigo,
-          Nombre: asignatura.nombre,
-          Módulo: asignatura.modulo,
-          Programa: asignatura.programa || "N/A",
-          Tipo: asignatura.tipo,
-          Área: asignatura.area_detalle?.nombre || "N/A",
-          Departamento: asignatura.departamento_detalle?.nombre || "N/A",
-          Estado: asignatura.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "asignaturas.xlsx");
     } catch (error) {
       Swal.fire({
         icon: "error",
@@ -423,6 +404,7 @@ const ListaAsignaturas = () => {
             onNext={() => nextUrl && setCurrentUrl(nextUrl)}
             hasPrevious={!!prevUrl}
             hasNext={!!nextUrl}
+            isCountExact={isCountExact}
           />
         </div>
       </div>
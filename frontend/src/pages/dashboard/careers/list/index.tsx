@@ -36,7 +36,7 @@ import {
 } from "../../../../components/Filters";
 import Pagination from "../../../../components/Pagination";
 import { normalizeUrl } from "../../../../hooks/useSearch";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 
 // Agregar estilos CSS para forzar el z-index de SweetAlert
 const sweetAlertStyles = `
@@ -95,6 +95,7 @@ const ListaCarreras = () => {
   const [nextUrl, setNextUrl] = useState<string | null>(null);
   const [prevUrl, setPrevUrl] = useState<string | null>(null);
   const [totalItems, setTotalItems] = useState<number>(0);
+  const [isCountExact, setIsCountExact] = useState<boolean>(true);
   const [pageSize, setPageSize] = useState<number>(10);
   const [currentPage, setCurrentPage] = useState<number>(1);
 
@@ -146,6 +147,7 @@ const ListaCarreras = () => {
       setNextUrl(normalizedNext);
       setPrevUrl(normalizedPrev);
       setTotalItems(response.data.count);
+      setIsCountExact(response.data.count_exacto ?? true);
 
       // Calcular la página actual basándose en los parámetros de la URL
       const urlParams = new URLSearchParams(apiUrl.split("?")[1] || "");
@@ -193,7 +195,6 @@ const ListaCarreras = () => {
 
   const descargarExcel = async () => {
     try {
-      let allCarreras: Carrera[] = [];
       let url = `/facet/carrera/?`;
       const params = new URLSearchParams();
 
@@ -213,23 +214,7 @@ const ListaCarreras = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allCarreras = [...allCarreras, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "carreras.xlsx",
-        sheetName: "Carreras",
-        rows: allCarreras.map((carrera) => ({
-          Nombre: carrera.nombre,
-          Tipo: carrera.tipo,
-          "Plan de Estudio": carrera.planestudio,
-          Estado: carrera.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "carreras.xlsx");
     } catch (error) {
       Swal.fire({
         icon: "error",
@@ -761,6 +746,7 @@ const ListaCarreras = () => {
               onNext={() => nextUrl && fetchData(nextUrl)}
               hasPrevious={!!prevUrl}
               hasNext={!!nextUrl}
+              isCountExact={isCountExact}
             />
           </div>
         </div>
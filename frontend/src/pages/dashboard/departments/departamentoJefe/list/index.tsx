@@ -25,7 +25,7 @@ import AddIcon from "@mui/icons-material/Add";
 import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../../..";
@@ -194,7 +194,6 @@ const ListaJefesDepartamentos = () => {
 
 	const descargarExcel = async () => {
 		try {
-			let allJefesDepartamentos: JefeDepartamento[] = [];
 			let url = `/facet/jefe-departamento/?`;
 			const params = new URLSearchParams();
 
@@ -217,32 +216,7 @@ const ListaJefesDepartamentos = () => {
 			}
 			url += params.toString();
 
-			while (url) {
-				const response = await API.get(url);
-				const { results, next } = response.data;
-				allJefesDepartamentos = [...allJefesDepartamentos, ...results];
-				url = next;
-			}
-
-			await exportToExcel({
-        fileName: "jefes_departamentos.xlsx",
-        sheetName: "JefesDepartamentos",
-        rows: allJefesDepartamentos.map((jefeDepartamento) => ({
-					Nombre: jefeDepartamento.jefe.persona.nombre,
-					Apellido: jefeDepartamento.jefe.persona.apellido,
-					DNI: jefeDepartamento.jefe.persona.dni,
-					Legajo: jefeDepartamento.jefe.persona.legajo,
-					Departamento: jefeDepartamento.departamento.nombre,
-					Resolución: jefeDepartamento.resolucion.nresolucion,
-					"Fecha Inicio": new Date(
-						jefeDepartamento.fecha_de_inicio
-					).toLocaleDateString(),
-					"Fecha Fin": new Date(
-						jefeDepartamento.fecha_de_fin
-					).toLocaleDateString(),
-					Estado: jefeDepartamento.estado === "1" ? "Activo" : "Inactivo",
-				})),
-      });
+			await downloadExport(url, "jefes_departamentos.xlsx");
 		} catch (error) {
 			Swal.fire({
 				icon: "error",
@@ -24,7 +24,7 @@ import API from "@/api/axiosConfig";
 import Pagination from "../../../../components/Pagination";
 import LoadingOverlay from "../../../../components/LoadingOverlay";
 import { normalizeUrl } from "../../../../hooks/useSearch";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 
 interface Departamento {
 	id: number;
@@ -46,6 +46,7 @@ const ListaDepartamentos = () => {
 	const [prevUrl, setPrevUrl] = useState<string | null>(null);
 	const [currentUrl, setCurrentUrl] = useState<string>(`/facet/departamento/`);
 	const [totalItems, setTotalItems] = useState<number>(0);
+	const [isCountExact, setIsCountExact] = useState<boolean>(true);
 	const [currentPage, setCurrentPage] = useState<number>(1);
 	const [pageSize] = useState<number>(10);
 	const [isLoading, setIsLoading] = useState<boolean>(true);
@@ -74,6 +75,7 @@ const ListaDepartamentos = () => {
 				setNextUrl(normalizedNext);
 				setPrevUrl(normalizedPrev);
 				setTotalItems(response.data.count);
+				setIsCountExact(response.data.count_exacto ?? true);
 			} catch (error) {
 				Swal.fire({
 					icon: "error",
@@ -144,8 +146,6 @@ const ListaDepartamentos = () => {
 
 	const descargarExcel = async () => {
 		try {
-			let allDepartamentos: Departamento[] = [];
-
 			let url = `/facet/departamento/?`;
 			const params = new URLSearchParams();
 			if (filtroNombre !== "") {
@@ -159,31 +159,7 @@ const ListaDepartamentos = () => {
 			}
 			url += params.toString();
 
-			while (url) {
-				const response = await API.get(url);
-				const { results, next } = response.data;
-
-				allDepartamentos = [
-					...allDepartamentos,
-					...results.map((departamento: any) => ({
-						nombre: departamento.nombre,
-						telefono: departamento.telefono,
-						estado: departamento.estado,
-						interno: departamento.interno,
-						mail_departamento: departamento.mail_departamento || "",
-						mail_jefe_departamento: departamento.mail_jefe_departamento || "",
-					})),
-				];
-
-				// Normalizar la URL de paginación para la siguiente iteración
-				url = next ? normalizeUrl(next) : "";
-			}
-
-			await exportToExcel({
-				fileName: "departamentos.xlsx",
-				sheetName: "Departamentos",
-				rows: allDepartamentos,
-			});
+			await downloadExport(url, "departamentos.xlsx");
 		} catch (error) {
 			console.error("Error downloading Excel:", error);
 		}
@@ -340,6 +316,7 @@ const ListaDepartamentos = () => {
 						onNext={() => handlePageChange(currentPage + 1)}
 						hasPrevious={currentPage > 1}
 						hasNext={currentPage < totalPages}
+						isCountExact={isCountExact}
 					/>
 				</div>
 			</div>
@@ -13,7 +13,7 @@ import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import VisibilityIcon from "@mui/icons-material/Visibility";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../../..";
@@ -56,6 +56,7 @@ const ListaDocentes = () => {
     `/facet/docente/?estado=1`
   );
   const [totalItems, setTotalItems] = useState<number>(0);
+  const [isCountExact, setIsCountExact] = useState<boolean>(true);
   const [pageSize, setPageSize] = useState<number>(10);
   const [currentPage, setCurrentPage] = useState<number>(1);
   const [isLoading, setIsLoading] = useState<boolean>(true);
@@ -78,6 +79,7 @@ const ListaDocentes = () => {
         response.data.previous ? normalizeUrl(response.data.previous) : null
       );
       setTotalItems(response.data.count);
+      setIsCountExact(response.data.count_exacto ?? true);
       // Pequeño delay para asegurar que los estilos se cargan
       setTimeout(() => setIsLoading(false), 500);
     } catch (error) {
@@ -125,7 +127,6 @@ const ListaDocentes = () => {
 
   const descargarExcel = async () => {
     try {
-      let allDocentes: Docente[] = [];
       let url = `/facet/docente/?`;
       const params = new URLSearchParams();
 
@@ -143,26 +144,7 @@ const ListaDocentes = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allDocentes = [...allDocentes, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "docentes.xlsx",
-        sheetName: "Docentes",
-        rows: allDocentes.map((docente) => ({
-          Nombre: docente.persona_detalle?.nombre || "N/A",
-          Apellido: docente.persona_detalle?.apellido || "N/A",
-          DNI: docente.persona_detalle?.dni || "N/A",
-          Legajo: docente.persona_detalle?.legajo || "N/A",
-          Teléfono: docente.persona_detalle?.telefono || "N/A",
-          Email: docente.persona_detalle?.email || "N/A",
-          Estado: docente.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "docentes.xlsx");
     } catch (error) {
       Swal.fire({
         icon: "error",
@@ -388,6 +370,7 @@ const ListaDocentes = () => {
             }}
             hasPrevious={!!prevUrl}
             hasNext={!!nextUrl}
+            isCountExact={isCountExact}
           />
         </div>
       </div>
@@ -13,7 +13,7 @@ import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import VisibilityIcon from "@mui/icons-material/Visibility";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../../..";
@@ -59,6 +59,7 @@ const ListaJefes = () => {
     `/facet/jefe/list_jefes_persona/?estado=1`
   );
   const [totalItems, setTotalItems] = useState<number>(0);
+  const [isCountExact, setIsCountExact] = useState<boolean>(true);
   const [pageSize, setPageSize] = useState<number>(10);
   const [currentPage, setCurrentPage] = useState<number>(1);
   const [isLoading, setIsLoading] = useState<boolean>(true);
@@ -81,6 +82,7 @@ const ListaJefes = () => {
         response.data.previous ? normalizeUrl(response.data.previous) : null
       );
       setTotalItems(response.data.count);
+      setIsCountExact(response.data.count_exacto ?? true);
       // Pequeño delay para asegurar que los estilos se cargan
       setTimeout(() => setIsLoading(false), 500);
     } catch (error) {
@@ -128,8 +130,7 @@ const ListaJefes = () => {
 
   const descargarExcel = async () => {
     try {
-      let allJefes: Jefe[] = [];
-      let url = `/facet/jefe/list_jefes_persona/?`;
+      let url = `/facet/jefe/?`;
       const params = new URLSearchParams();
 
       if (filtroNombre !== "")
@@ -146,28 +147,7 @@ const ListaJefes = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allJefes = [...allJefes, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "jefes.xlsx",
-        sheetName: "Jefes",
-        rows: allJefes.map((jefe) => ({
-          Nombre: jefe.persona.nombre,
-          Apellido: jefe.persona.apellido,
-          DNI: jefe.persona.dni,
-          Legajo: jefe.persona.legajo,
-          Teléfono: jefe.persona.telefono,
-          Email: jefe.persona.email,
-          Interno: jefe.persona.interno,
-          Observaciones: jefe.observaciones,
-          Estado: jefe.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "jefes.xlsx");
     } catch (error) {
       Swal.fire({
         icon: "error",
@@ -359,6 +339,7 @@ const ListaJefes = () => {
             }}
             hasPrevious={!!prevUrl}
             hasNext={!!nextUrl}
+            isCountExact={isCountExact}
           />
         </div>
       </div>
@@ -27,7 +27,7 @@ import DeleteIcon from "@mui/icons-material/Delete";
 import PeopleIcon from "@mui/icons-material/People";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import VisibilityIcon from "@mui/icons-material/Visibility";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../..";
@@ -161,7 +161,6 @@ const ListaPersonas = () => {
   const descargarExcel = async () => {
     try {
       setIsDownloading(true);
-      let allPersonas: Persona[] = [];
       let url = `/facet/persona/?`;
       const params = new URLSearchParams();
 
@@ -177,29 +176,7 @@ const ListaPersonas = () => {
       }
       url += params.toString();
 
-      while (url) {
-        const response = await API.get(url);
-        const { results, next } = response.data;
-        allPersonas = [...allPersonas, ...results];
-        url = next;
-      }
-
-      await exportToExcel({
-        fileName: "personas.xlsx",
-        sheetName: "Personas",
-        rows: allPersonas.map((persona) => ({
-          Nombre: persona.nombre,
-          Apellido: persona.apellido,
-          DNI: persona.dni,
-          Legajo: persona.legajo,
-          Teléfono: persona.telefono,
-          Email: persona.email,
-          Interno: persona.interno,
-          Título: obtenerNombreTitulo(persona.titulo),
-          "Fecha de Nacimiento": formatearFecha(persona.fecha_nacimiento),
-          Estado: persona.estado === "1" ? "Activo" : "Inactivo",
-        })),
-      });
+      await downloadExport(url, "personas.xlsx");
       
       // Simular un pequeño delay para mostrar el modal antes de cerrar
       setTimeout(() => {
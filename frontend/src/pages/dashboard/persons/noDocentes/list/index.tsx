@@ -26,7 +26,7 @@ import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import VisibilityIcon from "@mui/icons-material/Visibility";
-import { exportToExcel } from "@/utils/exportToExcel";
+import { downloadExport } from "@/utils/exportToExcel";
 import Swal from "sweetalert2";
 import { useRouter } from "next/router";
 import DashboardMenu from "../../..";
@@ -139,7 +139,6 @@ const ListaNoDocentes = () => {
 
 	const descargarExcel = async () => {
 		try {
-			let allNoDocentes: NoDocente[] = [];
 			let url = `/facet/nodocente/?`;
 			const params = new URLSearchParams();
 
@@ -157,26 +156,7 @@ const ListaNoDocentes = () => {
 			}
 			url += params.toString();
 
-			while (url) {
-				const response = await API.get(url);
-				const { results, next } = response.data;
-				allNoDocentes = [...allNoDocentes, ...results];
-				url = next;
-			}
-
-			await exportToExcel({
-        fileName: "no_docentes.xlsx",
-        sheetName: "NoDocentes",
-        rows: allNoDocentes.map((noDocente) => ({
-					Nombre: noDocente.persona_detalle?.nombre || "N/A",
-					Apellido: noDocente.persona_detalle?.apellido || "N/A",
-					DNI: noDocente.persona_detalle?.dni || "N/A",
-					Legajo: noDocente.persona_detalle?.legajo || "N/A",
-					Teléfono: noDocente.persona_detalle?.telefono || "N/A",
-					Email: noDocente.persona_detalle?.email || "N/A",
-					Estado: noDocente.estado === "1" ? "Activo" : "Inactivo",
-				})),
-      });
+			await downloadExport(url, "no_docentes.xlsx");
 		} catch (error) {
 			Swal.fire({
 				icon: "error",
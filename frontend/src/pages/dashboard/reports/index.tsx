@@ -1,17 +1,316 @@
-import React from 'react';
+import { useEffect, useState } from "react";
+import API from "@/api/axiosConfig";
+import {
+  Paper,
+  Table,
+  TableBody,
+  TableCell,
+  TableHead,
+  TableRow,
+  Typography,
+  Select,
+  MenuItem,
+  FormControl,
+} from "@mui/material";
+import RefreshIcon from "@mui/icons-material/Refresh";
+import Swal from "sweetalert2";
+import DashboardMenu from "..";
+import withAuth from "../../../components/withAut";
+import ResponsiveTable from "../../../components/ResponsiveTable";
+
+interface Reporte<T> {
+  reporte: string;
+  actualizado: string | null;
+  antiguedad: number | null;
+  results: T[];
+}
+
+interface FilaPlanta {
+  departamento: number | null;
+  departamento_nombre: string | null;
+  cargo: string | null;
+  dedicacion: string | null;
+  condicion: string | null;
+  asignaciones: number;
+  docentes: number;
+  asignaturas: number;
+}
+
+interface ResumenVacantes {
+  departamento: number;
+  departamento_nombre: string;
+  asignaturas: number;
+  sin_docente: number;
+  sin_profesor: number;
+}
+
+interface TotalVencimientos {
+  mes: string;
+  tipo: string;
+  cantidad: number;
+  notificadas: number;
+}
+
+interface FilaJefatura {
+  departamento: number;
+  departamento_nombre: string;
+  apellido: string | null;
+  nombre: string | null;
+  nresolucion: string | null;
+  fecha_de_fin: string | null;
+}
+
+const AGRUPACIONES = [
+  { valor: "total", texto: "Total" },
+  { valor: "cargo", texto: "Cargo" },
+  { valor: "dedicacion", texto: "Dedicación" },
+  { valor: "condicion", texto: "Condición" },
+  { valor: "detalle", texto: "Cargo, dedicación y condición" },
+];
+
+const TIPOS_VENCIMIENTO: Record<string, string> = {
+  asignatura_docente: "Cargos docentes",
+  jefe_departamento: "Jefaturas",
+};
+
+const formatearFecha = (fecha: string | null) =>
+  fecha ? new Date(fecha).toLocaleDateString("es-AR") : "-";
+
+const formatearMes = (mes: string) => {
+  const [anio, numero] = mes.split("-");
+  return `${numero}/${anio}`;
+};
+
+const Actualizado = ({ fecha }: { fecha: string | null }) => (
+  <Typography variant="caption" className="text-gray-500">
+    {fecha
+      ? `Actualizado: ${new Date(fecha).toLocaleString("es-AR")}`
+      : "Sin datos: actualice los reportes"}
+  </Typography>
+);
 
 const Reportes = () => {
-  const h1Style = {
-    color: 'black',
+  const [agrupacion, setAgrupacion] = useState("total");
+  const [planta, setPlanta] = useState<Reporte<FilaPlanta> | null>(null);
+  const [vacantes, setVacantes] = useState<ResumenVacantes[]>([]);
+  const [vencimientos, setVencimientos] = useState<TotalVencimientos[]>([]);
+  const [jefaturas, setJefaturas] = useState<Reporte<FilaJefatura> | null>(
+    null
+  );
+  const [fechas, setFechas] = useState<Record<string, string | null>>({});
+
+  const cargarPlanta = async (valor: string) => {
+    const response = await API.get(
+      `/facet/reportes/planta-docente/?agrupacion=${valor}`
+    );
+    setPlanta(response.data);
+  };
+
+  const cargarReportes = async () => {
+    try {
+      const [vacantesResponse, vencimientosResponse, jefaturasResponse] =
+        await Promise.all([
+          API.get(`/facet/reportes/vacantes/`),
+          API.get(`/facet/reportes/vencimientos/`),
+          API.get(`/facet/reportes/jefaturas/`),
+          cargarPlanta(agrupacion),
+        ]);
+      setVacantes(vacantesResponse.data.resumen);
+      setVencimientos(vencimientosResponse.data.totales);
+      setJefaturas(jefaturasResponse.data);
+      setFechas({
+        vacantes: vacantesResponse.data.actualizado,
+        vencimientos: vencimientosResponse.data.actualizado,
+      });
+    } catch (error) {
+      Swal.fire("Error!", "No se pudieron cargar los reportes.", "error");
+    }
+  };
+
+  useEffect(() => {
+    cargarReportes();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
+  const cambiarAgrupacion = async (valor: string) => {
+    setAgrupacion(valor);
+    try {
+      await cargarPlanta(valor);
+    } catch (error) {
+      Swal.fire("Error!", "No se pudo cargar la planta docente.", "error");
+    }
+  };
+
+  const actualizarReportes = async () => {
+    try {
+      await API.post(`/facet/reportes/actualizar/`, {});
+      Swal.fire(
+        "Actualización en curso",
+        "Los reportes se están recalculando; recargue en unos instantes.",
+        "info"
+      );
+    } catch (error) {
+      Swal.fire("Error!", "No se pudo actualizar los reportes.", "error");
+    }
   };
 
   return (
-    <div>
-      <header>
-        <h1 style={h1Style}>Bienvenido a la Gestigón de Reportes</h1>
-      </header>
-    </div>
+    <DashboardMenu>
+      <div className="p-6 space-y-6">
+        <div className="flex justify-between items-center">
+          <Typography variant="h4" className="text-gray-800">
+            Reportes
+          </Typography>
+          <button
+            onClick={actualizarReportes}
+            className="flex items-center gap-2 bg-blue-500 hover:bg-blue-600 text-white px-4 py-2 rounded-md shadow-md transition-colors duration-200">
+            <RefreshIcon /> Actualizar reportes
+          </button>
+        </div>
+
+        <Paper elevation={3} style={{ padding: "20px" }}>
+          <div className="flex justify-between items-center mb-4">
+            <div>
+              <Typography variant="h6">Planta docente</Typography>
+              <Actualizado fecha={planta?.actualizado ?? null} />
+            </div>
+            <FormControl size="small" style={{ minWidth: 240 }}>
+              <Select
+                value={agrupacion}
+                onChange={(e) => cambiarAgrupacion(e.target.value)}>
+                {AGRUPACIONES.map((opcion) => (
+                  <MenuItem key={opcion.valor} value={opcion.valor}>
+                    {opcion.texto}
+                  </MenuItem>
+                ))}
+              </Select>
+            </FormControl>
+          </div>
+          <ResponsiveTable>
+            <Table size="small">
+              <TableHead>
+                <TableRow>
+                  <TableCell>Departamento</TableCell>
+                  <TableCell>Cargo</TableCell>
+                  <TableCell>Dedicación</TableCell>
+                  <TableCell>Condición</TableCell>
+                  <TableCell align="right">Asignaciones</TableCell>
+                  <TableCell align="right">Docentes</TableCell>
+                  <TableCell align="right">Asignaturas</TableCell>
+                </TableRow>
+              </TableHead>
+              <TableBody>
+                {planta?.results.map((fila, indice) => (
+                  <TableRow key={indice}>
+                    <TableCell>
+                      {fila.departamento_nombre ?? <strong>Facultad</strong>}
+                    </TableCell>
+                    <TableCell>{fila.cargo ?? "-"}</TableCell>
+                    <TableCell>{fila.dedicacion ?? "-"}</TableCell>
+                    <TableCell>{fila.condicion ?? "-"}</TableCell>
+                    <TableCell align="right">{fila.asignaciones}</TableCell>
+                    <TableCell align="right">{fila.docentes}</TableCell>
+                    <TableCell align="right">{fila.asignaturas}</TableCell>
+                  </TableRow>
+                ))}
+              </TableBody>
+            </Table>
+          </ResponsiveTable>
+        </Paper>
+
+        <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+          <Paper elevation={3} style={{ padding: "20px" }}>
+            <Typography variant="h6">Vacantes</Typography>
+            <Actualizado fecha={fechas.vacantes ?? null} />
+            <ResponsiveTable>
+              <Table size="small">
+                <TableHead>
+                  <TableRow>
+                    <TableCell>Departamento</TableCell>
+                    <TableCell align="right">Asignaturas</TableCell>
+                    <TableCell align="right">Sin docente</TableCell>
+                    <TableCell align="right">Sin profesor</TableCell>
+                  </TableRow>
+                </TableHead>
+                <TableBody>
+                  {vacantes.map((fila) => (
+                    <TableRow key={fila.departamento}>
+                      <TableCell>{fila.departamento_nombre}</TableCell>
+                      <TableCell align="right">{fila.asignaturas}</TableCell>
+                      <TableCell align="right">{fila.sin_docente}</TableCell>
+                      <TableCell align="right">{fila.sin_profesor}</TableCell>
+                    </TableRow>
+                  ))}
+                </TableBody>
+              </Table>
+            </ResponsiveTable>
+          </Paper>
+
+          <Paper elevation={3} style={{ padding: "20px" }}>
+            <Typography variant="h6">Vencimientos por mes</Typography>
+            <Actualizado fecha={fechas.vencimientos ?? null} />
+            <ResponsiveTable>
+              <Table size="small">
+                <TableHead>
+                  <TableRow>
+                    <TableCell>Mes</TableCell>
+                    <TableCell>Tipo</TableCell>
+                    <TableCell align="right">Vencen</TableCell>
+                    <TableCell align="right">Notificadas</TableCell>
+                  </TableRow>
+                </TableHead>
+                <TableBody>
+                  {vencimientos.map((fila) => (
+                    <TableRow key={`${fila.mes}-${fila.tipo}`}>
+                      <TableCell>{formatearMes(fila.mes)}</TableCell>
+                      <TableCell>
+                        {TIPOS_VENCIMIENTO[fila.tipo] ?? fila.tipo}
+                      </TableCell>
+                      <TableCell align="right">{fila.cantidad}</TableCell>
+                      <TableCell align="right">{fila.notificadas}</TableCell>
+                    </TableRow>
+                  ))}
+                </TableBody>
+              </Table>
+            </ResponsiveTable>
+          </Paper>
+        </div>
+
+        <Paper elevation={3} style={{ padding: "20px" }}>
+          <Typography variant="h6">Jefaturas por departamento</Typography>
+          <Actualizado fecha={jefaturas?.actualizado ?? null} />
+          <ResponsiveTable>
+            <Table size="small">
+              <TableHead>
+                <TableRow>
+                  <TableCell>Departamento</TableCell>
+                  <TableCell>Jefe</TableCell>
+                  <TableCell>Resolución</TableCell>
+                  <TableCell>Vence</TableCell>
+                </TableRow>
+              </TableHead>
+              <TableBody>
+                {jefaturas?.results.map((fila) => (
+                  <TableRow key={fila.departamento}>
+                    <TableCell>{fila.departamento_nombre}</TableCell>
+                    <TableCell>
+                      {fila.apellido ? (
+                        `${fila.apellido}, ${fila.nombre}`
+                      ) : (
+                        <span className="text-red-600">Sin jefe vigente</span>
+                      )}
+                    </TableCell>
+                    <TableCell>{fila.nresolucion ?? "-"}</TableCell>
+                    <TableCell>{formatearFecha(fila.fecha_de_fin)}</TableCell>
+                  </TableRow>
+                ))}
+              </TableBody>
+            </Table>
+          </ResponsiveTable>
+        </Paper>
+      </div>
+    </DashboardMenu>
   );
 };
 
-export default Reportes;
\ No newline at end of file
+export default withAuth(Reportes);
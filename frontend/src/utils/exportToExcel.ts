@@ -1,5 +1,6 @@
 import ExcelJS from "exceljs";
 import { saveAs } from "file-saver";
+import API from "@/api/axiosConfig";
 
 type ExcelRow = Record<string, string | number | boolean | null | undefined>;
 
@@ -38,3 +39,18 @@ export async function exportToExcel({
 
   saveAs(excelBlob, fileName);
 }
+
+/**
+ * Descarga el Excel que arma el backend con la acción `export/` del recurso.
+ * `url` es la ruta del listado con sus filtros (ej. `/facet/persona/?estado=1`).
+ */
+export async function downloadExport(url: string, fileName: string) {
+  const [path, query = ""] = url.split("?");
+  const params = new URLSearchParams(query);
+  params.set("formato", "xlsx");
+  const response = await API.get(`${path.replace(/\/?$/, "/")}export/`, {
+    params,
+    responseType: "blob",
+  });
+  saveAs(new Blob([response.data], { type: EXCEL_MIME_TYPE }), fileName);
+}